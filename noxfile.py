@@ -59,6 +59,13 @@ def tests(session: nox.Session) -> None:
     )
 
 
+@nox.session(reuse_venv=True)
+@install("hikari")
+def bench(session: nox.Session) -> None:
+    session.install(".")
+    session.run("python", "-m", "yami.bench.dispatch", "--output", "bench-dispatch.json")
+
+
 @nox.session(reuse_venv=True)
 @install("coverage")
 def coverage(session: nox.Session) -> None:
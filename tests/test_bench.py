@@ -0,0 +1,79 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import json
+import sys
+
+from yami import bench
+from yami.bench import dispatch, replay, startup
+
+
+def test_percentile() -> None:
+    values = [float(i) for i in range(1, 101)]
+
+    assert bench.percentile(values, 0.5) == 50.0
+    assert bench.percentile(values, 0.99) == 99.0
+    assert bench.percentile(values, 1.0) == 100.0
+    assert bench.percentile([], 0.5) == 0.0
+
+
+async def test_dispatch_scenarios_run_without_failures(tmp_path) -> None:
+    results = await dispatch.run(sizes=(10,), messages=20)
+    path = tmp_path / "dispatch.json"
+    bench.save_results(results, path)
+
+    data = json.loads(path.read_text())
+    assert [r["params"]["scenario"] for r in data["results"]] == list(dispatch.SCENARIOS)
+    assert all(r["count"] == 20 and r["failures"] == 0 for r in data["results"])
+    assert all(r["params"]["commands"] == 10 for r in data["results"])
+
+
+def test_zipf_workload_is_skewed_and_reproducible() -> None:
+    workload = replay.zipf_workload(2000, guilds=10, users=100, seed=7)
+
+    assert workload == replay.zipf_workload(2000, guilds=10, users=100, seed=7)
+    counts = [sum(m["content"] == c for m in workload) for c in replay.DEFAULT_CONTENT]
+    assert counts[0] > counts[1] > counts[-1]
+    assert all(m["guild_id"] is None or 10_000 <= m["guild_id"] < 10_010 for m in workload)
+
+
+async def test_replay_counts_rest_calls(tmp_path) -> None:
+    log = tmp_path / "log.jsonl"
+    log.write_text(
+        '{"content": "!ping", "guild_id": 1, "t": 0.0}\n'
+        '{"content": "just chatting", "t": 0.001}\n'
+        "\n"
+        '{"content": "!echo hi there", "guild_id": null, "t": 0.002}\n'
+    )
+    bot = replay.build_bot(latency=0.001)
+
+    result = await replay.replay(bot, replay.load_jsonl(log), rate=None)
+
+    assert result.count == 3
+    assert result.extra["rest_calls"] == 2
+    assert result.extra["rest_calls_by_route"] == {"create_message": 2}
+    assert result.quantile(1.0) >= 0.001
+
+
+def test_startup_breakdown() -> None:
+    result = startup.run(files=3, commands=2, subcommands=1, repeat=1)
+
+    assert result["params"] == {"files": 3, "commands": 2, "subcommands": 1}
+    assert set(result["phases"]) == set(startup.PHASES)
+    assert all(result[k] > 0 for k in ("import_yami", "bot_init", "load_all_modules"))
+    assert not any(m.startswith("yami_startup_bench") for m in sys.modules)
@@ -16,6 +16,8 @@
 
 from __future__ import annotations
 
+import array
+import asyncio
 import typing
 
 import hikari
@@ -23,6 +25,13 @@ import mock
 import pytest
 
 import yami
+from yami import testing
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError:
+    np = None
 
 
 @pytest.fixture()
@@ -210,3 +219,208 @@ async def test_bot__invoke_with_invalid_cmd(
         await model._invoke("&&", content_w_cmd_e, content_w_cmd_e.message.content)  # type: ignore
 
     assert "No command found with name 'echo'" in str(e.value)
+
+
+def test_bot__get_args_with_defaults(model: yami.Bot) -> None:
+    @model.command()
+    async def defaults(ctx: yami.MessageContext, a: str, b: str = "b", c: str = "c") -> None:
+        ...
+
+    assert [a.value for a in model._get_args(defaults, ["1"])] == ["1"]
+    assert [a.value for a in model._get_args(defaults, ["1", "2", "3"])] == ["1", "2", "3"]
+
+    with pytest.raises(yami.MissingArgs):
+        model._get_args(defaults, [])
+
+    with pytest.raises(yami.TooManyArgs):
+        model._get_args(defaults, ["1", "2", "3", "4"])
+
+
+def test_bot__get_args_variadic(model: yami.Bot) -> None:
+    @model.command()
+    async def variadic(ctx: yami.MessageContext, a: str, *rest: str) -> None:
+        ...
+
+    args = model._get_args(variadic, ["1", "2", "3"])
+    assert [a.value for a in args] == ["1", "2", "3"]
+    assert args[-1].kind is args[-1].kind.VAR_POSITIONAL
+
+
+async def test_bot__invoke_greedy_kwarg(
+    model: yami.Bot, with_content_with_cmd_m_create_event: hikari.MessageCreateEvent
+) -> None:
+    received: list[typing.Any] = []
+
+    @model.command()
+    async def echo(ctx: yami.MessageContext, times: str = "1", *, text: str) -> None:
+        received.extend((times, text))
+
+    event = with_content_with_cmd_m_create_event
+    await model._invoke("&&", event, "&&echo 2 hello there   friend")
+    await model._invoke("&&", event, "&& echo 3  ```py\n    x  = 1\n```  ")
+    assert received == ["2", "hello there   friend", "3", "```py\n    x  = 1\n```"]
+
+    with pytest.raises(yami.MissingArgs):
+        model._get_args(echo, ["2"])
+
+    with pytest.raises(TypeError):
+
+        @model.command()
+        async def bad(ctx: yami.MessageContext, *, text: str, other: str) -> None:
+            ...
+
+
+async def test_bot__invoke_converts_string_annotations(
+    model: yami.Bot, with_content_with_cmd_m_create_event: hikari.MessageCreateEvent
+) -> None:
+    received: list[typing.Any] = []
+
+    # This module uses `from __future__ import annotations`.
+    @model.command()
+    async def add(ctx: yami.MessageContext, a: int, b: float) -> None:
+        received.extend((a, b))
+
+    assert add._get_plan().positional[0].annotation is int
+
+    await model._invoke("&&", with_content_with_cmd_m_create_event, "&&add 1 2.5")
+    assert received == [1, 2.5]
+    assert type(received[0]) is int
+
+
+async def test_bot__invoke_bulk_converts_variadic(
+    model: yami.Bot, with_content_with_cmd_m_create_event: hikari.MessageCreateEvent
+) -> None:
+    received: list[typing.Any] = []
+    values: list[typing.Any] = []
+
+    @model.command()
+    async def hist(ctx: yami.MessageContext, *nums: float) -> None:
+        received.extend(nums)
+        values.append(ctx.args[-1].value)
+
+    await model._invoke("&&", with_content_with_cmd_m_create_event, "&&hist 1 2.5 3")
+    assert received == [1.0, 2.5, 3.0]
+    assert len(values[0]) == 3
+    assert isinstance(values[0], array.array)
+
+
+async def test_bot__invoke_passes_bulk_sequences(
+    model: yami.Bot, with_content_with_cmd_m_create_event: hikari.MessageCreateEvent
+) -> None:
+    received: list[typing.Any] = []
+
+    @model.command()
+    async def scale(ctx: yami.MessageContext, by: int, nums: typing.Sequence[float] = ()) -> None:
+        received.append((by, nums))
+
+    await model._invoke("&&", with_content_with_cmd_m_create_event, "&&scale 2 1 2.5 3")
+    await model._invoke("&&", with_content_with_cmd_m_create_event, "&&scale 3")
+
+    assert received[0] == (2, array.array("d", [1.0, 2.5, 3.0]))
+    assert received[1] == (3, ())
+
+
+@pytest.mark.skipif(np is None, reason="numpy is not installed")
+async def test_bot__invoke_passes_numpy_arrays(
+    model: yami.Bot, with_content_with_cmd_m_create_event: hikari.MessageCreateEvent
+) -> None:
+    received: list[typing.Any] = []
+
+    @model.command()
+    async def ints(ctx: yami.MessageContext, nums: npt.NDArray[np.int64]) -> None:
+        received.append(nums)
+
+    @model.command()
+    async def floats(ctx: yami.MessageContext, nums: np.ndarray) -> None:
+        received.append(nums)
+
+    await model._invoke("&&", with_content_with_cmd_m_create_event, "&&ints 1 2 3")
+    await model._invoke("&&", with_content_with_cmd_m_create_event, "&&floats 1 2.5")
+
+    assert received[0].dtype == np.int64 and received[0].tolist() == [1, 2, 3]
+    assert received[1].dtype == np.float64 and received[1].tolist() == [1.0, 2.5]
+    assert isinstance(memoryview(received[0].base).obj, array.array)
+
+
+async def test_bot__invoke_parse_limits() -> None:
+    limits = yami.ParseLimits(max_content_length=50, max_tokens=4, max_depth=1)
+    model = yami.Bot(token="12345", prefix="&&", banner=None, limits=limits)
+    received: list[typing.Any] = []
+
+    @model.command(limits=yami.ParseLimits(max_tokens=3))
+    async def cmd(ctx: yami.MessageContext, *args: str) -> None:
+        received.append(args)
+
+    @cmd.subcommand(invoke_with=True)
+    async def sub(ctx: yami.MessageContext) -> None:
+        ...
+
+    @sub.subcommand()
+    async def subsub(ctx: yami.MessageContext) -> None:
+        ...
+
+    event = mock.Mock()
+    await model._invoke("&&", event, "&&cmd " + "a" * 50)
+    await model._invoke("&&", event, "&&cmd a b c d e f")
+    await model._invoke("&&", event, "&&cmd a b c")
+    await model._invoke("&&", event, "&&cmd sub subsub")
+    await model._invoke("&&", event, "&&cmd a b")
+
+    assert received == [("a", "b")]
+    assert model.rejected == {"max_content_length": 1, "max_tokens": 2, "max_depth": 1}
+
+
+async def test_bot__invoke_command_limits_only_tighten() -> None:
+    limits = yami.ParseLimits(max_depth=0)
+    model = yami.Bot(token="12345", prefix="&&", banner=None, limits=limits)
+    received: list[typing.Any] = []
+
+    @model.command(limits=yami.ParseLimits(max_content_length=20, max_tokens=3, max_depth=1))
+    async def cmd(ctx: yami.MessageContext, *args: str) -> None:
+        received.append(args)
+
+    @cmd.subcommand()
+    async def sub(ctx: yami.MessageContext) -> None:
+        received.append("sub")
+
+    event = mock.Mock()
+    await model._invoke("&&", event, "&&cmd sub")
+    await model._invoke("&&", event, "&& cmd a b")
+    await model._invoke("&&", event, "&& cmd a")
+    await model._invoke("&&", event, "&&cmd " + "a " * 10)
+
+    assert received == [("a",)]
+    assert model.rejected == {"max_depth": 1, "max_tokens": 1, "max_content_length": 1}
+
+
+async def test_bot_drain_cancels_hung_invocations() -> None:
+    model = yami.Bot(token="12345", prefix="&&", banner=None, drain_timeout=0.05)
+    messages = testing.MessageFactory(model)
+    finished: list[str] = []
+
+    @model.command()
+    async def quick(ctx: yami.MessageContext) -> None:
+        await asyncio.sleep(0.01)
+        finished.append("quick")
+
+    @model.command()
+    async def hang(ctx: yami.MessageContext) -> None:
+        await asyncio.Event().wait()
+        finished.append("hang")
+
+    tasks = [
+        asyncio.create_task(model._listen(messages.event(f"&&{name}")))
+        for name in ("quick", "hang")
+    ]
+    await asyncio.sleep(0)
+    assert model.in_flight == 2
+
+    assert await model.drain() == 1
+    assert model.is_stopping and not model.is_ready
+    # The cancelled invocation has finished by the time drain returns.
+    assert all(task.done() for task in tasks)
+    assert tasks[1].cancelled()
+
+    await model._listen(messages.event("&&quick"))
+    assert finished == ["quick"]
+    assert model.in_flight == 0
@@ -0,0 +1,59 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import json
+import sys
+
+import pytest
+
+from yami import _cli
+from yami.bench import startup
+
+
+@pytest.fixture()
+def tree(tmp_path, monkeypatch: pytest.MonkeyPatch) -> str:
+    startup.generate_tree(tmp_path, 2, 2, 1)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "yami_startup_bench"
+
+    for name in [m for m in sys.modules if m.startswith("yami_startup_bench")]:
+        del sys.modules[name]
+
+
+def test_inspect(tree: str, capsys: pytest.CaptureFixture[str]) -> None:
+    stats = _cli.inspect([tree, "--json"])
+
+    assert stats["modules"] == 2
+    assert stats["commands"] == 4
+    assert stats["total_commands"] == stats["commands"] + stats["subcommands"] == 8
+    assert stats["aliases"] == 4
+    assert stats["depths"] == {"1": 4, "2": 4}
+    assert json.loads(capsys.readouterr().out) == stats
+
+
+def test_profile(tree: str, capsys: pytest.CaptureFixture[str]) -> None:
+    _cli.main(["profile", tree, "--invocations", "3", "--command", "m0c0"])
+
+    assert "_invoke" in capsys.readouterr().out
+
+
+def test_no_command_prints_info(capsys: pytest.CaptureFixture[str]) -> None:
+    _cli.main([])
+
+    assert capsys.readouterr().out.startswith("Yami v")
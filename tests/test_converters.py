@@ -0,0 +1,44 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import array
+
+import pytest
+
+import yami
+
+
+def test_builtin_converter() -> None:
+    assert yami.BuiltinConverter("12").as_type(int) == 12
+    assert yami.BuiltinConverter("true").as_type(bool) is True
+    assert yami.BuiltinConverter("abc").as_type(bytes) == b"abc"
+
+    with pytest.raises(yami.ConversionFailed):
+        yami.BuiltinConverter("abc").as_type(float)
+
+
+def test_convert_bulk() -> None:
+    assert yami.convert_bulk(["1", "2"], int) == array.array("q", [1, 2])
+    assert yami.convert_bulk(["1.5"], float) == array.array("d", [1.5])
+    assert yami.convert_bulk([str(2**70)], int) == [2**70]
+
+    with pytest.raises(yami.ConversionFailed):
+        yami.convert_bulk(["1", "x"], int)
+
+    with pytest.raises(yami.ConversionFailed):
+        yami.convert_bulk(["1"], bool)
@@ -0,0 +1,100 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import yami
+
+
+@pytest.fixture()
+def metrics() -> yami.Metrics:
+    m = yami.Metrics()
+    m.record('say "hi"', "Fun", "success", (0.0001, 0.0002, None, 0.003))
+    m.reject("max_tokens")
+    return m
+
+
+async def test_render_prometheus(metrics: yami.Metrics) -> None:
+    metrics.gauges["queue_depth"] = lambda: 3
+    text = await yami.PrometheusRenderer(metrics).render()
+
+    assert text.endswith("\n")
+    assert 'yami_command_invocations_total{command="say \\"hi\\"",outcome="success"} 1' in text
+    assert 'yami_module_invocations_total{module="Fun",outcome="failure"} 0' in text
+    assert 'yami_rejected_messages_total{limit="max_tokens"} 1' in text
+    assert (
+        'yami_command_stage_seconds_bucket{command="say \\"hi\\"",stage="callback",le="+Inf"} 1'
+        in text
+    )
+
+    # Each family is declared once, before all of its samples.
+    families = [line.split()[2] for line in text.splitlines() if line.startswith("# TYPE")]
+    assert len(families) == len(set(families))
+    helps = [line.split()[2] for line in text.splitlines() if line.startswith("# HELP")]
+    assert helps == families
+    assert "yami_queue_depth 3.0" in text
+
+
+async def test_render_caches_unchanged_series(metrics: yami.Metrics) -> None:
+    renderer = yami.PrometheusRenderer(metrics)
+    await renderer.render()
+    cached = renderer._cache[("yami_command_invocations_total", 'say "hi"')]
+
+    await renderer.render()
+    assert renderer._cache[("yami_command_invocations_total", 'say "hi"')] is cached
+
+    metrics.record('say "hi"', "Fun", "failure", (0.0001, None, None, None))
+    text = await renderer.render()
+    assert 'yami_command_invocations_total{command="say \\"hi\\"",outcome="failure"} 1' in text
+
+    metrics.forget('say "hi"')
+    text = await renderer.render()
+    assert 'command="say \\"hi\\""' not in text
+    assert ("yami_command_invocations_total", 'say "hi"') not in renderer._cache
+
+
+async def _get(port: int, path: str) -> str:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return response.decode()
+
+
+async def test_metrics_server_endpoints() -> None:
+    bot = yami.Bot(token="12345", prefix="&&", banner=None)
+    server = yami.MetricsServer(bot, port=0)
+    await server.start()
+    port = server.sockets[0].getsockname()[1]
+
+    try:
+        assert (await _get(port, "/livez")).startswith("HTTP/1.1 200")
+        assert (await _get(port, "/readyz")).startswith("HTTP/1.1 503")
+        assert "yami_prefix_match_seconds_count 0" in await _get(port, "/metrics")
+        assert (await _get(port, "/nope")).startswith("HTTP/1.1 404")
+
+        bot._is_ready = True
+        assert (await _get(port, "/readyz")).startswith("HTTP/1.1 200")
+
+    finally:
+        await server.stop()
+
+    assert not server.is_serving
@@ -0,0 +1,110 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import typing
+
+import mock
+import pytest
+
+import yami
+
+
+class PurgeFlags(yami.FlagSpec):
+    limit: int = yami.flag(100, short="l")
+    user: typing.Optional[str] = None
+    before_id: int = 0
+    silent: bool = False
+    dry: bool = yami.flag(False, short="d")
+
+
+class RequiredFlags(yami.FlagSpec):
+    reason: str
+
+
+def test_flags_defaults() -> None:
+    assert PurgeFlags.parse([]) == PurgeFlags(
+        limit=100, user=None, before_id=0, silent=False, dry=False
+    )
+
+
+def test_flags_parse() -> None:
+    flags = PurgeFlags.parse(["--limit", "500", "--user", "@x", "--before-id=123", "--silent"])
+
+    assert flags.limit == 500
+    assert flags.user == "@x"
+    assert flags.before_id == 123
+    assert flags.silent is True
+    assert flags.dry is False
+
+
+def test_flags_short_aliases_and_clusters() -> None:
+    flags = PurgeFlags.parse(["-l", "5", "-d"])
+    assert flags.limit == 5 and flags.dry is True
+
+    with pytest.raises(yami.BadFlag):
+        PurgeFlags.parse(["-dl"])
+
+
+def test_flags_failures() -> None:
+    with pytest.raises(yami.BadFlag):
+        PurgeFlags.parse(["--nope"])
+
+    with pytest.raises(yami.BadFlag):
+        PurgeFlags.parse(["--limit"])
+
+    with pytest.raises(yami.ConversionFailed):
+        PurgeFlags.parse(["--limit", "lots"])
+
+    with pytest.raises(yami.MissingArgs):
+        RequiredFlags.parse([])
+
+
+async def test_flags_command_invocation() -> None:
+    bot = yami.Bot(token="12345", prefix="$", banner=None)
+    received: list[typing.Any] = []
+
+    @bot.command()
+    async def purge(ctx: yami.MessageContext, channel: str, flags: PurgeFlags) -> None:
+        received.extend((channel, flags))
+
+    assert purge._get_plan().flags is not None
+    assert PurgeFlags.__yami_flags__["-l"].name == "limit"
+
+    await bot._invoke("$", mock.Mock(), "$purge general -l 5 --silent")
+    assert received == ["general", PurgeFlags(limit=5, silent=True)]
+
+
+async def test_flags_conversion_failures_match_positional_args() -> None:
+    bot = yami.Bot(token="12345", prefix="$", banner=None)
+    failures: list[Exception] = []
+
+    @bot.command()
+    async def purge(ctx: yami.MessageContext, count: int, flags: PurgeFlags) -> None:
+        ...
+
+    @bot.listen(yami.CommandExceptionEvent)
+    async def on_error(event: yami.CommandExceptionEvent) -> None:
+        failures.extend(event.ctx.exceptions)
+
+    await bot._invoke("$", mock.Mock(), "$purge lots")
+    await bot._invoke("$", mock.Mock(), "$purge 5 --limit lots")
+    positional, flag = failures
+
+    assert str(positional) == "Failed to convert arg 'count' for MessageCommand('purge')"
+    assert str(flag) == "Failed to convert arg 'flags' for MessageCommand('purge')"
+    assert "--limit" in str(flag.__context__)
@@ -0,0 +1,61 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+import yami
+from yami import testing
+
+
+def test_sampled_logger(caplog: pytest.LogCaptureFixture) -> None:
+    log = yami.SampledLogger("yami.test", every=3)
+
+    for i in range(7):
+        log.debug("record %d", i)
+
+    assert log.seen == 0 and not caplog.records
+
+    with caplog.at_level(logging.DEBUG, "yami.test"):
+        for i in range(7):
+            log.debug("record %d", i)
+
+    assert log.seen == 7
+    assert [r.message for r in caplog.records] == ["record 0", "record 3", "record 6"]
+    assert caplog.records[0].funcName == "test_sampled_logger"
+
+    with pytest.raises(ValueError):
+        yami.SampledLogger("yami.test", every=0)
+
+
+async def test_bot_samples_invocation_logs(caplog: pytest.LogCaptureFixture) -> None:
+    bot = yami.Bot(token="12345", prefix="!", banner=None, log_every=2)
+    messages = testing.MessageFactory(bot)
+
+    @bot.command()
+    async def ping(ctx: yami.MessageContext) -> None:
+        ...
+
+    with caplog.at_level(logging.DEBUG, "yami.bot"):
+        for _ in range(4):
+            await bot._invoke("!", messages.event("!ping"), "!ping")
+
+    invoked = [r.message for r in caplog.records if r.message.startswith("Invoked")]
+    assert len(invoked) == 2
+    assert invoked[0].startswith("Invoked 'ping' in ") and invoked[0].endswith("success")
@@ -0,0 +1,51 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from yami.bench import dispatch, memory
+
+BUDGET = Path(__file__).parent / "memory_budget.json"
+
+
+async def test_invocation_memory_within_budget() -> None:
+    if not (budget := memory.load_budget(BUDGET)):
+        pytest.skip("No memory budget for this Python version")
+
+    results = [await memory.measure(s) for s in dispatch.SCENARIOS if s != "chatter"]
+
+    assert memory.check_budget(results, budget) == []
+
+
+async def test_no_steady_state_growth() -> None:
+    size, blocks = await memory.measure_growth(invocations=100_000)
+
+    # Anything kept per invocation would be at least 100k blocks/bytes.
+    assert size < 10_000
+    assert blocks < 1_000
+
+
+def test_update_keeps_the_worst_run(tmp_path: Path) -> None:
+    path = tmp_path / "budget.json"
+    assert memory.main(["--runs", "2", "--update", str(path)]) == 0
+
+    budget = memory.load_budget(path)
+    assert budget is not None
+    assert set(budget) == {s for s in dispatch.SCENARIOS if s != "chatter"}
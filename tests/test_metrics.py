@@ -0,0 +1,77 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import mock
+
+import yami
+
+
+def test_histogram_record_and_quantile() -> None:
+    hist = yami.Histogram((0.001, 0.01, 0.1))
+
+    for _ in range(98):
+        hist.record(0.0005)
+
+    hist.record(0.05)
+    hist.record(5.0)
+
+    assert hist.count == 100
+    assert hist.counts == [98, 0, 1, 1]
+    assert hist.quantile(0.5) == 0.001
+    assert hist.quantile(0.99) == 0.1
+    assert hist.quantile(1.0) == float("inf")
+    assert yami.Histogram().quantile(0.5) == 0.0
+
+
+async def test_bot_records_invocation_metrics() -> None:
+    bot = yami.Bot(token="12345", prefix="&&", banner=None, allow_extra_args=True)
+
+    @bot.command()
+    async def parent(ctx: yami.MessageContext) -> None:
+        ...
+
+    @parent.subcommand()
+    async def child(ctx: yami.MessageContext, n: int) -> None:
+        ...
+
+    @yami.is_in_dm()
+    @bot.command()
+    async def dm_only(ctx: yami.MessageContext) -> None:
+        ...
+
+    event = mock.Mock()
+    event.message.guild_id = 1234
+    await bot._invoke("&&", event, "&&parent child 1")
+    await bot._invoke("&&", event, "&&parent child x")
+    await bot._invoke("&&", event, "&&dm_only")
+
+    snapshot = bot.metrics.snapshot()
+    child_stats = snapshot["commands"]["parent child"]
+    assert child_stats["invocations"] == 2
+    assert child_stats["successes"] == 1
+    assert child_stats["failures"] == 1
+    assert child_stats["stages"]["conversion"]["count"] == 2
+    assert child_stats["stages"]["resolution"]["count"] == 2
+
+    dm_stats = bot.metrics.commands["dm_only"]
+    assert dm_stats.check_failures == 1
+    assert dm_stats.stages["checks"].count == 1
+    assert dm_stats.stages["conversion"].count == 0
+
+    bot.remove_command("parent")
+    assert [*bot.metrics.commands] == ["dm_only"]
@@ -0,0 +1,77 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import pytest
+
+import yami
+from yami import testing
+
+
+async def test_invoke_returns_context(
+    yami_bot: yami.Bot, yami_state: testing.FakeState, yami_invoke: testing.Invoker
+) -> None:
+    yami_state.add_guild(1)
+    yami_state.add_member(1, 3)
+
+    @yami_bot.command()
+    async def add(ctx: yami.MessageContext, a: int, b: int) -> None:
+        await ctx.getch_member()
+        await ctx.respond(str(a + b))
+
+    ctx = await yami_invoke("!add 1 2")
+
+    assert ctx is not None and not ctx.exceptions
+    assert [a.value for a in ctx.args] == [1, 2]
+    assert yami_bot.rest.calls == {"create_message": 1}
+    assert yami_bot.cache.hits == {"get_member": 1}
+    assert await yami_invoke("not a command") is None
+
+
+@pytest.mark.yami_budget(max_rest_calls=2, max_ms=1000)
+async def test_budget_allows_invocations_within_it(
+    yami_bot: yami.Bot, yami_invoke: testing.Invoker
+) -> None:
+    @yami_bot.command()
+    async def ping(ctx: yami.MessageContext) -> None:
+        await ctx.respond("pong")
+
+    assert await yami_invoke("!ping")
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_budget_fails_invocations_over_it(pytester: pytest.Pytester) -> None:
+    pytester.makeini("[pytest]\nasyncio_mode = auto\n")
+    pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.yami_budget(max_rest_calls=1)
+        async def test_chatty(yami_bot, yami_invoke):
+            @yami_bot.command()
+            async def chatty(ctx):
+                await ctx.respond("one")
+                await ctx.respond("two")
+
+            await yami_invoke("!chatty")
+        """
+    )
+
+    result = pytester.runpytest_inprocess("-p", "yami.testing.plugin")
+
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(["*'!chatty' made 2 REST calls, over the budget of 1*"])
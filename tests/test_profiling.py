@@ -0,0 +1,116 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import asyncio
+import pstats
+import typing
+from pathlib import Path
+
+import mock
+import pytest
+
+import yami
+from yami import testing
+
+
+def _work(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def _bot(**kwargs: typing.Any) -> tuple[yami.Bot, testing.MessageFactory]:
+    bot = yami.Bot(token="12345", prefix="!", banner=None, **kwargs)
+    testing.make_offline(bot)
+
+    @bot.command()
+    async def slow(ctx: yami.MessageContext) -> None:
+        await asyncio.sleep(0)
+        _work(1000)
+
+    @bot.command()
+    async def other(ctx: yami.MessageContext) -> None:
+        _work(10)
+
+    return bot, testing.MessageFactory(bot)
+
+
+async def test_profile_command_writes_files(tmp_path: Path) -> None:
+    bot, messages = _bot()
+    profiler = bot.profile_command("slow", samples=2, directory=tmp_path)
+    assert bot.profilers == {"slow": profiler}
+
+    for content in ("!slow", "!other", "!slow"):
+        event = messages.event(content)
+        await bot._invoke("!", event, content)
+
+    assert profiler.is_done and not bot.profilers
+    stats_path, collapsed_path = profiler.paths or ()
+
+    stats = pstats.Stats(str(stats_path)).stats  # type: ignore[attr-defined]
+    names = {func for (_, _, func) in stats}
+    assert "_work" in names and "slow" in names and "other" not in names
+    assert next(v for k, v in stats.items() if k[2] == "_work")[1] == 2
+
+    lines = collapsed_path.read_text().splitlines()
+    assert any("slow (test_profiling.py" in line and "_work" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+async def test_profile_command_follows_commands_with_a_timeout(tmp_path: Path) -> None:
+    bot, messages = _bot(command_timeout=5)
+    profiler = bot.profile_command("slow", samples=1, directory=tmp_path)
+    await bot._invoke("!", messages.event("!slow"), "!slow")
+
+    _, collapsed_path = profiler.paths or ()
+    assert "_work" in collapsed_path.read_text()
+
+
+async def test_profile_command_leaves_concurrent_tasks_out(tmp_path: Path) -> None:
+    bot, messages = _bot()
+    profiler = bot.profile_command("slow", samples=1, directory=tmp_path)
+
+    async def busy() -> None:
+        for _ in range(3):
+            _work(10)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(bot._invoke("!", messages.event("!slow"), "!slow"), busy())
+
+    stats = pstats.Stats(str((profiler.paths or ())[0])).stats  # type: ignore[attr-defined]
+    assert "busy" not in {func for (_, _, func) in stats}
+
+
+async def test_profile_command_only_wraps_the_profiled_command(tmp_path: Path) -> None:
+    bot, messages = _bot()
+    bot.profile_command("slow", samples=1, directory=tmp_path)
+
+    with mock.patch.object(yami.Bot, "_invoke_wrapped") as _invoke_wrapped:
+        await bot._invoke("!", messages.event("!other"), "!other")
+        _invoke_wrapped.assert_not_called()
+
+        await bot._invoke("!", messages.event("!slow"), "!slow")
+        _invoke_wrapped.assert_called_once()
+
+
+def test_profile_command_bad_name() -> None:
+    bot, _ = _bot()
+
+    with pytest.raises(yami.CommandNotFound):
+        bot.profile_command("slow nope")
+
+    with pytest.raises(ValueError):
+        bot.profile_command("slow", samples=0)
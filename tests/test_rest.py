@@ -0,0 +1,97 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import logging
+
+import hikari
+import pytest
+from hikari.internal import routes
+
+import yami
+from yami import testing
+
+
+def _bot(**kwargs: object) -> tuple[yami.Bot, testing.FakeREST, testing.MessageFactory]:
+    bot = yami.Bot(token="12345", prefix="!", banner=None, **kwargs)
+    testing.make_offline(bot, autocreate=True)
+    return bot, bot._rest, testing.MessageFactory(bot)  # type: ignore[return-value]
+
+
+async def test_rest_calls_are_attributed_to_invocations() -> None:
+    bot, rest, messages = _bot(count_rest=True)
+    usages: list[yami.RESTUsage | None] = []
+
+    @bot.command()
+    async def guild(ctx: yami.MessageContext) -> None:
+        usages.append(yami.current_usage())
+        await ctx.rest.fetch_guild(1)
+        await ctx.respond("hi")
+
+    rest.fail(
+        "fetch_guild",
+        hikari.RateLimitedError(
+            url="",
+            headers={},
+            raw_body="",
+            route=routes.GET_GUILD.compile(guild=1),
+            retry_after=1.0,
+        ),
+    )
+
+    await bot._invoke("!", messages.event("!guild"), "!guild")
+    await bot._invoke("!", messages.event("!guild"), "!guild")
+
+    assert yami.current_usage() is None
+    first, second = usages
+    assert first and first.calls == {"fetch_guild": 1} and first.rate_limited == 1
+    assert second and second.calls == {"fetch_guild": 1, "create_message": 1}
+
+    stats = bot.metrics.commands["guild"]
+    assert (stats.rest_calls, stats.rest_rate_limited) == (3, 1)
+    text = await yami.PrometheusRenderer(bot.metrics).render()
+    assert 'yami_command_rest_calls_total{command="guild",rate_limited="true"} 1' in text
+
+
+async def test_rest_budget(caplog: pytest.LogCaptureFixture) -> None:
+    bot, rest, messages = _bot()
+    contexts: list[yami.MessageContext] = []
+    assert bot.rest is bot._rest
+
+    @bot.command(rest_budget=yami.RESTBudget(1))
+    async def loose(ctx: yami.MessageContext) -> None:
+        for _ in range(3):
+            await ctx.rest.fetch_guild(1)
+
+    @bot.command(rest_budget=yami.RESTBudget(1, strict=True))
+    async def strict(ctx: yami.MessageContext) -> None:
+        contexts.append(ctx)
+        await ctx.rest.fetch_guild(1)
+        await ctx.rest.fetch_guild(1)
+
+    with caplog.at_level(logging.WARNING, "yami.rest"):
+        await bot._invoke("!", messages.event("!loose"), "!loose")
+
+    assert len(caplog.records) == 1
+    assert "'loose' exceeded its budget of 1 REST calls" in caplog.records[0].message
+    assert rest.calls == {"fetch_guild": 3}
+
+    await bot._invoke("!", messages.event("!strict"), "!strict")
+
+    assert rest.calls == {"fetch_guild": 4}
+    assert isinstance(contexts[0].exceptions[0], yami.RESTBudgetExceeded)
+    assert bot.metrics.commands["strict"].rest_calls == 1
@@ -0,0 +1,248 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import asyncio
+import typing
+
+import pytest
+
+import yami
+from yami import testing
+
+
+async def test_scheduler_bounds_and_sheds() -> None:
+    scheduler = yami.Scheduler(workers=1, max_queue=2)
+    bot = yami.Bot(token="12345", prefix="!", banner=None, owner_ids=(99,), scheduler=scheduler)
+    messages = testing.MessageFactory(bot)
+    release = asyncio.Event()
+    ran: list[str] = []
+
+    @bot.command()
+    async def work(ctx: yami.MessageContext, tag: str) -> None:
+        ran.append(tag)
+        await release.wait()
+
+    scheduler.start(bot)
+
+    try:
+        for tag, author in (("a", 1), ("b", 1), ("c", 1), ("owner", 99), ("d", 1)):
+            await bot._listen(messages.event(f"!work {tag}", author_id=author))
+            await asyncio.sleep(0)
+
+        assert (scheduler.in_flight, scheduler.queue_depth) == (1, 2)
+        assert bot.metrics.shed == {"dropped": 1, "rejected": 1}
+        assert bot.metrics.snapshot()["gauges"] == {"queue_depth": 2, "in_flight": 1}
+
+        release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert ran == ["a", "owner", "b"]
+        assert bot.metrics.queue_wait.count == 3
+    finally:
+        await scheduler.stop()
+
+    assert not scheduler.is_running
+    text = await yami.PrometheusRenderer(bot.metrics).render()
+    assert 'yami_shed_invocations_total{reason="dropped"} 1' in text
+    assert "yami_in_flight 0.0" in text
+
+
+def test_scheduler_validates_options() -> None:
+    with pytest.raises(ValueError):
+        yami.Scheduler(policy="lifo")
+
+    with pytest.raises(ValueError):
+        yami.Scheduler(workers=0)
+
+
+async def test_serialize_by_channel() -> None:
+    bot = yami.Bot(token="12345", prefix="!", banner=None)
+    messages = testing.MessageFactory(bot)
+    release = asyncio.Event()
+    started: list[str] = []
+
+    @bot.command(serialize_by="channel")
+    async def ordered(ctx: yami.MessageContext, tag: str) -> None:
+        started.append(tag)
+        await release.wait()
+
+    async def invoke(tag: str, channel_id: int) -> None:
+        content = f"!ordered {tag}"
+        await bot._invoke("!", messages.event(content, channel_id=channel_id), content)
+
+    tasks = [
+        asyncio.create_task(invoke(tag, channel_id))
+        for tag, channel_id in (("a", 2), ("b", 2), ("c", 5), ("d", 2))
+    ]
+    await asyncio.sleep(0.01)
+
+    assert started == ["a", "c"]
+    assert bot._serializer.waiting(("channel", 2)) == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert started == ["a", "c", "b", "d"]
+    assert not len(bot._serializer)
+
+    with pytest.raises(ValueError):
+        yami.command(serialize_by="thread")(ordered.callback)
+
+
+async def test_serialized_invocations_do_not_hold_workers() -> None:
+    scheduler = yami.Scheduler(workers=2)
+    bot = yami.Bot(token="12345", prefix="!", banner=None, scheduler=scheduler)
+    messages = testing.MessageFactory(bot)
+    finished: list[str] = []
+
+    @bot.command(serialize_by="channel")
+    async def ordered(ctx: yami.MessageContext, tag: str) -> None:
+        await asyncio.sleep(0.05)
+        finished.append(tag)
+
+    scheduler.start(bot)
+
+    try:
+        for tag, channel_id in (("a1", 1), ("a2", 1), ("a3", 1), ("b1", 2)):
+            await bot._listen(messages.event(f"!ordered {tag}", channel_id=channel_id))
+
+        await asyncio.sleep(0.08)
+        assert finished == ["a1", "b1"]
+
+        assert await bot.drain(1.0) == 0
+        assert finished == ["a1", "b1", "a2", "a3"]
+        assert not len(bot._serializer)
+    finally:
+        await scheduler.stop()
+
+
+async def test_serialized_invocations_are_not_shed() -> None:
+    scheduler = yami.Scheduler(workers=2, max_queue=1)
+    bot = yami.Bot(token="12345", prefix="!", banner=None, owner_ids=(99,), scheduler=scheduler)
+    messages = testing.MessageFactory(bot)
+    first, rest = asyncio.Event(), asyncio.Event()
+    ran: list[str] = []
+
+    @bot.command(serialize_by="channel")
+    async def ordered(ctx: yami.MessageContext, tag: str) -> None:
+        await first.wait()
+        ran.append(tag)
+
+    @bot.command()
+    async def block(ctx: yami.MessageContext, tag: str) -> None:
+        await rest.wait()
+        ran.append(tag)
+
+    async def send(content: str, author_id: int = 1) -> None:
+        await bot._listen(messages.event(content, channel_id=1, author_id=author_id))
+
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    scheduler.start(bot)
+
+    try:
+        # a2 waits for a1 off the workers, then b and c take them.
+        for content in ("!ordered a1", "!ordered a2", "!block b", "!block c"):
+            await send(content)
+
+        first.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert scheduler.queue_depth == 1
+        await send("!block owner", author_id=99)
+
+        # a2 was queued when it got the key, and has a lower priority,
+        # but it was accepted already so is not dropped.
+        assert scheduler.queue_depth == 1
+        assert bot.metrics.shed == {"rejected": 1}
+
+        rest.set()
+        assert await bot.drain(1.0) == 0
+        assert sorted(ran) == ["a1", "a2", "b", "c"]
+        assert not len(bot._serializer)
+    finally:
+        await scheduler.stop()
+
+
+async def test_keyed_executor_orders_by_hold() -> None:
+    executor = yami.KeyedExecutor()
+    order: list[str] = []
+
+    async def work(hold: typing.AsyncContextManager[None], tag: str) -> None:
+        async with hold:
+            order.append(tag)
+            await asyncio.sleep(0)
+
+    first, second = executor.hold("key"), executor.hold("key")
+    # The second hold enters first, but still waits its turn.
+    await asyncio.gather(work(second, "second"), work(first, "first"))
+
+    assert order == ["first", "second"]
+    assert not len(executor)
+
+
+async def test_scheduler_drain_waits_for_queue() -> None:
+    scheduler = yami.Scheduler(workers=1)
+    bot = yami.Bot(token="12345", prefix="!", banner=None, owner_ids=(99,), scheduler=scheduler)
+    messages = testing.MessageFactory(bot)
+    ran: list[str] = []
+
+    @bot.command()
+    async def work(ctx: yami.MessageContext, tag: str) -> None:
+        await asyncio.sleep(0.01)
+        ran.append(tag)
+
+    scheduler.start(bot)
+
+    try:
+        for tag in ("a", "b"):
+            await bot._listen(messages.event(f"!work {tag}"))
+
+        assert bot.in_flight == 2
+        assert await bot.drain(1.0) == 0
+        assert ran == ["a", "b"]
+
+        await bot._listen(messages.event("!work c"))
+        assert bot.in_flight == 0
+    finally:
+        await scheduler.stop()
+
+
+async def test_scheduler_stop_cancels_queued_runs() -> None:
+    scheduler = yami.Scheduler(workers=1)
+    bot = yami.Bot(token="12345", prefix="!", banner=None, scheduler=scheduler)
+    messages = testing.MessageFactory(bot)
+    release = asyncio.Event()
+
+    scheduler.start(bot)
+    event = messages.event("!work")
+    running = asyncio.create_task(scheduler.run(event, release.wait))
+    queued = asyncio.create_task(scheduler.run(event, release.wait))
+
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    assert (scheduler.in_flight, scheduler.queue_depth) == (1, 1)
+
+    await scheduler.stop()
+    await asyncio.wait((running, queued), timeout=1.0)
+    assert queued.cancelled()
+    assert running.done()
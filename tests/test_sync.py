@@ -0,0 +1,168 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import functools
+import os
+import threading
+import typing
+
+import hikari
+import mock
+import pytest
+
+import yami
+from yami import testing
+
+
+def _pid(n: int, *words: str) -> str:
+    return f"{os.getpid()} {n} {' '.join(words)}"
+
+
+async def test_sync_callbacks_run_on_the_thread_pool() -> None:
+    bot = yami.Bot(token="12345", prefix="!", banner=None, count_rest=True, thread_pool_size=2)
+    state = testing.make_offline(bot, autocreate=True)
+    messages = testing.MessageFactory(bot)
+    seen: dict[str, object] = {}
+
+    @bot.command()
+    def render(ctx: yami.SyncContext, n: int) -> None:
+        seen["thread"] = threading.current_thread().name
+        seen["guild"] = ctx.rest.fetch_guild(ctx.guild_id)
+        seen["message"] = ctx.respond(f"rendered {n}")
+        seen["usage"] = yami.current_usage()
+
+    assert render.is_sync
+    await bot._invoke("!", messages.event("!render 3"), "!render 3")
+
+    assert str(seen["thread"]).startswith("yami-command")
+    assert isinstance(seen["guild"], hikari.Guild)
+    assert isinstance(seen["message"], hikari.Message)
+    assert [m.content for m in state.messages.values()][-1] == "rendered 3"
+    assert bot.metrics.commands["render"].successes == 1
+    assert bot.metrics.commands["render"].rest_calls == 2
+    assert isinstance(seen["usage"], yami.RESTUsage)
+
+    await bot._shutdown_pools()
+    assert bot._thread_pool is None
+
+
+async def test_cpu_bound_callbacks_run_in_the_process_pool() -> None:
+    bot = yami.Bot(
+        token="12345", prefix="!", banner=None, process_pool_size=1, max_payload_size=200
+    )
+    state = testing.make_offline(bot)
+    messages = testing.MessageFactory(bot)
+    contexts: list[yami.MessageContext] = []
+    bot.add_command(_pid, name="pid", cpu_bound=True)
+
+    @bot.listen(yami.CommandExceptionEvent)
+    async def on_error(event: yami.CommandExceptionEvent) -> None:
+        contexts.append(event.ctx)
+
+    try:
+        await bot._warm_process_pool(mock.Mock())
+        await bot._invoke("!", messages.event("!pid 7 a b"), "!pid 7 a b")
+
+        pid, n, *words = [*state.messages.values()][-1].content.split()
+        assert int(pid) != os.getpid() and (n, words) == ("7", ["a", "b"])
+        assert bot.metrics.process_wait.count == 1
+
+        content = "!pid 1 " + "x " * 200
+        await bot._invoke("!", messages.event(content), content)
+    finally:
+        await bot._shutdown_pools()
+
+    assert bot.metrics.commands["pid"].failures == 1
+    assert isinstance(contexts[0].exceptions[0], yami.PayloadTooLarge)
+
+    with pytest.raises(ValueError):
+        bot.add_command(lambda n: n, name="local", cpu_bound=True)
+
+
+@yami.command("square", cpu_bound=True)
+def _square(n: int) -> str:
+    return str(n * n)
+
+
+class _Maths(yami.Module):
+    @yami.command(cpu_bound=True)
+    def cube(self, n: int) -> str:
+        return str(n**3)
+
+
+async def test_decorated_cpu_bound_callbacks_are_sent_by_name() -> None:
+    bot = yami.Bot(token="12345", prefix="!", banner=None, process_pool_size=1)
+    state = testing.make_offline(bot)
+    messages = testing.MessageFactory(bot)
+    bot.add_command(_square)
+
+    try:
+        await bot._invoke("!", messages.event("!square 12"), "!square 12")
+    finally:
+        await bot._shutdown_pools()
+
+    assert [*state.messages.values()][-1].content == "144"
+    assert bot.metrics.commands["square"].successes == 1
+
+    with pytest.raises(ValueError):
+        _Maths(bot)
+
+
+class _Bot(yami.Bot):
+    @yami.command()
+    async def hello(self, ctx: yami.MessageContext) -> None:
+        await ctx.respond("hello")
+
+
+def test_pools_are_not_created_with_the_bot() -> None:
+    bot = _Bot(token="12345", prefix="!", banner=None)
+
+    assert "hello" in bot.commands
+    assert bot._thread_pool is None
+    assert bot._process_pool is None
+
+
+async def test_wrapped_async_callbacks_are_awaited() -> None:
+    bot = yami.Bot(token="12345", prefix="!", banner=None)
+    state = testing.make_offline(bot)
+    messages = testing.MessageFactory(bot)
+
+    async def greet(ctx: yami.MessageContext, name: str) -> None:
+        await ctx.respond(f"hello {name}")
+
+    def hidden_greet(ctx: yami.MessageContext, name: str) -> typing.Any:
+        return greet(ctx, name)
+
+    @functools.wraps(greet)
+    def wrapped_greet(*args: typing.Any) -> typing.Any:
+        return greet(*args)
+
+    wrapped = bot.add_command(wrapped_greet, name="wrapped")
+    hidden = bot.add_command(hidden_greet, name="hidden")
+    mocked = yami.MessageCommand(
+        mock.AsyncMock(), "mocked", "", aliases=(), raise_conversion=False
+    )
+
+    assert not wrapped.is_sync and not mocked.is_sync
+    assert hidden.is_sync
+
+    for content in ("!wrapped a", "!hidden b"):
+        await bot._invoke("!", messages.event(content), content)
+
+    await bot._shutdown_pools()
+    assert [m.content for m in state.messages.values()] == ["hello a", "hello b"]
@@ -0,0 +1,94 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import asyncio
+
+import hikari
+import pytest
+
+import yami
+from yami import testing
+
+
+@pytest.fixture()
+def bot() -> yami.Bot:
+    return yami.Bot(token="12345", prefix="&&", banner=None)
+
+
+async def test_fake_rest_serves_checks(bot: yami.Bot) -> None:
+    state = testing.make_offline(bot)
+    state.add_guild(1)
+    state.add_role(1, 5, name="mod")
+    state.add_member(1, 3, role_ids=[5])
+    seen: list[str] = []
+
+    @yami.has_roles("mod")
+    @bot.command()
+    async def mod(ctx: yami.MessageContext) -> None:
+        seen.append((await ctx.respond("ok")).content or "")
+
+    await bot._listen(testing.MessageFactory(bot).event("&&mod"))
+
+    assert seen == ["ok"]
+    assert bot.rest.calls == {"fetch_member": 1, "fetch_roles": 1, "create_message": 1}
+    assert len(state.messages) == 1
+
+
+async def test_fake_rest_missing_entities_and_errors(bot: yami.Bot) -> None:
+    rest = testing.FakeREST(bot)
+    rest.state.add_user(3)
+
+    with pytest.raises(hikari.NotFoundError):
+        await rest.fetch_member(1, 3)
+
+    rest.fail("fetch_user", RuntimeError("boom"), times=2)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await rest.fetch_user(3)
+
+    assert (await rest.fetch_user(3)).id == 3
+    assert await rest.fetch_application() is None
+    assert rest.calls == {"fetch_member": 1, "fetch_user": 3, "fetch_application": 1}
+
+
+async def test_fake_rest_rate_limit(bot: yami.Bot) -> None:
+    rest = testing.FakeREST(bot, rate_limit=(2, 0.05))
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    await asyncio.gather(*(rest.delete_channel(1) for _ in range(5)))
+
+    assert rest.rate_limited == {"delete_channel": 3}
+    assert loop.time() - start >= 0.1
+
+
+def test_fake_cache_counts_hits_and_misses(bot: yami.Bot) -> None:
+    state = testing.make_offline(bot)
+    state.add_guild(1)
+    member = state.add_member(1, 3)
+
+    assert bot.cache.get_member(1, 3) is member
+    assert bot.cache.get_member(1, 4) is None
+    assert bot.cache.get_role(1).name == "@everyone"
+    assert bot.cache.get_emojis_view() == {}
+
+    bot.cache.enabled = False
+    assert bot.cache.get_guild(1) is None
+    assert bot.cache.hits == {"get_member": 1, "get_role": 1}
+    assert bot.cache.misses == {"get_member": 1, "get_emojis_view": 1, "get_guild": 1}
@@ -0,0 +1,57 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import asyncio
+import typing
+
+import mock
+
+import yami
+
+
+async def test_bot_cancels_commands_that_time_out() -> None:
+    bot = yami.Bot(token="12345", prefix="&&", banner=None, command_timeout=0.01)
+    cancelled: list[bool] = []
+    contexts: list[yami.MessageContext] = []
+    tasks: list[asyncio.Task[typing.Any] | None] = []
+
+    @bot.command()
+    async def hang(ctx: yami.MessageContext) -> None:
+        contexts.append(ctx)
+
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    @bot.command(timeout=10)
+    async def patient(ctx: yami.MessageContext) -> None:
+        tasks.append(asyncio.current_task())
+        await asyncio.sleep(0.02)
+
+    event = mock.Mock()
+    await bot._invoke("&&", event, "&&hang")
+    await bot._invoke("&&", event, "&&patient")
+
+    assert cancelled == [True]
+    assert isinstance(contexts[0].exceptions[0], yami.CommandTimeout)
+    assert bot.metrics.commands["hang"].timeouts == 1
+    assert bot.metrics.commands["hang"].failures == 0
+    assert bot.metrics.commands["patient"].successes == 1
+    assert tasks == [asyncio.current_task()]
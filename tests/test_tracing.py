@@ -0,0 +1,110 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import json
+
+import mock
+
+import yami
+
+
+async def test_bot_traces_invocation_stages() -> None:
+    exporter = yami.InMemoryTraceExporter()
+    bot = yami.Bot(token="12345", prefix="&&", banner=None, tracer=yami.Tracer(exporter))
+    bot._rest = mock.Mock()
+    bot._instrumented_rest = yami.InstrumentedREST(bot._rest)
+
+    async def fetch_user(user: int) -> None:
+        ...
+
+    # AsyncMock is not a coroutine function to inspect before 3.10.
+    bot._rest.fetch_user = fetch_user
+
+    @yami.is_in_guild()
+    @bot.command()
+    async def user(ctx: yami.MessageContext, n: int) -> None:
+        with yami.span("lookup"):
+            await ctx.rest.fetch_user(n)
+
+    event = mock.Mock()
+    event.message.guild_id = 1234
+    await bot._invoke("&&", event, "&&user 1")
+
+    assert len(exporter.traces) == 1
+    root = exporter.traces[0]
+    assert root.name == "user"
+    assert root.attributes["outcome"] == "success"
+    assert [s.name for s in root.children] == ["resolution", "checks", "conversion", "callback"]
+    assert [s.name for s in root.walk()][-2:] == ["lookup", "rest.fetch_user"]
+    assert root.children[1].children[0].name == "is_in_guild"
+    assert all(s.end is not None for s in root.walk())
+    assert yami.current_span() is None
+
+
+async def test_bot_without_tracer_has_no_spans() -> None:
+    bot = yami.Bot(token="12345", prefix="&&", banner=None)
+    seen: list[yami.Span | None] = []
+
+    @bot.command()
+    async def noop(ctx: yami.MessageContext) -> None:
+        seen.append(yami.current_span())
+
+    await bot._invoke("&&", mock.Mock(), "&&noop")
+
+    assert seen == [None]
+    assert bot.rest is bot._rest
+
+
+def test_chrome_trace_exporter(tmp_path) -> None:
+    path = tmp_path / "trace.json"
+    exporter = yami.ChromeTraceExporter(path, flush_every=1)
+    tracer = yami.Tracer(exporter)
+
+    for _ in range(2):
+        with tracer.start("cmd") as root:
+            with yami.span("callback", command="cmd"):
+                pass
+
+    assert root.parent is None
+    exporter.close()
+    events = json.loads(path.read_text())
+
+    assert [e["name"] for e in events] == ["cmd", "callback", "cmd", "callback"]
+    assert events[1]["ph"] == "X"
+    assert events[1]["args"] == {"command": "cmd"}
+    assert events[0]["dur"] >= events[1]["dur"]
+
+
+async def test_bot_closes_the_exporter_when_stopping(tmp_path) -> None:
+    path = tmp_path / "trace.json"
+    bot = yami.Bot(
+        token="12345", prefix="&&", banner=None, tracer=yami.Tracer(yami.ChromeTraceExporter(path))
+    )
+
+    @bot.command()
+    async def noop(ctx: yami.MessageContext) -> None:
+        ...
+
+    await bot._invoke("&&", mock.Mock(), "&&noop")
+    await bot._on_stopping(mock.Mock())
+
+    assert json.loads(path.read_text())[0]["name"] == "noop"
+
+
+def test_tracer_sampling() -> None:
+    assert yami.Tracer(yami.InMemoryTraceExporter(), sample_rate=0.0).start("x") is None
@@ -0,0 +1,97 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+
+import pytest
+
+import yami
+from yami import testing
+
+
+def _bot(watchdog: yami.Watchdog) -> tuple[yami.Bot, testing.MessageFactory]:
+    bot = yami.Bot(token="12345", prefix="!", banner=None, watchdog=watchdog)
+    testing.make_offline(bot)
+
+    @bot.command()
+    async def slow(ctx: yami.MessageContext, n: int) -> None:
+        await asyncio.sleep(0.05)
+
+    @bot.command()
+    async def blocking(ctx: yami.MessageContext) -> None:
+        time.sleep(0.15)
+
+    return bot, testing.MessageFactory(bot)
+
+
+async def test_watchdog_reports_slow_invocations(caplog: pytest.LogCaptureFixture) -> None:
+    watchdog = yami.Watchdog(0.01, log_interval=60.0)
+    bot, messages = _bot(watchdog)
+    watchdog.start(bot.metrics)
+
+    try:
+        with caplog.at_level(logging.WARNING, "yami.watchdog"):
+            for _ in range(2):
+                await bot._invoke("!", messages.event("!slow 7"), "!slow 7")
+    finally:
+        await watchdog.stop()
+
+    assert bot.metrics.slow == {"slow": 2}
+    (record,) = caplog.records
+    assert " in command 'slow' (guild=1, args=[n=7])" in record.message
+    assert "in slow\n    await asyncio.sleep(0.05)" in record.message
+
+
+async def test_watchdog_catches_loop_stalls(caplog: pytest.LogCaptureFixture) -> None:
+    watchdog = yami.Watchdog(0.05, interval=0.01)
+    bot, messages = _bot(watchdog)
+    watchdog.start(bot.metrics)
+
+    try:
+        await asyncio.sleep(0.03)
+
+        with caplog.at_level(logging.WARNING, "yami.watchdog"):
+            await bot._invoke("!", messages.event("!blocking"), "!blocking")
+            await asyncio.sleep(0.03)
+    finally:
+        await watchdog.stop()
+
+    assert not watchdog.is_running
+    assert bot.metrics.stalls == 1
+    assert bot.metrics.loop_lag.quantile(1.0) >= 0.1
+    messages_ = [r.message for r in caplog.records]
+    assert any(
+        m.startswith("Event loop stalled") and " in command 'blocking'" in m and "time.sleep" in m
+        for m in messages_
+    )
+
+
+def test_watchdog_reports_hold_the_lock() -> None:
+    watchdog = yami.Watchdog(0.05)
+    reporter = threading.Thread(target=watchdog._report, args=("Stalled", None, None, ""))
+
+    with watchdog._lock:
+        reporter.start()
+        reporter.join(0.05)
+        assert reporter.is_alive() and not watchdog._logged
+
+    reporter.join()
+    assert "" in watchdog._logged
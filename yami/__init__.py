@@ -24,7 +24,9 @@ __all__ = [
     "Shared",
     "SharedNone",
     "YamiNoneType",
+    "SampledLogger",
     "MessageArg",
+    "ParseLimits",
     "Converter",
     "BuiltinConverter",
     "HikariConverter",
@@ -38,11 +40,17 @@ __all__ = [
     "custom_check",
     "is_the_cutest",
     "command",
+    "FlagSpec",
+    "flag",
     "HIKARI_CAN_CONVERT",
     "BUILTIN_CAN_CONVERT",
+    "BULK_CAN_CONVERT",
+    "BULK_SEQUENCES",
+    "convert_bulk",
     "YamiException",
     "CommandNotFound",
     "BadArgument",
+    "BadFlag",
     "DuplicateCommand",
     "ModuleException",
     "ModuleRemoveException",
@@ -58,11 +66,36 @@ __all__ = [
     "TooManyArgs",
     "MissingArgs",
     "ConversionFailed",
+    "RESTBudgetExceeded",
+    "CommandTimeout",
+    "PayloadTooLarge",
     "Context",
+    "SyncContext",
     "YamiEvent",
     "CommandInvokeEvent",
     "CommandExceptionEvent",
     "CommandSuccessEvent",
+    "Histogram",
+    "InvocationStats",
+    "Metrics",
+    "PrometheusRenderer",
+    "MetricsServer",
+    "Span",
+    "Tracer",
+    "TraceExporter",
+    "InMemoryTraceExporter",
+    "ChromeTraceExporter",
+    "span",
+    "current_span",
+    "InstrumentedREST",
+    "RESTBudget",
+    "RESTUsage",
+    "current_usage",
+    "CommandProfiler",
+    "Watchdog",
+    "Scheduler",
+    "KeyedExecutor",
+    "owners_first",
 ]
 
 __packagename__ = "Yami"
@@ -84,5 +117,13 @@ from yami.context import *
 from yami.converters import *
 from yami.events import *
 from yami.exceptions import *
+from yami.exporter import *
+from yami.flags import *
+from yami.metrics import *
 from yami.modules import *
+from yami.profiling import *
+from yami.rest import *
+from yami.scheduler import *
+from yami.tracing import *
 from yami.utils import *
+from yami.watchdog import *
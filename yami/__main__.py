@@ -13,11 +13,11 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
-"""Main module entry point, provides version info and exits."""
+"""Main module entry point, see ``python -m yami --help``."""
 
 from __future__ import annotations
 
 from yami import _cli
 
 if __name__ == "__main__":
-    _cli.info()
+    _cli.main()
@@ -13,15 +13,29 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
-"""Provides cli functionality for versioning info."""
+"""Provides cli functionality for versioning info, benchmarks,
+profiling and inspecting a bots commands.
+"""
 
 from __future__ import annotations
 
+import argparse
+import importlib
+import json
 import platform
+import statistics
+import sys
+import typing
 from pathlib import Path
 
 from yami import __git_sha__, __version__
 
+if typing.TYPE_CHECKING:
+    from yami import bot as bot_
+    from yami import commands as commands_
+
+_SUITES = ("dispatch", "replay", "memory", "startup")
+
 
 def info() -> None:
     """Prints package/system info and exits."""
@@ -36,3 +50,95 @@ def info() -> None:
     print(f"{py_impl} {py_ver} {py_c}")
     print(f"{p.system} {p.node} {p.release} {p.machine}")
     print(p.version)
+
+
+def registry_stats(bot: bot_.Bot) -> dict[str, typing.Any]:
+    """Gets statistics about the commands registered to a bot."""
+    from yami.bench import profile
+
+    commands = [*profile.iter_all_commands(bot)]
+    depths: dict[int, int] = {}
+    chains: list[int] = []
+
+    for cmd in commands:
+        depth, chain = 0, 0
+        parent: commands_.MessageCommand | None = cmd
+
+        while parent:
+            chain += len([*parent.iter_checks()])
+            parent = parent.parent
+            depth += 1
+
+        depths[depth] = depths.get(depth, 0) + 1
+        chains.append(chain)
+
+    return {
+        "modules": len(bot.modules),
+        "commands": len(bot.commands),
+        "total_commands": len(commands),
+        "subcommands": len(commands) - len(bot.commands),
+        "aliases": sum(len([*c.aliases]) for c in commands),
+        "max_depth": max(depths, default=0),
+        "depths": {str(d): n for d, n in sorted(depths.items())},
+        "check_chain": {
+            "max": max(chains, default=0),
+            "mean": statistics.mean(chains) if chains else 0.0,
+            "total": sum(chains),
+        },
+    }
+
+
+def inspect(argv: typing.Sequence[str]) -> dict[str, typing.Any]:
+    """Loads modules and prints registry statistics."""
+    import yami
+
+    parser = argparse.ArgumentParser(
+        prog="python -m yami inspect", description="Dump command registry statistics."
+    )
+    parser.add_argument("paths", nargs="*", help="Directories of modules to load.")
+    parser.add_argument("--json", action="store_true", help="Print the statistics as JSON.")
+    ns = parser.parse_args(argv)
+
+    bot = yami.Bot("12345", "!", banner=None)
+
+    if ns.paths:
+        bot.load_all_modules(*ns.paths)
+
+    stats = registry_stats(bot)
+
+    if ns.json:
+        print(json.dumps(stats, indent=2))
+    else:
+        for key, value in stats.items():
+            print(f"{key:<15} {value}")
+
+    return stats
+
+
+def main(argv: typing.Sequence[str] | None = None) -> None:
+    """Runs the cli, printing package/system info if no command is
+    given.
+    """
+    argv = [*(sys.argv[1:] if argv is None else argv)]
+    parser = argparse.ArgumentParser(
+        prog="python -m yami",
+        description="bench [suite]: run the bundled benchmarks, the suite is one of "
+        f"{', '.join(_SUITES)} (default dispatch). profile PATH...: profile synthetic "
+        "invocations of a module tree offline. inspect [PATH...]: dump command registry "
+        "statistics. Pass --help after a command for its options.",
+    )
+    parser.add_argument("command", nargs="?", choices=("bench", "profile", "inspect"))
+    command = parser.parse_args(argv[:1]).command
+    rest = argv[1:]
+
+    if command == "bench":
+        suite = rest.pop(0) if rest and rest[0] in _SUITES else "dispatch"
+        importlib.import_module(f"yami.bench.{suite}").main(rest)
+    elif command == "profile":
+        from yami.bench import profile
+
+        profile.main(rest)
+    elif command == "inspect":
+        inspect(rest)
+    else:
+        info()
@@ -17,18 +17,125 @@
 
 from __future__ import annotations
 
+import collections.abc
 import inspect
 import logging
-from typing import TYPE_CHECKING, Any
+import numbers
+import typing
+from typing import TYPE_CHECKING, Any, Callable
 
-from yami import converters, exceptions
+from yami import converters, exceptions, flags
 
 if TYPE_CHECKING:
     from yami import context
 
-__all__ = ["MessageArg"]
+__all__ = ["MessageArg", "ParseLimits"]
 
 _log = logging.getLogger(__name__)
+_BULK_ARRAYS: dict[Any, type] = {}
+"""The ``numpy.ndarray`` annotations seen by plans, and the type of
+their elements.
+"""
+
+
+class ParseLimits:
+    """Limits on the size of messages the bot will parse. Messages that
+    exceed them are rejected before their arguments are built, and are
+    only counted in :obj:`~yami.Bot.rejected`.
+
+    Keyword Args:
+        max_content_length (:obj:`int` | :obj:`None`): The maximum
+            number of characters in the message. Defaults to
+            :obj:`None` (no limit).
+        max_tokens (:obj:`int` | :obj:`None`): The maximum number of
+            whitespace separated tokens in the message, including the
+            prefix and command names. Defaults to :obj:`None`.
+        max_depth (:obj:`int` | :obj:`None`): The maximum number of
+            nested subcommands that can be invoked. Defaults to
+            :obj:`None`.
+    """
+
+    __slots__ = ("_max_content_length", "_max_tokens", "_max_depth")
+
+    def __init__(
+        self,
+        *,
+        max_content_length: int | None = None,
+        max_tokens: int | None = None,
+        max_depth: int | None = None,
+    ) -> None:
+        self._max_content_length = max_content_length
+        self._max_tokens = max_tokens
+        self._max_depth = max_depth
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(max_content_length={self._max_content_length}, "
+            f"max_tokens={self._max_tokens}, max_depth={self._max_depth})"
+        )
+
+    @property
+    def max_content_length(self) -> int | None:
+        """The maximum number of characters in the message."""
+        return self._max_content_length
+
+    @property
+    def max_tokens(self) -> int | None:
+        """The maximum number of whitespace separated tokens in the
+        message.
+        """
+        return self._max_tokens
+
+    @property
+    def max_depth(self) -> int | None:
+        """The maximum number of nested subcommands."""
+        return self._max_depth
+
+    def check(self, content_l: int, tokens_l: int) -> str | None:
+        """Checks the given message sizes against these limits.
+
+        Args:
+            content_l (:obj:`int`): The length of the content.
+            tokens_l (:obj:`int`): The number of tokens.
+
+        Returns:
+            :obj:`str` | :obj:`None`: The name of the exceeded limit,
+            or :obj:`None` if none were exceeded.
+        """
+        if self._max_content_length is not None and content_l > self._max_content_length:
+            return "max_content_length"
+
+        if self._max_tokens is not None and tokens_l > self._max_tokens:
+            return "max_tokens"
+
+        return None
+
+
+def _resolve_annotations(callback: Callable[..., Any]) -> dict[str, Any]:
+    """Resolves the callbacks annotations, including string annotations
+    from modules using ``from __future__ import annotations``.
+    """
+    try:
+        return typing.get_type_hints(callback)
+    except Exception:
+        pass
+
+    # Resolve each annotation on its own, so one that can't be resolved
+    # (i.e. a TYPE_CHECKING only import) doesn't disable the others.
+    hints: dict[str, Any] = {}
+    globalns = getattr(inspect.unwrap(callback), "__globals__", None) or {}
+    annotations = getattr(callback, "__annotations__", None) or {}
+
+    for name, annotation in annotations.items():
+        if isinstance(annotation, str):
+            try:
+                annotation = eval(annotation, globalns)
+            except Exception:
+                continue
+
+        hints[name] = annotation
+
+    return hints
 
 
 class MessageArg:
@@ -36,7 +143,8 @@ class MessageArg:
 
     Args:
         param (:obj:`inspect.Parameter`): The raw inspect parameter.
-        value (:obj:`str`): The value for this argument.
+        value (:obj:`str` | :obj:`list` [:obj:`str`]): The value for
+            this argument, or the tokens for a flags argument.
 
     .. warning::
         This class should not be instantiated manually, it will be
@@ -45,7 +153,7 @@ class MessageArg:
 
     __slots__ = ("_param", "_name", "_kind", "_is_empty", "_annotation", "_is_converted", "_value")
 
-    def __init__(self, param: inspect.Parameter, value: str) -> None:
+    def __init__(self, param: inspect.Parameter, value: str | list[str]) -> None:
         self._value: Any = value
         self._param = param
         self._name = param.name
@@ -99,11 +207,29 @@ class MessageArg:
         Args:
             ctx (:obj:`~yami.MessageContext`): The message context.
         """
-        _log.debug(f"Attempting conversion of message arg {self._name!r} to {self._annotation}")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "Attempting conversion of message arg %r to %s", self._name, self._annotation
+            )
+
+        if (
+            self._kind is self._kind.VAR_POSITIONAL
+            and self._annotation in converters.BULK_CAN_CONVERT
+        ):
+            return await self._convert_bulk(ctx)
 
         if self._annotation in converters.BUILTIN_CAN_CONVERT:
             return await self._convert_builtin(ctx)
 
+        if _is_flag_spec(self._annotation):
+            return await self._convert_flags(ctx)
+
+        if self._annotation in converters.BULK_SEQUENCES:
+            return await self._convert_bulk(ctx, converters.BULK_SEQUENCES[self._annotation])
+
+        if type_ := _BULK_ARRAYS.get(self._annotation):
+            return await self._convert_bulk(ctx, type_, numpy=True)
+
         return ctx.args.append(self)
 
     async def _convert_builtin(self, ctx: context.MessageContext) -> None:
@@ -116,3 +242,258 @@ class MessageArg:
 
         self._is_converted = True
         ctx.args.append(self)
+
+    async def _convert_bulk(
+        self, ctx: context.MessageContext, type_: type | None = None, numpy: bool = False
+    ) -> None:
+        try:
+            self._value = converters.convert_bulk(
+                self._value, type_ or self._annotation, numpy=numpy
+            )
+        except exceptions.ConversionFailed:
+            return self._raise(ctx)
+
+        self._is_converted = True
+        ctx.args.append(self)
+
+    async def _convert_flags(self, ctx: context.MessageContext) -> None:
+        try:
+            self._value = self._annotation.parse(self._value)
+        except exceptions.ConversionFailed:
+            return self._raise(ctx)
+
+        self._is_converted = True
+        ctx.args.append(self)
+
+
+def _is_flag_spec(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, flags.FlagSpec)
+
+
+def _as_bulk_sequence(annotation: Any) -> Any:
+    """Gets the :obj:`~yami.BULK_SEQUENCES` annotation equal to a
+    ``Sequence[int]`` or ``Sequence[float]`` annotation, or :obj:`None`.
+    """
+    if typing.get_origin(annotation) is not collections.abc.Sequence:
+        return None
+
+    sequence = typing.Sequence[typing.get_args(annotation)]  # type: ignore[misc]
+    return sequence if sequence in converters.BULK_SEQUENCES else None
+
+
+def _as_bulk_array(annotation: Any) -> type | None:
+    """Gets the element type of a ``numpy.ndarray`` or
+    ``numpy.typing.NDArray`` annotation, or :obj:`None`. Integer dtypes
+    are converted to :obj:`int`, and anything else to :obj:`float`.
+    """
+    origin = typing.get_origin(annotation) or annotation
+
+    name = f"{getattr(origin, '__module__', '')}.{getattr(origin, '__name__', '')}"
+
+    if name != "numpy.ndarray":
+        return None
+
+    if args := typing.get_args(annotation):
+        # NDArray[T] is ndarray[shape, dtype[T]].
+        scalar = (typing.get_args(args[-1]) or (None,))[0]
+
+        if isinstance(scalar, type) and issubclass(scalar, numbers.Integral):
+            return int
+
+    return float
+
+
+class InvocationPlan:
+    """The compiled argument plan for a command callback.
+
+    The callbacks signature is inspected, and its annotations resolved,
+    once when the plan is built. Parsing a commands arguments during
+    invocation is then a single pass over the message tokens.
+
+    Args:
+        callback (:obj:`~typing.Callable` [..., :obj:`~typing.Any`]):
+            The command callback to compile the plan for.
+        offset (:obj:`int`): The number of leading parameters to skip,
+            i.e. ``self`` and the context.
+
+    .. warning::
+        This class should not be instantiated manually, it is built and
+        cached by :obj:`~yami.MessageCommand` when it is registered.
+    """
+
+    __slots__ = (
+        "_offset",
+        "_positional",
+        "_variadic",
+        "_greedy",
+        "_bulk",
+        "_flags",
+        "_min_args",
+        "_max_args",
+    )
+
+    def __init__(self, callback: Callable[..., Any], offset: int) -> None:
+        positional: list[inspect.Parameter] = []
+        self._offset = offset
+        self._variadic: inspect.Parameter | None = None
+        self._greedy: inspect.Parameter | None = None
+        self._bulk: inspect.Parameter | None = None
+        self._flags: inspect.Parameter | None = None
+        hints = _resolve_annotations(callback)
+
+        for param in tuple(inspect.signature(callback).parameters.values())[offset:]:
+            if param.name in hints:
+                param = param.replace(annotation=hints[param.name])
+
+            if _is_flag_spec(param.annotation) and param.kind not in (
+                param.VAR_POSITIONAL,
+                param.VAR_KEYWORD,
+            ):
+                # The flags consume the rest of the message.
+                self._flags = param
+                param.annotation.compile()
+                break
+
+            if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+                if sequence := _as_bulk_sequence(param.annotation):
+                    # The rest of the message, as one compact array.
+                    self._bulk = param.replace(annotation=sequence)
+                    break
+
+                if type_ := _as_bulk_array(param.annotation):
+                    _BULK_ARRAYS[param.annotation] = type_
+                    self._bulk = param
+                    break
+
+                positional.append(param)
+            elif param.kind is param.VAR_POSITIONAL:
+                self._variadic = param
+            elif param.kind is param.KEYWORD_ONLY:
+                if self._greedy is None:
+                    # Only the first keyword only param consumes the
+                    # rest of the message, any others keep defaults.
+                    self._greedy = param
+                elif param.default is param.empty:
+                    raise TypeError(
+                        f"Keyword only parameter {param.name!r} of {callback.__name__!r} needs "
+                        "a default, only the first one receives the rest of the message"
+                    )
+
+        if self._variadic:
+            # *args consumes everything, nothing is left to be greedy.
+            self._greedy = None
+
+        self._positional = tuple(positional)
+        self._min_args: int = sum(p.default is p.empty for p in positional)
+        self._max_args: int | None = len(positional)
+
+        for tail in (self._greedy, self._bulk):
+            if tail and tail.default is tail.empty:
+                # The tail only receives what the positionals leave.
+                self._min_args = len(positional) + 1
+
+        if self._variadic or self._greedy or self._bulk or self._flags:
+            self._max_args = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(min={self._min_args}, max={self._max_args})"
+
+    @property
+    def offset(self) -> int:
+        """The number of leading callback parameters that are not
+        parsed from the message.
+        """
+        return self._offset
+
+    @property
+    def positional(self) -> tuple[inspect.Parameter, ...]:
+        """The positional parameters, in order."""
+        return self._positional
+
+    @property
+    def variadic(self) -> inspect.Parameter | None:
+        """The ``*args`` parameter, if any."""
+        return self._variadic
+
+    @property
+    def greedy(self) -> inspect.Parameter | None:
+        """The keyword only parameter that consumes the rest of the
+        message, if any.
+        """
+        return self._greedy
+
+    @property
+    def bulk(self) -> inspect.Parameter | None:
+        """The trailing ``Sequence[int]``, ``Sequence[float]`` or
+        ``numpy.ndarray`` parameter that receives the rest of the
+        message as one :obj:`array.array` or NumPy array, if any.
+        """
+        return self._bulk
+
+    @property
+    def flags(self) -> inspect.Parameter | None:
+        """The parameter annotated with a :obj:`~yami.FlagSpec`, if
+        any.
+        """
+        return self._flags
+
+    @property
+    def min_args(self) -> int:
+        """The minimum number of tokens the command requires."""
+        return self._min_args
+
+    @property
+    def max_args(self) -> int | None:
+        """The maximum number of tokens the command accepts, or
+        :obj:`None` if it is unbounded.
+        """
+        return self._max_args
+
+    def build_args(self, parsed: list[str], content: str | None = None) -> list[MessageArg]:
+        """Pairs the parsed tokens with their parameters.
+
+        .. note::
+            Arity is not validated here, optional parameters that did
+            not receive a token are omitted so their defaults apply.
+
+        Args:
+            parsed (:obj:`list` [:obj:`str`]): The message tokens.
+            content (:obj:`str` | :obj:`None`): The message content the
+                tokens are the end of. When given, the greedy tail is
+                sliced from it, keeping its whitespace. Defaults to
+                :obj:`None`, which joins the tokens with spaces.
+
+        Returns:
+            :obj:`list` [:obj:`MessageArg`]: The unconverted args.
+        """
+        args = [MessageArg(p, v) for p, v in zip(self._positional, parsed)]
+
+        if self._flags:
+            # Always present, so the specs defaults are applied.
+            args.append(MessageArg(self._flags, parsed[len(self._positional) :]))
+
+        elif len(parsed) > len(self._positional):
+            if self._bulk:
+                args.append(MessageArg(self._bulk, parsed[len(self._positional) :]))
+            elif self._variadic:
+                rest = parsed[len(self._positional) :]
+
+                if self._variadic.annotation in converters.BULK_CAN_CONVERT:
+                    # Converted in bulk, rather than an arg per token.
+                    args.append(MessageArg(self._variadic, rest))
+                else:
+                    args.extend(MessageArg(self._variadic, v) for v in rest)
+            elif self._greedy:
+                rest = parsed[len(self._positional) :]
+
+                if content is None:
+                    tail = " ".join(rest)
+                else:
+                    # The tokens are the last of content.split(), so the
+                    # tail starts where the last len(rest) tokens do.
+                    head = content.rsplit(maxsplit=len(rest))[0]
+                    tail = content[len(head) :].strip()
+
+                args.append(MessageArg(self._greedy, tail))
+
+        return args
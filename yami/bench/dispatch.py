@@ -0,0 +1,225 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Microbenchmarks for the message dispatcher.
+
+Drives :obj:`~yami.Bot._listen` with synthetic message create events,
+without a gateway connection::
+
+    python -m yami.bench.dispatch --output dispatch.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import time
+import typing
+
+import hikari
+
+import yami
+from yami import testing
+from yami.bench import results
+
+__all__ = ["SCENARIOS", "SIZES", "CONTENT", "build_bot", "run_scenario", "run", "main"]
+
+SCENARIOS = ("chatter", "simple", "aliased", "subcommand", "check_heavy")
+"""The scenarios that can be benchmarked."""
+
+SIZES = (10, 1_000, 10_000)
+"""The default numbers of registered commands."""
+
+CONTENT = {
+    "chatter": "just chatting about nothing in particular",
+    "simple": "!simple 42",
+    "aliased": "!s 42",
+    "subcommand": "!top mid leaf 42",
+    "check_heavy": "!checked 42",
+}
+"""The message content sent in each scenario."""
+
+
+async def _callback(ctx: yami.MessageContext, n: int) -> None:
+    ...
+
+
+async def _group(ctx: yami.MessageContext, *args: str) -> None:
+    ...
+
+
+def _passes(ctx: yami.MessageContext) -> bool:
+    return True
+
+
+def build_bot(
+    commands: int, *, callback: typing.Callable[..., typing.Any] | None = None
+) -> yami.Bot:
+    """Builds a bot with the scenario commands, plus enough filler
+    commands to have the given number registered.
+
+    Args:
+        commands (:obj:`int`): The number of commands to register.
+
+    Keyword Args:
+        callback (:obj:`~typing.Callable` [..., :obj:`~typing.Any`] | \
+            :obj:`None`): The callback for the scenario commands, it
+            must accept an :obj:`int`. Defaults to one that does
+            nothing.
+
+    Returns:
+        :obj:`~yami.Bot`: The bot.
+    """
+    callback = callback or _callback
+    bot = yami.Bot("12345", "!", banner=None)
+    bot.add_command(callback, name="simple", aliases=["s"])
+
+    top = bot.add_command(_group, name="top")
+    mid = top.subcommand("mid")(_group)
+    mid.subcommand("leaf")(callback)
+
+    checked = bot.add_command(callback, name="checked")
+    yami.is_in_guild()(checked)
+
+    for _ in range(4):
+        yami.custom_check(_passes)(checked)
+
+    for i in range(max(0, commands - len(bot.commands))):
+        bot.add_command(_callback, name=f"filler{i}", aliases=[f"f{i}"])
+
+    return bot
+
+
+async def run_scenario(
+    scenario: str, commands: int, *, messages: int = 10_000, warmup: int = 100
+) -> results.BenchResult:
+    """Benchmarks one scenario.
+
+    Args:
+        scenario (:obj:`str`): One of :obj:`SCENARIOS`.
+        commands (:obj:`int`): The number of commands to register.
+
+    Keyword Args:
+        messages (:obj:`int`): The number of messages to measure.
+            Defaults to ``10_000``.
+        warmup (:obj:`int`): The number of messages to send before
+            measuring. Defaults to ``100``.
+
+    Returns:
+        :obj:`~yami.bench.BenchResult`: The result.
+
+    Raises:
+        :obj:`ValueError`: If the scenario does not exist.
+    """
+    if scenario not in CONTENT:
+        raise ValueError(f"Unknown scenario {scenario!r}, expected one of {SCENARIOS}")
+
+    bot = build_bot(commands)
+    factory = testing.MessageFactory(bot)
+    pool: list[hikari.MessageCreateEvent] = [factory.event(CONTENT[scenario]) for _ in range(64)]
+    events = itertools.cycle(pool)
+    listen = bot._listen
+
+    for _ in range(warmup):
+        await listen(next(events))
+
+    latencies: list[float] = []
+    append = latencies.append
+    clock = time.perf_counter
+    start = clock()
+
+    for _ in range(messages):
+        before = clock()
+        await listen(next(events))
+        append(clock() - before)
+
+    seconds = clock() - start
+    stats = bot.metrics.commands
+    failures = sum(s.failures + s.check_failures for s in stats.values())
+
+    return results.BenchResult(
+        "dispatch",
+        {"scenario": scenario, "commands": len(bot.commands)},
+        seconds,
+        latencies,
+        extra={"failures": failures},
+    )
+
+
+async def run(
+    *,
+    scenarios: typing.Iterable[str] = SCENARIOS,
+    sizes: typing.Iterable[int] = SIZES,
+    messages: int = 10_000,
+) -> list[results.BenchResult]:
+    """Benchmarks every combination of scenario and size.
+
+    Keyword Args:
+        scenarios (:obj:`~typing.Iterable` [:obj:`str`]): The
+            scenarios to run. Defaults to :obj:`SCENARIOS`.
+        sizes (:obj:`~typing.Iterable` [:obj:`int`]): The numbers of
+            registered commands. Defaults to :obj:`SIZES`.
+        messages (:obj:`int`): The number of messages per run.
+            Defaults to ``10_000``.
+
+    Returns:
+        :obj:`list` [:obj:`~yami.bench.BenchResult`]: The results.
+    """
+    sizes = tuple(sizes)
+    return [
+        await run_scenario(scenario, size, messages=messages)
+        for scenario in scenarios
+        for size in sizes
+    ]
+
+
+def main(argv: typing.Sequence[str] | None = None) -> list[results.BenchResult]:
+    """Runs the dispatcher benchmarks from the command line.
+
+    Args:
+        argv (:obj:`~typing.Sequence` [:obj:`str`] | :obj:`None`):
+            The arguments, defaults to :obj:`sys.argv`.
+
+    Returns:
+        :obj:`list` [:obj:`~yami.bench.BenchResult`]: The results.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m yami bench dispatch", description="Yami dispatcher microbenchmarks."
+    )
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument("--output", help="A file to save the JSON results to.")
+    ns = parser.parse_args(argv)
+
+    found = asyncio.run(run(scenarios=ns.scenarios, sizes=ns.sizes, messages=ns.messages))
+
+    for r in found:
+        p = r.params
+        print(
+            f"{p['scenario']:<12} {p['commands']:>6} commands  "
+            f"{r.per_second:>10.0f} msg/s  "
+            f"p50 {r.quantile(0.5) * 1e6:>8.1f}us  p99 {r.quantile(0.99) * 1e6:>8.1f}us"
+        )
+
+    if ns.output:
+        results.save_results(found, ns.output)
+
+    return found
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Memory allocation measurements for the invocation path.
+
+Uses :obj:`tracemalloc` to measure what each invocation of the
+dispatcher scenarios allocates, and checks it against a stored budget::
+
+    python -m yami.bench.memory --check tests/memory_budget.json
+    python -m yami.bench.memory --update tests/memory_budget.json
+
+With ``--update``, pass ``--runs 5`` to store the worst of five runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import sys
+import tracemalloc
+import typing
+from pathlib import Path
+
+import yami
+from yami import testing
+from yami.bench import dispatch
+
+__all__ = [
+    "MemoryResult",
+    "measure",
+    "measure_growth",
+    "load_budget",
+    "check_budget",
+    "update_budget",
+    "main",
+]
+
+_FILTERS = (tracemalloc.Filter(False, tracemalloc.__file__),)
+_reset_peak: typing.Callable[[], None] | None = getattr(tracemalloc, "reset_peak", None)
+
+
+class MemoryResult:
+    """What invocations of one scenario allocate. Each value is the
+    median over the measured invocations.
+
+    Args:
+        scenario (:obj:`str`): The scenario.
+        peak_bytes (:obj:`int`): The most memory allocated at once
+            during an invocation, including memory freed before it
+            finished.
+        live_bytes (:obj:`int`): The memory allocated by the
+            invocation that is still alive when the callback runs.
+        live_blocks (:obj:`int`): The number of allocations, roughly
+            objects, alive when the callback runs.
+    """
+
+    __slots__ = ("_scenario", "_peak_bytes", "_live_bytes", "_live_blocks")
+
+    def __init__(self, scenario: str, peak_bytes: int, live_bytes: int, live_blocks: int) -> None:
+        self._scenario = scenario
+        self._peak_bytes = peak_bytes
+        self._live_bytes = live_bytes
+        self._live_blocks = live_blocks
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._scenario!r}, {self.to_dict()})"
+
+    @property
+    def scenario(self) -> str:
+        """The scenario."""
+        return self._scenario
+
+    @property
+    def peak_bytes(self) -> int:
+        """The most memory allocated at once during an invocation."""
+        return self._peak_bytes
+
+    @property
+    def live_bytes(self) -> int:
+        """The memory alive when the callback runs."""
+        return self._live_bytes
+
+    @property
+    def live_blocks(self) -> int:
+        """The allocations alive when the callback runs."""
+        return self._live_blocks
+
+    def to_dict(self) -> dict[str, int]:
+        """Converts the result to a JSON serializable dict.
+
+        Returns:
+            :obj:`dict` [:obj:`str`, :obj:`int`]: The result.
+        """
+        return {
+            "peak_bytes": self._peak_bytes,
+            "live_bytes": self._live_bytes,
+            "live_blocks": self._live_blocks,
+        }
+
+
+async def measure(scenario: str, *, invocations: int = 200, warmup: int = 50) -> MemoryResult:
+    """Measures the allocations of a dispatcher scenario.
+
+    Args:
+        scenario (:obj:`str`): One of
+            :obj:`~yami.bench.dispatch.SCENARIOS`, except
+            ``"chatter"`` which never reaches a callback.
+
+    Keyword Args:
+        invocations (:obj:`int`): The number of invocations to measure.
+            Defaults to ``200``.
+        warmup (:obj:`int`): The number of invocations to run first.
+            Defaults to ``50``.
+
+    Returns:
+        :obj:`MemoryResult`: The result.
+    """
+    baseline: list[tracemalloc.Snapshot] = []
+    live: list[tuple[int, int]] = []
+
+    async def probe(ctx: yami.MessageContext, n: int) -> None:
+        if baseline:
+            diff = (
+                tracemalloc.take_snapshot()
+                .filter_traces(_FILTERS)
+                .compare_to(baseline[0], "filename")
+            )
+            live.append((sum(d.size_diff for d in diff), sum(d.count_diff for d in diff)))
+
+    bot = dispatch.build_bot(10, callback=probe)
+    event = testing.MessageFactory(bot).event(dispatch.CONTENT[scenario])
+    listen = bot._listen
+
+    for _ in range(warmup):
+        await listen(event)
+
+    peaks: list[int] = []
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        for _ in range(invocations):
+            if _reset_peak:
+                before = tracemalloc.get_traced_memory()[0]
+                _reset_peak()
+            else:
+                # 3.8 can only reset the peak by clearing traces.
+                before = 0
+                tracemalloc.clear_traces()
+
+            await listen(event)
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+
+        # Snapshots are slow, so only a few invocations measure live
+        # memory.
+        for _ in range(min(invocations, 20)):
+            baseline[:] = [tracemalloc.take_snapshot().filter_traces(_FILTERS)]
+            await listen(event)
+
+    finally:
+        tracemalloc.stop()
+
+    return MemoryResult(
+        scenario,
+        int(statistics.median(peaks)),
+        int(statistics.median(b for b, _ in live)),
+        int(statistics.median(c for _, c in live)),
+    )
+
+
+def _worst(a: MemoryResult, b: MemoryResult) -> MemoryResult:
+    return MemoryResult(
+        a.scenario,
+        max(a.peak_bytes, b.peak_bytes),
+        max(a.live_bytes, b.live_bytes),
+        max(a.live_blocks, b.live_blocks),
+    )
+
+
+def _gc_bytes() -> int:
+    return sum(map(sys.getsizeof, gc.get_objects()))
+
+
+async def measure_growth(
+    scenario: str = "subcommand", *, invocations: int = 100_000, warmup: int = 1_000
+) -> tuple[int, int]:
+    """Measures how much memory is retained after running many
+    invocations, which should stay close to zero.
+
+    Tracing 100k invocations is too slow, so this counts allocated
+    blocks and the size of every object tracked by the garbage
+    collector instead. That catches containers that keep growing.
+
+    Args:
+        scenario (:obj:`str`): One of
+            :obj:`~yami.bench.dispatch.SCENARIOS`. Defaults to
+            ``"subcommand"``.
+
+    Keyword Args:
+        invocations (:obj:`int`): The number of invocations. Defaults
+            to ``100_000``.
+        warmup (:obj:`int`): The number of invocations to run first.
+            Defaults to ``1_000``.
+
+    Returns:
+        :obj:`tuple` [:obj:`int`, :obj:`int`]: The number of bytes and
+        allocated blocks retained.
+    """
+    bot = dispatch.build_bot(10)
+    event = testing.MessageFactory(bot).event(dispatch.CONTENT[scenario])
+    listen = bot._listen
+
+    for _ in range(warmup):
+        await listen(event)
+
+    gc.collect()
+    size, blocks = _gc_bytes(), sys.getallocatedblocks()
+
+    for _ in range(invocations):
+        await listen(event)
+
+    gc.collect()
+    return _gc_bytes() - size, sys.getallocatedblocks() - blocks
+
+
+def _budget_key() -> str:
+    return f"{platform.python_implementation()}-{sys.version_info[0]}.{sys.version_info[1]}"
+
+
+def load_budget(path: str | Path) -> dict[str, dict[str, int]] | None:
+    """Loads the budget for the running Python version.
+
+    Args:
+        path (:obj:`str` | :obj:`~pathlib.Path`): The budget file.
+
+    Returns:
+        :obj:`dict` [:obj:`str`, :obj:`dict` [:obj:`str`, \
+        :obj:`int`]] | :obj:`None`: The budget by scenario, or
+        :obj:`None` if there is no budget for this version.
+    """
+    with open(path) as f:
+        budgets: dict[str, typing.Any] = json.load(f)
+
+    return budgets.get(_budget_key())
+
+
+def check_budget(
+    results: typing.Iterable[MemoryResult],
+    budget: dict[str, dict[str, int]],
+    *,
+    tolerance: float = 0.1,
+) -> list[str]:
+    """Checks results against a budget.
+
+    Args:
+        results (:obj:`~typing.Iterable` [:obj:`MemoryResult`]): The
+            results to check.
+        budget (:obj:`dict` [:obj:`str`, :obj:`dict` [:obj:`str`, \
+            :obj:`int`]]): The budget by scenario.
+
+    Keyword Args:
+        tolerance (:obj:`float`): How far over budget a value can be,
+            as a fraction. Defaults to ``0.1``.
+
+    Returns:
+        :obj:`list` [:obj:`str`]: A description of each value over
+        budget.
+    """
+    over: list[str] = []
+
+    for result in results:
+        allowed = budget.get(result.scenario, {})
+
+        for key, value in result.to_dict().items():
+            if key in allowed and value > allowed[key] * (1 + tolerance):
+                over.append(f"{result.scenario} {key}: {value} > budget {allowed[key]}")
+
+    return over
+
+
+def update_budget(results: typing.Iterable[MemoryResult], path: str | Path) -> None:
+    """Stores results as the budget for the running Python version.
+
+    Args:
+        results (:obj:`~typing.Iterable` [:obj:`MemoryResult`]): The
+            results to store.
+        path (:obj:`str` | :obj:`~pathlib.Path`): The budget file.
+    """
+    path = Path(path)
+    budgets = json.loads(path.read_text()) if path.exists() else {}
+    budgets[_budget_key()] = {r.scenario: r.to_dict() for r in results}
+    path.write_text(json.dumps(budgets, indent=2, sort_keys=True) + "\n")
+
+
+def main(argv: typing.Sequence[str] | None = None) -> int:
+    """Measures the scenarios from the command line.
+
+    Args:
+        argv (:obj:`~typing.Sequence` [:obj:`str`] | :obj:`None`):
+            The arguments, defaults to :obj:`sys.argv`.
+
+    Returns:
+        :obj:`int`: The exit code, ``1`` if over budget.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m yami bench memory", description="Yami invocation memory measurements."
+    )
+    parser.add_argument("--check", help="A budget file to check the results against.")
+    parser.add_argument("--update", help="A budget file to store the results in.")
+    parser.add_argument("--growth", type=int, default=0, help="Invocations to check growth over.")
+    parser.add_argument(
+        "--runs", type=int, default=1, help="Runs to measure, keeping the worst of each value."
+    )
+    ns = parser.parse_args(argv)
+
+    async def run() -> list[MemoryResult]:
+        return [await measure(s) for s in dispatch.SCENARIOS if s != "chatter"]
+
+    found = asyncio.run(run())
+
+    # Live block counts vary by one or two between runs, so budgets
+    # should be stored from the worst of a few.
+    for _ in range(ns.runs - 1):
+        found = [_worst(a, b) for a, b in zip(found, asyncio.run(run()))]
+
+    for r in found:
+        print(f"{r.scenario:<12} {r.to_dict()}")
+
+    if ns.growth:
+        size, blocks = asyncio.run(measure_growth(invocations=ns.growth))
+        print(f"retained {size} bytes in {blocks} blocks over {ns.growth} invocations")
+
+    if ns.update:
+        update_budget(found, ns.update)
+
+    if ns.check and (budget := load_budget(ns.check)):
+        for line in (over := check_budget(found, budget)):
+            print(f"over budget: {line}")
+
+        return 1 if over else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Offline profiling of synthetic invocations.
+
+Loads a module tree into an offline bot, then profiles invocations of
+every command with generated arguments::
+
+    python -m yami profile ./modules --output yami.pstats
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import cProfile
+import pstats
+import typing
+
+import yami
+from yami import converters, testing
+
+__all__ = ["iter_all_commands", "sample_content", "profile_invocations", "main"]
+
+_SAMPLES: dict[typing.Any, str] = {bool: "true", int: "1", float: "1.5", complex: "1"}
+
+
+def iter_all_commands(bot: yami.Bot) -> typing.Generator[yami.MessageCommand, None, None]:
+    """Iterates every command on the bot, including subcommands at any
+    depth, parents before their children.
+
+    Args:
+        bot (:obj:`~yami.Bot`): The bot.
+
+    Yields:
+        :obj:`~yami.MessageCommand`: Each command.
+    """
+    stack = [*bot.iter_commands()][::-1]
+
+    while stack:
+        cmd = stack.pop()
+        yield cmd
+        stack.extend([*cmd.iter_subcommands()][::-1])
+
+
+def sample_content(command: yami.MessageCommand, prefix: str = "!") -> str:
+    """Builds a message that invokes the command, with a sample value
+    for each required argument.
+
+    Args:
+        command (:obj:`~yami.MessageCommand`): The command.
+        prefix (:obj:`str`): The prefix to use. Defaults to ``"!"``.
+
+    Returns:
+        :obj:`str`: The message content.
+    """
+    plan = command._get_plan()
+    tokens = [prefix + command.qualified_name]
+
+    for param in plan.positional[: plan.min_args]:
+        if param.annotation in _SAMPLES:
+            tokens.append(_SAMPLES[param.annotation])
+        elif param.annotation in converters.HIKARI_CAN_CONVERT:
+            # Snowflakes are served by the fake state.
+            tokens.append("1")
+        else:
+            tokens.append("x")
+
+    if plan.greedy and plan.greedy.default is plan.greedy.empty:
+        tokens.append("x")
+
+    return " ".join(tokens)
+
+
+async def profile_invocations(
+    bot: yami.Bot,
+    *,
+    invocations: int = 100,
+    names: typing.Iterable[str] | None = None,
+) -> tuple[cProfile.Profile, dict[str, int]]:
+    """Profiles invocations of the bots commands.
+
+    Args:
+        bot (:obj:`~yami.Bot`): The bot, it should already be offline.
+
+    Keyword Args:
+        invocations (:obj:`int`): The number of times to invoke each
+            command. Defaults to ``100``.
+        names (:obj:`~typing.Iterable` [:obj:`str`] | :obj:`None`):
+            The qualified names of the commands to invoke. Defaults to
+            all of them.
+
+    Returns:
+        :obj:`tuple` [:obj:`cProfile.Profile`, :obj:`dict` \
+        [:obj:`str`, :obj:`int`]]: The profile, and the number of
+        failed invocations by command.
+    """
+    wanted = set(names) if names is not None else None
+    prefix = bot._prefix[0]
+    factory = testing.MessageFactory(bot)
+    commands = [c for c in iter_all_commands(bot) if wanted is None or c.qualified_name in wanted]
+    events = [factory.event(sample_content(c, prefix)) for c in commands]
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    try:
+        for _ in range(invocations):
+            for event in events:
+                await bot._listen(event)
+    finally:
+        profiler.disable()
+
+    failures = {
+        name: stats.failures + stats.check_failures
+        for name, stats in bot.metrics.commands.items()
+        if stats.failures + stats.check_failures
+    }
+
+    return profiler, failures
+
+
+def main(argv: typing.Sequence[str] | None = None) -> pstats.Stats:
+    """Profiles a module tree from the command line.
+
+    Args:
+        argv (:obj:`~typing.Sequence` [:obj:`str`] | :obj:`None`):
+            The arguments, defaults to :obj:`sys.argv`.
+
+    Returns:
+        :obj:`pstats.Stats`: The profile statistics.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m yami profile", description="Profile synthetic invocations offline."
+    )
+    parser.add_argument("paths", nargs="+", help="Directories of modules to load.")
+    parser.add_argument("--command", action="append", dest="names", help="Only this command.")
+    parser.add_argument("--invocations", type=int, default=100)
+    parser.add_argument("--prefix", default="!")
+    parser.add_argument("--sort", default="cumulative")
+    parser.add_argument("--limit", type=int, default=30)
+    parser.add_argument("--output", help="A file to dump the pstats to.")
+    ns = parser.parse_args(argv)
+
+    bot = yami.Bot("12345", ns.prefix, banner=None)
+    testing.make_offline(bot, autocreate=True)
+    bot.load_all_modules(*ns.paths)
+
+    profiler, failures = asyncio.run(
+        profile_invocations(bot, invocations=ns.invocations, names=ns.names)
+    )
+
+    for name, count in failures.items():
+        print(f"{name!r} failed {count} times")
+
+    stats = pstats.Stats(profiler).strip_dirs().sort_stats(ns.sort)
+    stats.print_stats(ns.limit)
+
+    if ns.output:
+        stats.dump_stats(ns.output)
+
+    return stats
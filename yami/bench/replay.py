@@ -0,0 +1,370 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Workload replay harness.
+
+Feeds a stream of messages into a bot at a target rate, either replayed
+from a JSONL log or generated with Zipf distributed commands, guilds
+and users, against a :obj:`~yami.testing.FakeREST` backend::
+
+    python -m yami.bench.replay --messages 20000 --rate 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+import typing
+from pathlib import Path
+
+import yami
+from yami import testing
+from yami.bench import results
+
+__all__ = [
+    "WorkloadMessage",
+    "ZipfSampler",
+    "zipf_workload",
+    "load_jsonl",
+    "build_bot",
+    "replay",
+    "main",
+]
+
+WorkloadMessage = typing.Dict[str, typing.Any]
+"""A message in a workload. It has a ``content`` key, and optionally
+``guild_id`` (:obj:`None` for DMs), ``channel_id``, ``author_id``
+and ``t``, the offset in seconds from the start of the log it should
+be sent at.
+"""
+
+DEFAULT_CONTENT = (
+    "!ping",
+    "hello there, how is everyone doing today?",
+    "!echo some text to send right back",
+    "!dice 6",
+    "!whois",
+    "lol",
+    "!config exp on",
+)
+"""The default message contents, most frequent first."""
+
+
+class ZipfSampler:
+    """Samples ranks from a Zipf distribution, where rank ``k`` has a
+    weight of ``1 / k ** s``.
+
+    Args:
+        n (:obj:`int`): The number of ranks.
+
+    Keyword Args:
+        s (:obj:`float`): The exponent. Defaults to ``1.1``.
+        rng (:obj:`random.Random` | :obj:`None`): The random number
+            generator to use. Defaults to a new unseeded one.
+    """
+
+    __slots__ = ("_n", "_cum_weights", "_rng", "_population")
+
+    def __init__(self, n: int, *, s: float = 1.1, rng: random.Random | None = None) -> None:
+        self._n = n
+        self._rng = rng or random.Random()
+        self._population = range(n)
+        self._cum_weights = list(itertools.accumulate(1 / k**s for k in range(1, n + 1)))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._n})"
+
+    def sample(self, k: int = 1) -> list[int]:
+        """Samples ranks, starting from ``0``.
+
+        Args:
+            k (:obj:`int`): The number of samples. Defaults to ``1``.
+
+        Returns:
+            :obj:`list` [:obj:`int`]: The sampled ranks.
+        """
+        return self._rng.choices(self._population, cum_weights=self._cum_weights, k=k)
+
+
+def zipf_workload(
+    messages: int,
+    *,
+    content: typing.Sequence[str] = DEFAULT_CONTENT,
+    guilds: int = 100,
+    users: int = 10_000,
+    s: float = 1.1,
+    dm_ratio: float = 0.05,
+    seed: int | None = None,
+) -> list[WorkloadMessage]:
+    """Generates a synthetic workload, with Zipf distributed content,
+    guilds and users.
+
+    Args:
+        messages (:obj:`int`): The number of messages.
+
+    Keyword Args:
+        content (:obj:`~typing.Sequence` [:obj:`str`]): The message
+            contents to sample, most frequent first. Defaults to
+            :obj:`DEFAULT_CONTENT`.
+        guilds (:obj:`int`): The number of guilds. Defaults to ``100``.
+        users (:obj:`int`): The number of users. Defaults to
+            ``10_000``.
+        s (:obj:`float`): The Zipf exponent. Defaults to ``1.1``.
+        dm_ratio (:obj:`float`): The fraction of messages sent in DMs.
+            Defaults to ``0.05``.
+        seed (:obj:`int` | :obj:`None`): Seeds the generator, for
+            reproducible workloads. Defaults to :obj:`None`.
+
+    Returns:
+        :obj:`list` [:obj:`WorkloadMessage`]: The workload.
+    """
+    rng = random.Random(seed)
+    contents = ZipfSampler(len(content), s=s, rng=rng).sample(messages)
+    guild_ids = ZipfSampler(guilds, s=s, rng=rng).sample(messages)
+    author_ids = ZipfSampler(users, s=s, rng=rng).sample(messages)
+
+    return [
+        {
+            "content": content[c],
+            "guild_id": None if rng.random() < dm_ratio else 10_000 + g,
+            "channel_id": 20_000 + g,
+            "author_id": 30_000 + a,
+        }
+        for c, g, a in zip(contents, guild_ids, author_ids)
+    ]
+
+
+def load_jsonl(path: str | Path) -> list[WorkloadMessage]:
+    """Loads a workload from a JSONL log, one message per line.
+
+    Args:
+        path (:obj:`str` | :obj:`~pathlib.Path`): The log.
+
+    Returns:
+        :obj:`list` [:obj:`WorkloadMessage`]: The workload.
+    """
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def build_bot(*, latency: float = 0.0) -> yami.Bot:
+    """Builds a bot with a few typical commands, running offline
+    against an empty :obj:`~yami.testing.FakeCache` and a
+    :obj:`~yami.testing.FakeREST` that creates entities on demand.
+
+    Keyword Args:
+        latency (:obj:`float`): Seconds each REST call takes. Defaults
+            to ``0.0``.
+
+    Returns:
+        :obj:`~yami.Bot`: The bot.
+    """
+    bot = yami.Bot("12345", "!", banner=None, allow_extra_args=True)
+    testing.make_offline(bot, latency=latency, autocreate=True)
+
+    @bot.command()
+    async def ping(ctx: yami.MessageContext) -> None:
+        await ctx.respond("pong")
+
+    @bot.command()
+    async def echo(ctx: yami.MessageContext, *, text: str) -> None:
+        await ctx.respond(text)
+
+    @bot.command()
+    async def dice(ctx: yami.MessageContext, sides: int = 6) -> None:
+        random.randint(1, sides)
+
+    @yami.is_in_guild()
+    @bot.command()
+    async def whois(ctx: yami.MessageContext) -> None:
+        await ctx.getch_member()
+
+    @bot.command()
+    async def config(ctx: yami.MessageContext) -> None:
+        ...
+
+    @config.subcommand()
+    async def exp(ctx: yami.MessageContext) -> None:
+        ...
+
+    @exp.subcommand()
+    async def on(ctx: yami.MessageContext) -> None:
+        await ctx.respond("Experience is on.")
+
+    return bot
+
+
+async def _lag_monitor(samples: list[float], interval: float) -> None:
+    loop = asyncio.get_running_loop()
+
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+async def replay(
+    bot: yami.Bot,
+    workload: typing.Sequence[WorkloadMessage],
+    *,
+    rate: float | None = 1000.0,
+    lag_interval: float = 0.001,
+) -> results.BenchResult:
+    """Replays a workload into the bot.
+
+    Messages are sent at the target rate, or at their ``t`` offsets if
+    the rate is :obj:`None`. Each one is dispatched in its own task, so
+    slow invocations overlap like they would on the gateway. The latency
+    of a message is measured from when it was due, to when its
+    invocation finished.
+
+    Args:
+        bot (:obj:`~yami.Bot`): The bot to replay into.
+        workload (:obj:`~typing.Sequence` [:obj:`WorkloadMessage`]):
+            The messages.
+
+    Keyword Args:
+        rate (:obj:`float` | :obj:`None`): Messages per second, or
+            :obj:`None` to use the workloads offsets. Defaults to
+            ``1000.0``.
+        lag_interval (:obj:`float`): How often to sample event loop
+            lag, in seconds. Defaults to ``0.001``.
+
+    Returns:
+        :obj:`~yami.bench.BenchResult`: The result, with the event loop
+        lag and REST calls as extra measurements.
+    """
+    factory = testing.MessageFactory(bot)
+    events = [
+        factory.event(
+            m["content"],
+            guild_id=m.get("guild_id"),
+            channel_id=m.get("channel_id"),
+            author_id=m.get("author_id"),
+        )
+        for m in workload
+    ]
+    offsets = [i / rate if rate else float(m.get("t", 0.0)) for i, m in enumerate(workload)]
+
+    # make_offline swaps in the fake, hikari's typing does not know it.
+    rest: object = bot._rest
+    fake = rest if isinstance(rest, testing.FakeREST) else None
+    calls_before: dict[str, int] = dict(fake.calls) if fake else {}
+    latencies: list[float] = []
+    lag: list[float] = []
+    clock = time.perf_counter
+    listen = bot._listen
+
+    async def send(event: typing.Any, due: float) -> None:
+        await listen(event)
+        latencies.append(clock() - due)
+
+    monitor = asyncio.create_task(_lag_monitor(lag, lag_interval))
+    tasks: set[asyncio.Task[None]] = set()
+    start = clock()
+
+    for event, offset in zip(events, offsets):
+        due = start + offset
+
+        if (delay := due - clock()) > 0:
+            await asyncio.sleep(delay)
+
+        task = asyncio.create_task(send(event, due))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    if tasks:
+        await asyncio.wait(tasks)
+
+    seconds = clock() - start
+    monitor.cancel()
+    lag.sort()
+    calls: dict[str, int] = (
+        {r: n - calls_before.get(r, 0) for r, n in fake.calls.items()} if fake else {}
+    )
+
+    return results.BenchResult(
+        "replay",
+        {"messages": len(events), "rate": rate},
+        seconds,
+        latencies,
+        extra={
+            "loop_lag": {
+                "p50": results.percentile(lag, 0.5),
+                "p99": results.percentile(lag, 0.99),
+                "max": lag[-1] if lag else 0.0,
+            },
+            "rest_calls": sum(calls.values()) if fake else None,
+            "rest_calls_by_route": calls if fake else None,
+        },
+    )
+
+
+def main(argv: typing.Sequence[str] | None = None) -> results.BenchResult:
+    """Runs the replay harness from the command line.
+
+    Args:
+        argv (:obj:`~typing.Sequence` [:obj:`str`] | :obj:`None`):
+            The arguments, defaults to :obj:`sys.argv`.
+
+    Returns:
+        :obj:`~yami.bench.BenchResult`: The result.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m yami bench replay", description="Yami workload replay harness."
+    )
+    parser.add_argument("--log", help="A JSONL log to replay instead of a synthetic workload.")
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument("--rate", type=float, default=1000.0)
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake REST latency.")
+    parser.add_argument("--zipf", type=float, default=1.1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--use-offsets", action="store_true", help="Use the logs offsets.")
+    parser.add_argument("--output", help="A file to save the JSON results to.")
+    ns = parser.parse_args(argv)
+
+    if ns.log:
+        workload = load_jsonl(ns.log)
+    else:
+        workload = zipf_workload(ns.messages, s=ns.zipf, seed=ns.seed)
+
+    async def run() -> results.BenchResult:
+        bot = build_bot(latency=ns.latency)
+        return await replay(bot, workload, rate=None if ns.use_offsets else ns.rate)
+
+    result = asyncio.run(run())
+    data = result.to_dict()
+    lat = data["latency"]
+    print(
+        f"{result.count} messages in {result.seconds:.2f}s ({result.per_second:.0f} msg/s)\n"
+        f"latency p50 {lat['p50'] * 1e3:.2f}ms  p99 {lat['p99'] * 1e3:.2f}ms  "
+        f"p999 {lat['p999'] * 1e3:.2f}ms\n"
+        f"loop lag p99 {data['loop_lag']['p99'] * 1e3:.2f}ms  "
+        f"max {data['loop_lag']['max'] * 1e3:.2f}ms\n"
+        f"rest calls {data['rest_calls']} {data['rest_calls_by_route']}"
+    )
+
+    if ns.output:
+        results.save_results([result], ns.output)
+
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module containing benchmark results and their serialization."""
+
+from __future__ import annotations
+
+import datetime
+import json
+import platform
+import typing
+from pathlib import Path
+
+import yami
+
+__all__ = ["BenchResult", "percentile", "save_results"]
+
+
+def percentile(values: typing.Sequence[float], q: float) -> float:
+    """Gets a percentile using the nearest rank method.
+
+    Args:
+        values (:obj:`~typing.Sequence` [:obj:`float`]): The values,
+            sorted ascending.
+        q (:obj:`float`): The percentile, between ``0`` and ``1``.
+
+    Returns:
+        :obj:`float`: The percentile, or ``0.0`` if there are no
+        values.
+    """
+    if not values:
+        return 0.0
+
+    return values[min(len(values) - 1, max(0, int(q * len(values) + 0.5) - 1))]
+
+
+class BenchResult:
+    """The result of a single benchmark run.
+
+    Args:
+        name (:obj:`str`): The name of the benchmark.
+        params (:obj:`dict` [:obj:`str`, :obj:`~typing.Any`]): The
+            parameters it was run with.
+        seconds (:obj:`float`): The total wall time of the run.
+        latencies (:obj:`list` [:obj:`float`]): The latency of each
+            operation in seconds.
+
+    Keyword Args:
+        extra (:obj:`dict` [:obj:`str`, :obj:`~typing.Any`]): Any
+            other measurements to include in the results.
+    """
+
+    __slots__ = ("_name", "_params", "_seconds", "_latencies", "_extra")
+
+    def __init__(
+        self,
+        name: str,
+        params: dict[str, typing.Any],
+        seconds: float,
+        latencies: list[float],
+        *,
+        extra: dict[str, typing.Any] | None = None,
+    ) -> None:
+        self._name = name
+        self._params = params
+        self._seconds = seconds
+        self._latencies = sorted(latencies)
+        self._extra = extra or {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self._name!r}, {self._params}, "
+            f"per_second={self.per_second:.0f}, p99={self.quantile(0.99):.9f})"
+        )
+
+    @property
+    def name(self) -> str:
+        """The name of the benchmark."""
+        return self._name
+
+    @property
+    def params(self) -> dict[str, typing.Any]:
+        """The parameters the benchmark was run with."""
+        return self._params
+
+    @property
+    def seconds(self) -> float:
+        """The total wall time of the run."""
+        return self._seconds
+
+    @property
+    def count(self) -> int:
+        """The number of operations measured."""
+        return len(self._latencies)
+
+    @property
+    def per_second(self) -> float:
+        """The number of operations per second."""
+        return self.count / self._seconds if self._seconds else 0.0
+
+    @property
+    def extra(self) -> dict[str, typing.Any]:
+        """Any other measurements included in the results."""
+        return self._extra
+
+    def quantile(self, q: float) -> float:
+        """Gets a latency quantile in seconds.
+
+        Args:
+            q (:obj:`float`): The quantile, between ``0`` and ``1``.
+
+        Returns:
+            :obj:`float`: The latency.
+        """
+        return percentile(self._latencies, q)
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        """Converts the result to a JSON serializable dict.
+
+        Returns:
+            :obj:`dict` [:obj:`str`, :obj:`~typing.Any`]: The result.
+        """
+        count = self.count
+
+        return {
+            "name": self._name,
+            "params": self._params,
+            "count": count,
+            "seconds": self._seconds,
+            "per_second": self.per_second,
+            "latency": {
+                "mean": sum(self._latencies) / count if count else 0.0,
+                "p50": self.quantile(0.5),
+                "p99": self.quantile(0.99),
+                "p999": self.quantile(0.999),
+                "max": self._latencies[-1] if count else 0.0,
+            },
+            **self._extra,
+        }
+
+
+def save_results(results: typing.Iterable[BenchResult], path: str | Path) -> None:
+    """Saves results as JSON, along with the environment they were
+    measured in, so runs can be compared.
+
+    Args:
+        results (:obj:`~typing.Iterable` [:obj:`BenchResult`]): The
+            results to save.
+        path (:obj:`str` | :obj:`~pathlib.Path`): The file to write.
+    """
+    data = {
+        "yami": yami.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "results": [r.to_dict() for r in results],
+    }
+
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
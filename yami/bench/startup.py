@@ -0,0 +1,262 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Startup time benchmark.
+
+Generates a synthetic module tree and times constructing the bot,
+loading the tree and importing Yami, with a breakdown by phase::
+
+    python -m yami.bench.startup --files 300 --commands 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+import typing
+from pathlib import Path
+
+import yami
+
+__all__ = ["PHASES", "generate_tree", "run", "main"]
+
+PHASES = ("discovery", "import", "instantiation", "registration")
+"""The phases of loading a module tree."""
+
+_PACKAGE = "yami_startup_bench"
+
+
+def generate_tree(root: str | Path, files: int, commands: int, subcommands: int) -> Path:
+    """Generates a package of modules, each file holding one
+    :obj:`~yami.Module` with the given number of commands, and each
+    command the given number of subcommands.
+
+    Args:
+        root (:obj:`str` | :obj:`~pathlib.Path`): The directory to
+            generate the package in.
+        files (:obj:`int`): The number of files.
+        commands (:obj:`int`): The number of commands per file.
+        subcommands (:obj:`int`): The number of subcommands per command.
+
+    Returns:
+        :obj:`~pathlib.Path`: The package directory.
+    """
+    package = Path(root) / _PACKAGE
+    package.mkdir(parents=True, exist_ok=True)
+    (package / "__init__.py").write_text("")
+
+    for i in range(files):
+        lines = ["import yami", "", "", f"class Module{i}(yami.Module):"]
+
+        for j in range(commands):
+            name = f"m{i}c{j}"
+            lines.append(
+                textwrap.indent(
+                    f'@yami.command("{name}", aliases=["m{i}a{j}"])\n'
+                    f"async def {name}(self, ctx: yami.MessageContext, n: int) -> None:\n"
+                    f'    """Command {j} of module {i}."""\n',
+                    "    ",
+                )
+            )
+
+            for k in range(subcommands):
+                lines.append(
+                    textwrap.indent(
+                        f'@{name}.subcommand("s{k}")\n'
+                        f"async def {name}s{k}(self, ctx: yami.MessageContext) -> None:\n"
+                        f"    ...\n",
+                        "    ",
+                    )
+                )
+
+        if not commands:
+            lines.append("    ...")
+
+        (package / f"module{i}.py").write_text("\n".join(lines) + "\n")
+
+    return package
+
+
+@contextlib.contextmanager
+def _importable(root: Path) -> typing.Generator[None, None, None]:
+    """Makes the generated package importable by relative path, the
+    way :obj:`~yami.Bot.load_all_modules` imports, and forgets it
+    afterwards so every run imports it again.
+    """
+    cwd = os.getcwd()
+    os.chdir(root)
+    sys.path.insert(0, str(root))
+    importlib.invalidate_caches()
+
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+        sys.path.remove(str(root))
+
+        for name in [m for m in sys.modules if m.split(".")[0] == _PACKAGE]:
+            del sys.modules[name]
+
+
+def _new_bot() -> yami.Bot:
+    return yami.Bot("12345", "!", banner=None)
+
+
+def _phases(root: Path) -> dict[str, float]:
+    """Loads the tree with the same steps as load_all_modules, timing
+    each one.
+    """
+    bot = _new_bot()
+    times = dict.fromkeys(PHASES, 0.0)
+
+    with _importable(root):
+        now = time.perf_counter()
+        files = [*Path(_PACKAGE).rglob("[!_]*.py")]
+        times["discovery"] += time.perf_counter() - now
+
+        for file in files:
+            now = time.perf_counter()
+            found = bot._get_modules_from_container(file, bot.modules.copy())
+            times["import"] += time.perf_counter() - now
+
+            for mod in found:
+                now = time.perf_counter()
+                instantiated = mod(bot)
+                times["instantiation"] += time.perf_counter() - now
+
+                now = time.perf_counter()
+                bot._add_module(instantiated)
+                times["registration"] += time.perf_counter() - now
+
+    return times
+
+
+def _time(func: typing.Callable[[], typing.Any]) -> float:
+    now = time.perf_counter()
+    func()
+    return time.perf_counter() - now
+
+
+def _import_time() -> float:
+    """Times ``import yami`` in a fresh interpreter."""
+    code = "import time; s = time.perf_counter(); import yami; print(time.perf_counter() - s)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return float(out)
+
+
+def run(
+    *, files: int = 300, commands: int = 5, subcommands: int = 2, repeat: int = 5
+) -> dict[str, typing.Any]:
+    """Runs the startup benchmark. Each timing is the median of the
+    repeats, in seconds.
+
+    Keyword Args:
+        files (:obj:`int`): The number of module files. Defaults to
+            ``300``.
+        commands (:obj:`int`): The number of commands per file.
+            Defaults to ``5``.
+        subcommands (:obj:`int`): The number of subcommands per
+            command. Defaults to ``2``.
+        repeat (:obj:`int`): The number of times to repeat each
+            measurement. Defaults to ``5``.
+
+    Returns:
+        :obj:`dict` [:obj:`str`, :obj:`~typing.Any`]: The results.
+    """
+    root = Path(tempfile.mkdtemp(prefix="yami-startup-"))
+
+    try:
+        generate_tree(root, files, commands, subcommands)
+
+        # The first load compiles the tree, the rest use the bytecode.
+        with _importable(root):
+            _new_bot().load_all_modules(_PACKAGE)
+
+        def load_all() -> float:
+            bot = _new_bot()
+
+            with _importable(root):
+                return _time(lambda: bot.load_all_modules(_PACKAGE))
+
+        def load_one() -> float:
+            bot = _new_bot()
+
+            with _importable(root):
+                return _time(lambda: bot.load_module("Module0", f"{_PACKAGE}/module0.py"))
+
+        phases = [_phases(root) for _ in range(repeat)]
+
+        return {
+            "params": {"files": files, "commands": commands, "subcommands": subcommands},
+            "import_yami": statistics.median(_import_time() for _ in range(repeat)),
+            "bot_init": statistics.median(_time(_new_bot) for _ in range(repeat)),
+            "load_all_modules": statistics.median(load_all() for _ in range(repeat)),
+            "load_module": statistics.median(load_one() for _ in range(repeat)),
+            "phases": {p: statistics.median(t[p] for t in phases) for p in PHASES},
+        }
+
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main(argv: typing.Sequence[str] | None = None) -> dict[str, typing.Any]:
+    """Runs the startup benchmark from the command line.
+
+    Args:
+        argv (:obj:`~typing.Sequence` [:obj:`str`] | :obj:`None`):
+            The arguments, defaults to :obj:`sys.argv`.
+
+    Returns:
+        :obj:`dict` [:obj:`str`, :obj:`~typing.Any`]: The results.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m yami bench startup", description="Yami startup time benchmark."
+    )
+    parser.add_argument("--files", type=int, default=300)
+    parser.add_argument("--commands", type=int, default=5)
+    parser.add_argument("--subcommands", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="A file to save the JSON results to.")
+    ns = parser.parse_args(argv)
+
+    found = run(files=ns.files, commands=ns.commands, subcommands=ns.subcommands, repeat=ns.repeat)
+
+    for key in ("import_yami", "bot_init", "load_all_modules", "load_module"):
+        print(f"{key:<18} {found[key] * 1e3:>10.2f}ms")
+
+    for phase, seconds in found["phases"].items():
+        print(f"  {phase:<16} {seconds * 1e3:>10.2f}ms")
+
+    if ns.output:
+        with open(ns.output, "w") as f:
+            json.dump(found, f, indent=2)
+
+    return found
+
+
+if __name__ == "__main__":
+    main()
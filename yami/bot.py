@@ -17,24 +17,70 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import contextvars
+import functools
 import importlib
 import inspect
 import logging
 import os
+import pickle
+import time
 import typing
+from concurrent import futures
 from pathlib import Path
 
 import hikari
 
 from yami import args as args_
 from yami import commands as commands_
-from yami import context, events, exceptions
+from yami import context, converters, events, exceptions, metrics
 from yami import modules as modules_
-from yami import utils
+from yami import profiling
+from yami import rest as rest_
+from yami import scheduler as scheduler_
+from yami import tracing, utils
+from yami import watchdog as watchdog_
 
 __all__ = ["Bot"]
 
 _log = logging.getLogger(__name__)
+_NOOP: typing.ContextManager[None] = contextlib.nullcontext()
+
+
+def _warm() -> None:
+    """Runs in the process pool, to start a process."""
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_callback(module: str, qualname: str) -> typing.Callable[..., typing.Any]:
+    """Runs in the process pool, importing a callback by name. The name
+    usually refers to the command the callback was decorated into.
+    """
+    target: typing.Any = importlib.import_module(module)
+
+    for attr in qualname.split("."):
+        target = getattr(target, attr)
+
+    if isinstance(target, commands_.MessageCommand):
+        return target.callback
+
+    return typing.cast(typing.Callable[..., typing.Any], target)
+
+
+def _run_pickled(payload: bytes) -> tuple[float, typing.Any]:
+    """Runs in the process pool, calling a callback by name."""
+    started = time.time()
+    (module, qualname), args, kwargs = pickle.loads(payload)
+    return started, _resolve_callback(module, qualname)(*args, **kwargs)
+
+
+def _has_cpu_bound(commands: typing.Iterable[commands_.MessageCommand]) -> bool:
+    """Whether or not any of the commands, or their subcommands, are
+    cpu bound.
+    """
+    return any(c.cpu_bound or _has_cpu_bound(c.subcommands.values()) for c in commands)
 
 
 class Bot(hikari.GatewayBot):
@@ -71,6 +117,43 @@ class Bot(hikari.GatewayBot):
         raise_cmd_not_found (:obj:`bool`): Whether or not to raise the
             :obj:`~yami.CommandNotFound` exception. Defaults to
             :obj:`False`.
+        limits (:obj:`~yami.ParseLimits` | :obj:`None`): Limits on the
+            size of messages the bot will parse. Defaults to
+            :obj:`None`.
+        tracer (:obj:`~yami.Tracer` | :obj:`None`): Traces each stage
+            of every invocation when set. Defaults to :obj:`None`.
+        watchdog (:obj:`~yami.Watchdog` | :obj:`None`): Measures the
+            event loop lag, and reports slow invocations when set.
+            Defaults to :obj:`None`.
+        count_rest (:obj:`bool`): Whether or not to count the REST calls
+            made by each invocation, see :obj:`~yami.RESTUsage`. This is
+            enabled automatically for commands with a
+            :obj:`~yami.RESTBudget`, or when tracing. Defaults to
+            :obj:`False`.
+        log_every (:obj:`int`): Log the outcome of 1 in every this many
+            invocations at the debug level. Defaults to ``1``.
+        scheduler (:obj:`~yami.Scheduler` | :obj:`None`): Queues
+            invocations, bounding how many run at once when set.
+            Defaults to :obj:`None`.
+        command_timeout (:obj:`float` | :obj:`None`): The default number
+            of seconds a command callback can run before it is
+            cancelled. Synchronous and ``cpu_bound`` callbacks can not
+            be interrupted, the invocation stops waiting for them but
+            they run to completion. Defaults to :obj:`None`, which never
+            cancels.
+        thread_pool_size (:obj:`int`): The number of threads that run
+            synchronous command callbacks. The pool is only created
+            when one is invoked. Defaults to ``4``.
+        process_pool_size (:obj:`int` | :obj:`None`): The number of
+            processes that run ``cpu_bound`` command callbacks. The pool
+            is started, and warmed up, when the bot starts if there are
+            any. Defaults to :obj:`None`, which is the number of CPUs.
+        max_payload_size (:obj:`int`): The maximum size, in bytes, of
+            the pickled arguments sent to the process pool. Defaults to
+            1 MiB.
+        drain_timeout (:obj:`float`): The number of seconds to wait for
+            in-flight invocations to finish when the bot is stopping,
+            before cancelling them. Defaults to ``10.0``.
         **kwargs (:obj:`~typing.Any`): The remaining kwargs for
             :obj:`~hikari.impl.bot.GatewayBot`.
     """
@@ -85,6 +168,26 @@ class Bot(hikari.GatewayBot):
         "_allow_extra_args",
         "_shared",
         "_raise_cmd_not_found",
+        "_limits",
+        "_has_command_limits",
+        "_metrics",
+        "_is_ready",
+        "_tracer",
+        "_instrumented_rest",
+        "_profilers",
+        "_watchdog",
+        "_invocation_log",
+        "_scheduler",
+        "_serializer",
+        "_command_timeout",
+        "_thread_pool_size",
+        "_thread_pool",
+        "_process_pool_size",
+        "_process_pool",
+        "_max_payload_size",
+        "_drain_timeout",
+        "_in_flight",
+        "_is_stopping",
     )
 
     def __init__(
@@ -95,6 +198,17 @@ class Bot(hikari.GatewayBot):
         owner_ids: typing.Sequence[int] = (),
         allow_extra_args: bool = False,
         raise_cmd_not_found: bool = False,
+        limits: args_.ParseLimits | None = None,
+        tracer: tracing.Tracer | None = None,
+        watchdog: watchdog_.Watchdog | None = None,
+        count_rest: bool = False,
+        log_every: int = 1,
+        scheduler: scheduler_.Scheduler | None = None,
+        command_timeout: float | None = None,
+        thread_pool_size: int = 4,
+        process_pool_size: int | None = None,
+        max_payload_size: int = 1_048_576,
+        drain_timeout: float = 10.0,
         **kwargs: typing.Any,
     ) -> None:
         super().__init__(token, **kwargs)
@@ -107,13 +221,48 @@ class Bot(hikari.GatewayBot):
         self._modules: dict[str, modules_.Module] = {}
         self._owner_ids = tuple(owner_ids)
         self._shared = utils.Shared()
-
-        _log.debug(f"Initializing {self}")
+        self._limits = limits
+        self._has_command_limits = False
+        self._metrics = metrics.Metrics()
+        self._is_ready = False
+        self._tracer = tracer
+        self._instrumented_rest = (
+            rest_.InstrumentedREST(self._rest) if tracer or count_rest else None
+        )
+        self._profilers: dict[str, profiling.CommandProfiler] = {}
+        self._watchdog = watchdog
+        self._invocation_log = utils.SampledLogger(_log, every=log_every)
+        self._scheduler = scheduler
+        self._serializer = scheduler_.KeyedExecutor()
+        self._command_timeout = command_timeout
+        self._thread_pool_size = thread_pool_size
+        self._thread_pool: futures.ThreadPoolExecutor | None = None
+        self._process_pool_size = process_pool_size
+        self._process_pool: futures.ProcessPoolExecutor | None = None
+        self._max_payload_size = max_payload_size
+        self._drain_timeout = drain_timeout
+        self._in_flight: set[asyncio.Task[typing.Any]] = set()
+        self._is_stopping = False
+
+        _log.debug("Initializing %s", self)
 
         self.subscribe(hikari.MessageCreateEvent, self._listen)
         self.subscribe(hikari.StartedEvent, self._setup_callback)
+        self.subscribe(hikari.StartedEvent, self._warm_process_pool)
+        self.subscribe(hikari.StoppingEvent, self._on_stopping)
+
+        if watchdog:
+            self.subscribe(hikari.StartedEvent, self._start_watchdog)
+
+        if scheduler:
+            self.subscribe(hikari.StartedEvent, self._start_scheduler)
+
+        for cmd in inspect.getmembers(
+            type(self), lambda m: isinstance(m, commands_.MessageCommand)
+        ):
+            if cmd[1].cpu_bound:
+                raise ValueError(f"cpu_bound command {cmd[1].name!r} can not be a bot method")
 
-        for cmd in inspect.getmembers(self, lambda m: isinstance(m, commands_.MessageCommand)):
             cmd[1].was_globally_added = True
             if not cmd[1].is_subcommand:
                 self.add_command(cmd[1])
@@ -169,6 +318,209 @@ class Bot(hikari.GatewayBot):
         """
         return self._raise_cmd_not_found
 
+    @property
+    def limits(self) -> args_.ParseLimits | None:
+        """The limits on the size of messages this bot will parse, if
+        any.
+        """
+        return self._limits
+
+    @property
+    def rejected(self) -> dict[str, int]:
+        """A dictionary of limit name, count pairs for messages that
+        were rejected for exceeding a :obj:`~yami.ParseLimits`.
+        """
+        return self._metrics.rejected
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether or not the bot has finished setting up, and is ready
+        to receive commands.
+        """
+        return self._is_ready
+
+    @property
+    def metrics(self) -> metrics.Metrics:
+        """The invocation counts and latency histograms collected by
+        this bot. Use :obj:`~yami.Metrics.snapshot` to export them.
+        """
+        return self._metrics
+
+    @property
+    def tracer(self) -> tracing.Tracer | None:
+        """The tracer for the bots invocations, if any."""
+        return self._tracer
+
+    @property
+    def rest(self) -> hikari.api.RESTClient:
+        """The bots REST client. When instrumentation is enabled this is
+        an :obj:`~yami.InstrumentedREST` wrapping it.
+        """
+        return typing.cast(hikari.api.RESTClient, self._instrumented_rest or self._rest)
+
+    @property
+    def profilers(self) -> dict[str, profiling.CommandProfiler]:
+        """A dictionary of qualified command name,
+        :obj:`~yami.CommandProfiler` pairs that are still profiling.
+        """
+        return self._profilers
+
+    @property
+    def command_timeout(self) -> float | None:
+        """The default number of seconds a command callback can run
+        before it is cancelled, if any.
+        """
+        return self._command_timeout
+
+    @property
+    def invocation_log(self) -> utils.SampledLogger:
+        """The sampled logger the outcome of each invocation is logged
+        to, at the debug level.
+        """
+        return self._invocation_log
+
+    @property
+    def watchdog(self) -> watchdog_.Watchdog | None:
+        """The watchdog monitoring the bots event loop, if any."""
+        return self._watchdog
+
+    async def _start_watchdog(self, _: hikari.StartedEvent) -> None:
+        if self._watchdog:
+            self._watchdog.start(self._metrics)
+
+    @property
+    def scheduler(self) -> scheduler_.Scheduler | None:
+        """The scheduler queueing the bots invocations, if any."""
+        return self._scheduler
+
+    async def _start_scheduler(self, _: hikari.StartedEvent) -> None:
+        if self._scheduler:
+            self._scheduler.start(self)
+
+    @property
+    def thread_pool(self) -> futures.ThreadPoolExecutor:
+        """The thread pool synchronous command callbacks run on, created
+        the first time it is used.
+        """
+        if self._thread_pool is None:
+            self._thread_pool = futures.ThreadPoolExecutor(
+                self._thread_pool_size, thread_name_prefix="yami-command"
+            )
+
+        return self._thread_pool
+
+    @property
+    def process_pool(self) -> futures.ProcessPoolExecutor:
+        """The process pool ``cpu_bound`` command callbacks run in,
+        created the first time it is used.
+        """
+        if self._process_pool is None:
+            self._process_pool = futures.ProcessPoolExecutor(self._process_pool_size)
+
+        return self._process_pool
+
+    async def start_process_pool(self) -> None:
+        """Starts every process in the process pool, so the first
+        ``cpu_bound`` invocations do not wait for them. The bot calls
+        this when it starts, if it has any ``cpu_bound`` commands.
+        """
+        pool = self.process_pool
+        loop = asyncio.get_running_loop()
+        size = self._process_pool_size or os.cpu_count() or 1
+        await asyncio.gather(*(loop.run_in_executor(pool, _warm) for _ in range(size)))
+        _log.debug("Started %s processes for cpu bound commands", size)
+
+    async def _warm_process_pool(self, _: hikari.StartedEvent) -> None:
+        if _has_cpu_bound(self._commands.values()):
+            await self.start_process_pool()
+
+    async def _shutdown_pools(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        for pool in (self._thread_pool, self._process_pool):
+            if pool:
+                await loop.run_in_executor(None, pool.shutdown)
+
+        self._thread_pool = self._process_pool = None
+
+    @property
+    def is_stopping(self) -> bool:
+        """Whether or not the bot is stopping, and no longer accepting
+        new invocations.
+        """
+        return self._is_stopping
+
+    @property
+    def in_flight(self) -> int:
+        """The number of invocations running, or queued by the
+        scheduler.
+        """
+        count = len(self._in_flight)
+
+        if scheduler := self._scheduler:
+            count += scheduler.queue_depth + scheduler.in_flight
+
+        return count
+
+    async def drain(self, timeout: float | None = None) -> int:
+        """Stops accepting new invocations, and waits for the in-flight
+        ones to finish. Any still running after the timeout are
+        cancelled. The bot calls this on :obj:`~hikari.StoppingEvent`,
+        before the gateway and REST clients close.
+
+        Args:
+            timeout (:obj:`float` | :obj:`None`): The number of seconds
+                to wait. Defaults to :obj:`None`, which uses the bots
+                ``drain_timeout``.
+
+        Returns:
+            :obj:`int`: The number of invocations that were cancelled.
+        """
+        self._is_stopping = True
+        self._is_ready = False
+        timeout = self._drain_timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        cancelled = 0
+
+        if tasks := self._in_flight - {asyncio.current_task()}:
+            _log.info("Waiting up to %ss for %s invocations to finish", timeout, len(tasks))
+            _, pending = await asyncio.wait(tasks, timeout=max(timeout, 0))
+
+            for task in pending:
+                task.cancel()
+
+            # Let them clean up before the REST client is closed.
+            await asyncio.gather(*pending, return_exceptions=True)
+            cancelled += len(pending)
+
+        if (scheduler := self._scheduler) and scheduler.is_running:
+            try:
+                await asyncio.wait_for(scheduler.drain(), max(deadline - loop.time(), 0))
+            except asyncio.TimeoutError:
+                cancelled += scheduler.queue_depth + scheduler.in_flight
+                await scheduler.stop()
+
+        if cancelled:
+            _log.warning("Cancelled %s invocations that did not finish in %ss", cancelled, timeout)
+
+        return cancelled
+
+    async def _on_stopping(self, _: hikari.StoppingEvent) -> None:
+        await self.drain()
+
+        if self._scheduler:
+            await self._scheduler.stop()
+
+        if self._watchdog:
+            await self._watchdog.stop()
+
+        if self._tracer:
+            # Writes out the traces still buffered by the exporter.
+            self._tracer.exporter.close()
+
+        await self._shutdown_pools()
+
     async def _setup_callback(self, _: hikari.StartedEvent) -> None:
         """Callback to guarantee the owner ids are known at runtime."""
         if not self._owner_ids:
@@ -182,7 +534,8 @@ class Bot(hikari.GatewayBot):
                 self._owner_ids = (app.owner.id,)
 
         self.unsubscribe(hikari.StartedEvent, self._setup_callback)
-        _log.info(f"{self} is now ready to receive commands")
+        self._is_ready = True
+        _log.info("%s is now ready to receive commands", self)
 
     def load_all_modules(self, *paths: str | Path, recursive: bool = True) -> None:
         """Loads all modules from each of the given paths.
@@ -211,7 +564,7 @@ class Bot(hikari.GatewayBot):
             :obj:`~yami.ModuleAddException`: When there is a failure
                 with one of the commands in the module.
         """
-        _log.debug(f"Loading all modules")
+        _log.debug("Loading all modules")
         mod_state = self._modules.copy()
 
         for p in paths:
@@ -223,13 +576,13 @@ class Bot(hikari.GatewayBot):
 
     def _load_all_modules(self, path: Path, mod_state: dict[str, modules_.Module]) -> None:
         """Load a given module onto the bot."""
-        _log.debug(f"Importing all modules from {path}")
+        _log.debug("Importing all modules from %s", path)
 
         if not (to_load := self._get_modules_from_container(path, mod_state)):
             return _log.debug("No modules found, continuing")
 
         for mod in to_load:
-            _log.debug(f"Loading module {mod.__name__}()")
+            _log.debug("Loading module %s()", mod.__name__)
             self._try_load_module(mod, mod_state)
 
     def _get_modules_from_container(
@@ -278,7 +631,7 @@ class Bot(hikari.GatewayBot):
             raise e
         else:
             mod.is_loaded = True  # type: ignore
-            _log.debug(f"Loaded module {instantiated}")
+            _log.debug("Loaded module %s", instantiated)
 
     def load_module(self, name: str, path: str | Path) -> None:
         """Loads a single module class from the path specified.
@@ -303,7 +656,7 @@ class Bot(hikari.GatewayBot):
             :obj:`~yami.ModuleAddException`: When there is a failure
                 with one of the commands in the module.
         """
-        _log.debug(f"Loading module '{name}' from {path}")
+        _log.debug("Loading module '%s' from %s", name, path)
         mod_state = self._modules.copy()
 
         if not isinstance(path, Path):
@@ -329,7 +682,7 @@ class Bot(hikari.GatewayBot):
             :obj:`~yami.ModuleUnloadException`: When no module with this
                 name was found.
         """
-        _log.debug(f"Unloading module '{name}'")
+        _log.debug("Unloading module '%s'", name)
 
         if mod := self._modules.get(name):
             mod.is_loaded = False
@@ -339,10 +692,10 @@ class Bot(hikari.GatewayBot):
                     self.remove_command(cmd)
                 except exceptions.CommandNotFound:
                     # We are unloading the module regardless
-                    _log.warning(f"Error removing {cmd} from {self}, continuing")
+                    _log.warning("Error removing %s from %s, continuing", cmd, self)
                     continue
 
-            _log.debug(f"Unloaded module {mod}")
+            _log.debug("Unloaded module %s", mod)
             return mod
 
         raise exceptions.ModuleUnloadException(
@@ -364,7 +717,7 @@ class Bot(hikari.GatewayBot):
             :obj:`~yami.ModuleRemoveException`: When no module with this
                 name was found.
         """
-        _log.debug(f"Removing module '{name}'")
+        _log.debug("Removing module '%s'", name)
 
         try:
             self.unload_module(name)
@@ -374,7 +727,8 @@ class Bot(hikari.GatewayBot):
             )
 
         mod = self._modules.pop(name)
-        _log.debug(f"Removed module {mod}")
+        self._metrics.modules.pop(name, None)
+        _log.debug("Removed module %s", mod)
         return mod
 
     def _add_module(self, module: modules_.Module) -> None:
@@ -402,6 +756,11 @@ class Bot(hikari.GatewayBot):
         description: str = "",
         aliases: list[str] | tuple[str, ...] = [],
         raise_conversion: bool = False,
+        limits: args_.ParseLimits | None = None,
+        rest_budget: rest_.RESTBudget | None = None,
+        serialize_by: str | None = None,
+        timeout: float | None = None,
+        cpu_bound: bool = False,
     ) -> commands_.MessageCommand:
         """Adds a command to the bot.
 
@@ -420,6 +779,22 @@ class Bot(hikari.GatewayBot):
             raise_conversion(:obj:`bool`): Whether or not to raise an
                 exception if argument conversion fails. Defaults to
                 :obj:`False`.
+            limits (:obj:`~yami.ParseLimits` | :obj:`None`): Parsing
+                limits for the command. Defaults to :obj:`None`.
+            rest_budget (:obj:`~yami.RESTBudget` | :obj:`None`): The
+                REST call budget for the command. Defaults to
+                :obj:`None`.
+            serialize_by (:obj:`str` | :obj:`None`): Run invocations
+                with the same ``"channel"``, ``"guild"`` or ``"user"``
+                one at a time, in the order they arrived.
+            timeout (:obj:`float` | :obj:`None`): The number of
+                seconds the callback can run before it is cancelled,
+                overriding the bots default. Defaults to :obj:`None`.
+            cpu_bound (:obj:`bool`): Whether or not to run the callback
+                in the bots process pool. The callback must be a plain
+                function defined at module level, that takes only the
+                converted arguments, and returns the content to respond
+                with. Defaults to :obj:`False`.
 
         Returns:
             :obj:`~yami.MessageCommand`: The command that was added.
@@ -431,7 +806,7 @@ class Bot(hikari.GatewayBot):
         """
         if isinstance(command, commands_.MessageCommand):
             if not command.module:
-                _log.debug(f"Adding {command} to {self}")
+                _log.debug("Adding %s to %s", command, self)
 
             if not isinstance(command.aliases, (list, tuple)):
                 raise TypeError(
@@ -448,6 +823,8 @@ class Bot(hikari.GatewayBot):
                     f"Failed to add command {command} to bot " f"- alias {alias!r} already in use"
                 )
 
+            command._get_plan()
+            self._has_command_limits = self._has_command_limits or bool(command.limits)
             self._aliases.update({a: command.name for a in command.aliases})
             self._commands[command.name] = command
             return command
@@ -458,6 +835,11 @@ class Bot(hikari.GatewayBot):
             description,
             aliases=aliases,
             raise_conversion=raise_conversion,
+            limits=limits,
+            rest_budget=rest_budget,
+            serialize_by=serialize_by,
+            timeout=timeout,
+            cpu_bound=cpu_bound,
         )
         return self.add_command(cmd)
 
@@ -482,10 +864,12 @@ class Bot(hikari.GatewayBot):
                 f"Failed to remove command '{name}' from bot - it was not found"
             ) from None
         else:
+            self._metrics.forget(name)
+
             if cmd.module and cmd.module.is_loaded:
                 return cmd.module.remove_command(name)
 
-        _log.debug(f"Removed {cmd} from {self}")
+        _log.debug("Removed %s from %s", cmd, self)
         return cmd
 
     def iter_commands(self) -> typing.Generator[commands_.MessageCommand, None, None]:
@@ -547,6 +931,52 @@ class Bot(hikari.GatewayBot):
         """
         return self._modules.get(name)
 
+    def profile_command(
+        self, name: str, samples: int = 10, *, directory: str | Path = "."
+    ) -> profiling.CommandProfiler:
+        """Profiles the next invocations of a command, then writes a
+        pstats file, and a collapsed stacks file for flamegraphs.
+        Other commands are not affected.
+
+        Args:
+            name (:obj:`str`): The qualified name of the command, i.e.
+                ``"parent child"`` for a subcommand.
+            samples (:obj:`int`): The number of invocations to profile.
+                Defaults to ``10``.
+
+        Keyword Args:
+            directory (:obj:`str` | :obj:`~pathlib.Path`): The
+                directory to write the files to. Defaults to the
+                current directory.
+
+        Returns:
+            :obj:`~yami.CommandProfiler`: The profiler, which holds the
+                paths to the files once it is done.
+
+        Raises:
+            :obj:`~yami.CommandNotFound`: When the command was not
+                found.
+            :obj:`ValueError`: When samples is less than ``1``.
+        """
+        parent, *children = name.split()
+        cmd = self.get_command(parent)
+
+        for child in children:
+            cmd = cmd.subcommands.get(child) if cmd else None
+
+        if cmd is None:
+            raise exceptions.CommandNotFound(
+                f"Failed to profile command '{name}' - it was not found"
+            )
+
+        if samples < 1:
+            raise ValueError("samples must be at least 1")
+
+        profiler = profiling.CommandProfiler(cmd.qualified_name, samples, Path(directory))
+        self._profilers[cmd.qualified_name] = profiler
+        _log.debug("Profiling the next %s invocations of %s", samples, cmd)
+        return profiler
+
     def command(
         self,
         name: str | None = None,
@@ -555,7 +985,12 @@ class Bot(hikari.GatewayBot):
         aliases: typing.Sequence[str] = (),
         raise_conversion: bool = False,
         invoke_with: bool = False,
-    ) -> typing.Callable[..., typing.Any]:
+        limits: args_.ParseLimits | None = None,
+        rest_budget: rest_.RESTBudget | None = None,
+        serialize_by: str | None = None,
+        timeout: float | None = None,
+        cpu_bound: bool = False,
+    ) -> typing.Callable[[typing.Callable[..., typing.Any]], commands_.MessageCommand]:
         """Decorator to add a :obj:`~yami.MessageCommand` to the bot.
         This should be placed immediately above the command callback.
         Any checks should be placed above this decorator.
@@ -572,6 +1007,19 @@ class Bot(hikari.GatewayBot):
             raise_conversion (:obj:`bool`): Whether or not to raise an
                 exception when a type hint conversion for the command
                 arguments fails.
+            invoke_with (:obj:`bool`): Whether or not to invoke this
+                commands callback, when its subcommand is invoked.
+            limits (:obj:`~yami.ParseLimits` | :obj:`None`): Parsing
+                limits for the command.
+            rest_budget (:obj:`~yami.RESTBudget` | :obj:`None`): The
+                REST call budget for the command.
+            serialize_by (:obj:`str` | :obj:`None`): Run invocations
+                with the same ``"channel"``, ``"guild"`` or ``"user"``
+                one at a time, in the order they arrived.
+            timeout (:obj:`float` | :obj:`None`): The number of seconds
+                the callback can run before it is cancelled.
+            cpu_bound (:obj:`bool`): Whether or not to run the callback
+                in the bots process pool.
 
         Returns:
             :obj:`~typing.Callable` [..., :obj:`~yami.MessageCommand`]:
@@ -586,6 +1034,11 @@ class Bot(hikari.GatewayBot):
                 aliases=aliases,
                 raise_conversion=raise_conversion,
                 invoke_with=invoke_with,
+                limits=limits,
+                rest_budget=rest_budget,
+                serialize_by=serialize_by,
+                timeout=timeout,
+                cpu_bound=cpu_bound,
             )
         )
 
@@ -593,36 +1046,100 @@ class Bot(hikari.GatewayBot):
         """Listens for messages and invokes if they begin with one of
         the bots prefixes.
         """
-        if not e.message.content:
+        if not e.message.content or self._is_stopping:
             return
 
+        start = time.perf_counter()
+
         for p in self._prefix:
             if e.message.content.startswith(p):
-                return await self._invoke(p, e, e.message.content)
+                self._metrics.prefix.record(time.perf_counter() - start)
+
+                if (scheduler := self._scheduler) and scheduler.is_running:
+                    scheduler.submit(e, self._invoke, p, e, e.message.content)
+                    return None
+
+                task = asyncio.current_task()
+                self._in_flight.add(task)  # type: ignore[arg-type]
+
+                try:
+                    return await self._invoke(p, e, e.message.content)
+                finally:
+                    self._in_flight.discard(task)  # type: ignore[arg-type]
+
+        self._metrics.prefix.record(time.perf_counter() - start)
 
     def _parse_for_subcommands(
-        self,
-        cmd: commands_.MessageCommand,
-        parsed: list[str],
-        subcommands: list[commands_.MessageCommand] = [],
+        self, cmd: commands_.MessageCommand, parsed: list[str], max_depth: int | None = None
     ) -> list[commands_.MessageCommand]:
-        """Recursively parses for subcommands."""
-        if parsed and parsed[0] in cmd.subcommands:
-            sub = cmd.subcommands[parsed.pop(0)]
-            subcommands.append(sub)
-            subcommands = self._parse_for_subcommands(sub, parsed, subcommands)
+        """Parses for subcommands, consuming their names from the
+        parsed tokens. Stops once ``max_depth`` is exceeded.
+        """
+        subcommands: list[commands_.MessageCommand] = []
+
+        while parsed and parsed[0] in cmd.subcommands:
+            if max_depth is not None and len(subcommands) > max_depth:
+                break
+
+            cmd = cmd.subcommands[parsed.pop(0)]
+            subcommands.append(cmd)
 
         return subcommands
 
-    async def _invoke(self, p: str, event: hikari.MessageCreateEvent, content: str) -> None:
+    @staticmethod
+    def _split_args(rest: str, used: int, max_tokens: int | None) -> list[str] | None:
+        """Splits the arguments after the command name, or returns
+        :obj:`None` if the message has more than ``max_tokens`` tokens.
+        """
+        if max_tokens is None:
+            return rest.split()
+
+        if used > max_tokens:
+            return None
+
+        # Never split more than the limit allows.
+        parsed = rest.split(maxsplit=max_tokens - used)
+        return None if len(parsed) > max_tokens - used else parsed
+
+    def _reject(self, limit: str) -> None:
+        """Counts a message rejected for exceeding a limit."""
+        self._metrics.reject(limit)
+
+    async def _invoke(
+        self, p: str, event: hikari.MessageCreateEvent, content: str, _wrapped: bool = False
+    ) -> None:
         """Attempts to invoke a command."""
+        start = time.perf_counter()
+        limits = self._limits
+
+        if limits and limits.max_content_length is not None:
+            if len(content) > limits.max_content_length:
+                return self._reject("max_content_length")
 
         # Get the prefix and the name of the command
-        parsed = content.split()
+        if not (limits or self._has_command_limits):
+            parsed = content.split()
+            rest = None
+        else:
+            # Split off the prefix and name only, the arguments are
+            # split once the commands own limits have been checked.
+            parsed = content.split(maxsplit=1)
+            rest = parsed.pop() if len(parsed) > 1 else ""
+
         name = parsed.pop(0)[len(p) :]
+        used = 1
+
         if name == "":
             # If there is whitespace between the prefix and the command.
+            if rest is not None:
+                parsed = rest.split(maxsplit=1)
+                rest = parsed.pop() if len(parsed) > 1 else ""
+
+            if not parsed:
+                return None
+
             name = parsed.pop(0)
+            used = 2
 
         if name in self._aliases:
             cmd = self._commands[self._aliases[name]]
@@ -633,64 +1150,251 @@ class Bot(hikari.GatewayBot):
         else:
             return None
 
-        ctx = context.MessageContext(self, event.message, cmd, p)
-        await self.dispatch(events.CommandInvokeEvent(ctx))
+        max_tokens = limits.max_tokens if limits else None
+        max_depth = limits.max_depth if limits else None
 
-        try:
-            all_invoked = (cmd, *self._parse_for_subcommands(cmd, parsed))
+        if cmd_limits := cmd.limits:
+            if (length := cmd_limits.max_content_length) is not None and len(content) > length:
+                return self._reject("max_content_length")
 
-            for i, c in enumerate(all_invoked):
-                is_final = i + 1 >= len(all_invoked)
-                for check in c.iter_checks():
-                    await check.execute(ctx)
+            if (tokens := cmd_limits.max_tokens) is not None:
+                max_tokens = tokens if max_tokens is None else min(max_tokens, tokens)
 
-                if c.is_subcommand:
-                    if c.invoke_with or is_final:
-                        ctx._invoked_subcommands.append(c)
-                    else:
-                        continue
+            if (depth := cmd_limits.max_depth) is not None:
+                max_depth = depth if max_depth is None else min(max_depth, depth)
 
-                for arg in self._get_args(c, parsed):
-                    await arg.convert(ctx)
+        if rest is not None:
+            if (args := self._split_args(rest, used, max_tokens)) is None:
+                return self._reject("max_tokens")
 
-                await self._invoke_callback(ctx, c)
+            parsed = args
+        elif max_tokens is not None and len(parsed) + used > max_tokens:
+            return self._reject("max_tokens")
 
-                if not is_final:
-                    ctx.args.clear()
+        subcommands = self._parse_for_subcommands(cmd, parsed, max_depth)
+        if max_depth is not None and len(subcommands) > max_depth:
+            return self._reject("max_depth")
 
-        except Exception as e:
-            ctx.exceptions.append(e)
-            await self.dispatch(events.CommandExceptionEvent(ctx))
+        final = subcommands[-1] if subcommands else cmd
 
-        else:
-            await self.dispatch(events.CommandSuccessEvent(ctx))
+        if not _wrapped and (
+            final.serialize_by or (self._profilers and final.qualified_name in self._profilers)
+        ):
+            return await self._invoke_wrapped(p, event, content, final)
+
+        if final.rest_budget and not self._instrumented_rest:
+            self._instrumented_rest = rest_.InstrumentedREST(self._rest)
+
+        now = time.perf_counter()
+        stages: list[float | None] = [now - start, None, None, None]
+        outcome = "success"
+        usage = None
+
+        if self._instrumented_rest:
+            usage = rest_.RESTUsage(final.qualified_name, final.rest_budget)
+            usage_token = rest_._usage.set(usage)
+
+        trace = self._tracer.start(final.qualified_name, start=start) if self._tracer else None
+        if trace:
+            trace.record("resolution", start, now)
+
+        with trace or _NOOP:
+            ctx = context.MessageContext(self, event.message, cmd, p)
+            await self.dispatch(events.CommandInvokeEvent(ctx))
+
+            try:
+                all_invoked = (cmd, *subcommands)
+
+                for i, c in enumerate(all_invoked):
+                    is_final = i + 1 >= len(all_invoked)
+                    now = time.perf_counter()
+
+                    # Stages are timed in finally blocks, so the latency
+                    # of a stage that raises is still recorded.
+                    try:
+                        with tracing.span("checks", command=c.name):
+                            for check in c.iter_checks():
+                                with tracing.span(check.get_name()):
+                                    await check.execute(ctx)
+                    finally:
+                        stages[1] = (stages[1] or 0.0) + time.perf_counter() - now
+
+                    if c.is_subcommand:
+                        if c.invoke_with or is_final:
+                            ctx._invoked_subcommands.append(c)
+                        else:
+                            continue
+
+                    now = time.perf_counter()
+
+                    try:
+                        with tracing.span("conversion", command=c.name):
+                            for arg in self._get_args(c, parsed, content):
+                                await arg.convert(ctx)
+                    finally:
+                        stages[2] = (stages[2] or 0.0) + time.perf_counter() - now
+
+                    now = time.perf_counter()
+
+                    try:
+                        with tracing.span("callback", command=c.name), (
+                            self._watchdog.watch(ctx, c) if self._watchdog else _NOOP
+                        ):
+                            if (timeout := c.timeout) is None:
+                                timeout = self._command_timeout
+
+                            if timeout is None:
+                                await self._invoke_callback(ctx, c)
+                            else:
+                                await self._invoke_callback_with_timeout(ctx, c, timeout)
+                    finally:
+                        stages[3] = (stages[3] or 0.0) + time.perf_counter() - now
+
+                    if not is_final:
+                        ctx.args.clear()
+
+            except Exception as e:
+                if isinstance(e, exceptions.CheckFailed):
+                    outcome = "check_failure"
+                elif isinstance(e, exceptions.CommandTimeout):
+                    outcome = "timeout"
+                else:
+                    outcome = "failure"
+
+                ctx.exceptions.append(e)
+                await self.dispatch(events.CommandExceptionEvent(ctx))
+
+            else:
+                await self.dispatch(events.CommandSuccessEvent(ctx))
+
+            finally:
+                module = final.module.name if final.module else None
+
+                if usage:
+                    rest_._usage.reset(usage_token)
+                    self._metrics.record(
+                        final.qualified_name,
+                        module,
+                        outcome,
+                        stages,
+                        rest_calls=usage.total,
+                        rate_limited=usage.rate_limited,
+                    )
+                else:
+                    self._metrics.record(final.qualified_name, module, outcome, stages)
+
+                if trace:
+                    trace.attributes["outcome"] = outcome
+
+                self._invocation_log.debug(
+                    "Invoked %r in %.3fms with outcome %s",
+                    final.qualified_name,
+                    (time.perf_counter() - start) * 1000,
+                    outcome,
+                )
+
+    async def _invoke_wrapped(
+        self,
+        p: str,
+        event: hikari.MessageCreateEvent,
+        content: str,
+        final: commands_.MessageCommand,
+    ) -> None:
+        """Invokes a command that is serialized, or being profiled.
+        These are kept out of :obj:`_invoke` so the common path does not
+        pay for them.
+        """
+        if serialize_by := final.serialize_by:
+            key = self._get_serial_key(serialize_by, event)
+            scheduler = self._scheduler
+
+            if scheduler and self._serializer.waiting(key) and scheduler.in_worker():
+                # Wait for the key outside of the worker, so invocations
+                # with other keys are not starved of workers meanwhile.
+                hold = self._serializer.hold(key)
+                task = asyncio.create_task(
+                    self._invoke_held(hold, scheduler, p, event, content, final)
+                )
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+                return None
+
+            async with self._serializer.hold(key):
+                return await self._invoke_profiled(p, event, content, final)
+
+        return await self._invoke_profiled(p, event, content, final)
+
+    async def _invoke_held(
+        self,
+        hold: typing.AsyncContextManager[None],
+        scheduler: scheduler_.Scheduler,
+        p: str,
+        event: hikari.MessageCreateEvent,
+        content: str,
+        final: commands_.MessageCommand,
+    ) -> None:
+        """Waits for a serial key, then invokes the command on one of
+        the schedulers workers.
+        """
+        async with hold:
+            await scheduler.run(event, self._invoke_profiled, p, event, content, final)
+
+    def _invoke_profiled(
+        self,
+        p: str,
+        event: hikari.MessageCreateEvent,
+        content: str,
+        final: commands_.MessageCommand,
+    ) -> typing.Awaitable[None]:
+        """Invokes a command, profiling it if a profiler is armed."""
+        name = final.qualified_name
+
+        if self._profilers and (profiler := self._profilers.get(name)):
+            if profiler.remaining == 1:
+                del self._profilers[name]
+
+            return profiler._run(self._invoke(p, event, content, True))
+
+        return self._invoke(p, event, content, True)
+
+    def _get_serial_key(
+        self, serialize_by: str, event: hikari.MessageCreateEvent
+    ) -> tuple[str, hikari.Snowflake]:
+        """Gets the key an invocation is serialized by."""
+        message = event.message
+
+        if serialize_by == "user":
+            return ("user", message.author.id)
+
+        if serialize_by == "guild" and message.guild_id is not None:
+            return ("guild", message.guild_id)
+
+        # Direct messages have no guild, so their channel is used.
+        return ("channel", message.channel_id)
 
     def _get_args(
         self,
         cmd: commands_.MessageCommand,
         parsed: list[str],
+        content: str | None = None,
     ) -> list[args_.MessageArg]:
         """Parses for args."""
-        annots = tuple(inspect.signature(cmd.callback).parameters.values())
-        annots = annots[2:] if cmd.module or cmd.was_globally_added else annots[1:]
-        annots_l = len(annots)
+        plan = cmd._get_plan()
         parsed_l = len(parsed)
 
-        args: list[args_.MessageArg] = []
-        args.extend(args_.MessageArg(a, p) for a, p in zip(annots, parsed))
+        if parsed_l < plan.min_args:
+            raise exceptions.MissingArgs(
+                f"{cmd} is missing a required argument - "
+                f"expected {plan.min_args} but got {parsed_l}"
+            )
 
-        if parsed_l > annots_l:
+        if plan.max_args is not None and parsed_l > plan.max_args:
             if not self._allow_extra_args:
                 raise exceptions.TooManyArgs(
-                    f"{cmd} received too many args - expected {annots_l} but got {parsed_l}"
+                    f"{cmd} received too many args - expected {plan.max_args} but got {parsed_l}"
                 )
 
-        if parsed_l < annots_l:
-            raise exceptions.MissingArgs(
-                f"{cmd} is missing a required argument - expected {annots_l} but got {parsed_l}"
-            )
-
-        return args
+        return plan.build_args(parsed, content)
 
     async def _execute_checks(
         self, ctx: context.MessageContext, cmd: commands_.MessageCommand
@@ -699,13 +1403,126 @@ class Bot(hikari.GatewayBot):
         for check in cmd.iter_checks():
             await check.execute(ctx)
 
+    async def _invoke_callback_with_timeout(
+        self, ctx: context.MessageContext, cmd: commands_.MessageCommand, timeout: float
+    ) -> None:
+        """Invokes the given commands callback, cancelling it if it runs
+        past the timeout.
+        """
+        # The callback is cancelled in this task, rather than run in a
+        # child task, so the watchdog and profiler still follow it.
+        task = asyncio.current_task()
+        assert task is not None
+        expired: list[bool] = []
+
+        def expire(task: asyncio.Task[typing.Any]) -> None:
+            expired.append(True)
+            task.cancel()
+
+        handle = asyncio.get_running_loop().call_later(timeout, expire, task)
+
+        try:
+            await self._invoke_callback(ctx, cmd)
+        except asyncio.CancelledError:
+            if not expired:
+                raise
+
+            if uncancel := getattr(task, "uncancel", None):
+                uncancel()
+
+            raise exceptions.CommandTimeout(
+                f"{cmd} timed out after {timeout}s and was cancelled"
+            ) from None
+        finally:
+            handle.cancel()
+
+    async def _invoke_cpu_bound_callback(
+        self,
+        ctx: context.MessageContext,
+        cmd: commands_.MessageCommand,
+        values: list[typing.Any],
+        kwargs: dict[str, typing.Any],
+    ) -> None:
+        """Invokes the given commands callback in the process pool, and
+        responds with its result.
+        """
+        # The callback is sent by name, as decorating it replaced the
+        # module attribute pickle would look it up by.
+        name = (cmd.callback.__module__, cmd.callback.__qualname__)
+        payload = pickle.dumps((name, values, kwargs), pickle.HIGHEST_PROTOCOL)
+
+        if len(payload) > self._max_payload_size:
+            raise exceptions.PayloadTooLarge(
+                f"{cmd} arguments are {len(payload)} bytes pickled, "
+                f"the limit is {self._max_payload_size}"
+            )
+
+        submitted = time.time()
+        started, result = await asyncio.get_running_loop().run_in_executor(
+            self.process_pool, _run_pickled, payload
+        )
+        self._metrics.process_wait.record(max(0.0, started - submitted))
+
+        if result is not None:
+            await ctx.respond(result)
+
+    async def _invoke_sync_callback(
+        self,
+        ctx: context.MessageContext,
+        cmd: commands_.MessageCommand,
+        values: list[typing.Any],
+        kwargs: dict[str, typing.Any],
+    ) -> None:
+        """Invokes the given commands synchronous callback on the thread
+        pool, keeping the context variables of the invocation.
+        """
+        loop = asyncio.get_running_loop()
+        proxy = context.SyncContext(ctx, loop)
+
+        if m := cmd.module:
+            args: tuple[typing.Any, ...] = (m, proxy, *values)
+        elif cmd.was_globally_added:
+            args = (self, proxy, *values)
+        else:
+            args = (proxy, *values)
+
+        run = contextvars.copy_context().run
+        result = await loop.run_in_executor(
+            self.thread_pool, functools.partial(run, cmd.callback, *args, **kwargs)
+        )
+
+        if inspect.isawaitable(result):
+            # The callback was async after all, behind a wrapper that
+            # hid it, so only the coroutine was created on the pool.
+            await result
+
     async def _invoke_callback(
         self, ctx: context.MessageContext, cmd: commands_.MessageCommand
     ) -> None:
         """Invokes the given commands callback."""
+        values = [*ctx.iter_arg_values()]
+        kwargs: dict[str, typing.Any] = {}
+
+        if ctx.args:
+            # The greedy tail and bulk variadics are always last.
+            last = ctx.args[-1]
+
+            if last.kind is inspect.Parameter.KEYWORD_ONLY:
+                kwargs[last.name] = values.pop()
+
+            elif last.kind is inspect.Parameter.VAR_POSITIONAL and last.is_converted:
+                if last.annotation in converters.BULK_CAN_CONVERT:
+                    values.extend(values.pop())
+
+        if cmd.cpu_bound:
+            return await self._invoke_cpu_bound_callback(ctx, cmd, values, kwargs)
+
+        if cmd.is_sync:
+            return await self._invoke_sync_callback(ctx, cmd, values, kwargs)
+
         if m := cmd.module:
-            await cmd.callback(m, ctx, *ctx.iter_arg_values())
+            await cmd.callback(m, ctx, *values, **kwargs)
         elif cmd.was_globally_added:
-            await cmd.callback(self, ctx, *ctx.iter_arg_values())
+            await cmd.callback(self, ctx, *values, **kwargs)
         else:
-            await cmd.callback(ctx, *ctx.iter_arg_values())
+            await cmd.callback(ctx, *values, **kwargs)
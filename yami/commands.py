@@ -18,16 +18,32 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import functools
+import inspect
 import typing
 
+from yami import args as args_
 from yami import checks as checks_
 from yami import exceptions, modules
+from yami import rest as rest_
 
 __all__ = [
     "MessageCommand",
     "command",
 ]
 
+SERIALIZE_BY = (None, "channel", "guild", "user")
+"""The keys invocations of a command can be serialized by."""
+
+
+def _is_async(callback: typing.Callable[..., typing.Any]) -> bool:
+    while isinstance(callback, functools.partial):
+        callback = callback.func
+
+    # asyncio also recognises AsyncMock before Python 3.10.
+    return asyncio.iscoroutinefunction(inspect.unwrap(callback))
+
 
 class MessageCommand:
     """An object that represents a message content command.
@@ -44,7 +60,9 @@ class MessageCommand:
 
     Args:
         callback (:obj:`typing.Callable` [..., :obj:`typing.Any`]):
-            The async callback function for the command.
+            The callback function for the command. Plain functions
+            run on the bots thread pool, and receive a
+            :obj:`~yami.SyncContext`.
         name (:obj:`str`): The name of the command.
         description (:obj:`str`): The description for the command.
 
@@ -58,6 +76,22 @@ class MessageCommand:
         invoke_with (:obj:`bool`): Whether or not to invoke this command
             with its subcommands, if it has any. Defaults to
             :obj:`False`.
+        limits (:obj:`~yami.ParseLimits` | :obj:`None`): Parsing limits
+            for this command, applied along with the bots limits.
+            Defaults to :obj:`None`.
+        rest_budget (:obj:`~yami.RESTBudget` | :obj:`None`): The REST
+            call budget for each invocation. Defaults to :obj:`None`.
+        serialize_by (:obj:`str` | :obj:`None`): Run invocations with
+            the same ``"channel"``, ``"guild"`` or ``"user"`` one at a
+            time, in the order they arrived. Defaults to :obj:`None`.
+        timeout (:obj:`float` | :obj:`None`): The number of seconds
+            the callback can run before it is cancelled, overriding the
+            bots default. Defaults to :obj:`None`.
+        cpu_bound (:obj:`bool`): Whether or not to run the callback in
+            the bots process pool. The callback must be a plain function
+            defined at module level, not a method, that takes only the
+            converted arguments, and returns the content to respond
+            with. Defaults to :obj:`False`.
     """
 
     __slots__ = (
@@ -72,6 +106,13 @@ class MessageCommand:
         "_subcommands",
         "_parent",
         "_invoke_with",
+        "_plan",
+        "_limits",
+        "_rest_budget",
+        "_serialize_by",
+        "_timeout",
+        "_cpu_bound",
+        "_is_sync",
     )
 
     def __init__(
@@ -84,6 +125,11 @@ class MessageCommand:
         raise_conversion: bool,
         parent: MessageCommand | None = None,
         invoke_with: bool = False,
+        limits: args_.ParseLimits | None = None,
+        rest_budget: rest_.RESTBudget | None = None,
+        serialize_by: str | None = None,
+        timeout: float | None = None,
+        cpu_bound: bool = False,
     ) -> None:
         self._name = name
         self._aliases = aliases
@@ -96,6 +142,24 @@ class MessageCommand:
         self._checks: dict[str, checks_.Check] = {}
         self._subcommands: dict[str, MessageCommand] = {}
         self._was_globally_added = False
+        self._plan: args_.InvocationPlan | None = None
+        self._limits = limits
+        self._rest_budget = rest_budget
+        self._serialize_by = serialize_by
+        self._timeout = timeout
+        self._cpu_bound = cpu_bound
+        self._is_sync = not _is_async(callback)
+
+        if cpu_bound and not self._is_sync:
+            raise ValueError(f"cpu_bound callback {name!r} must be a plain function")
+
+        if cpu_bound and "<locals>" in callback.__qualname__:
+            raise ValueError(
+                f"cpu_bound callback {name!r} must be defined at module level to be pickled"
+            )
+
+        if serialize_by not in SERIALIZE_BY:
+            raise ValueError(f"serialize_by must be one of {SERIALIZE_BY}, not {serialize_by!r}")
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}('{self._name}')"
@@ -117,6 +181,16 @@ class MessageCommand:
         """The name of the command."""
         return self._name
 
+    @property
+    def qualified_name(self) -> str:
+        """The name of the command, prefixed with the names of its
+        parents if it is a subcommand.
+        """
+        if self._parent:
+            return f"{self._parent.qualified_name} {self._name}"
+
+        return self._name
+
     @property
     def module(self) -> modules.Module | None:
         """The :obj:`~yami.Module` this command originates from, if
@@ -178,6 +252,57 @@ class MessageCommand:
         """
         return self._invoke_with
 
+    @property
+    def limits(self) -> args_.ParseLimits | None:
+        """The parsing limits for this command, if any."""
+        return self._limits
+
+    @property
+    def rest_budget(self) -> rest_.RESTBudget | None:
+        """The REST call budget for each invocation of this command, if
+        any.
+        """
+        return self._rest_budget
+
+    @property
+    def serialize_by(self) -> str | None:
+        """The key invocations of this command run one at a time by, if
+        any.
+        """
+        return self._serialize_by
+
+    @property
+    def timeout(self) -> float | None:
+        """The number of seconds the callback can run before it is
+        cancelled, if it overrides the bots default.
+        """
+        return self._timeout
+
+    @property
+    def cpu_bound(self) -> bool:
+        """Whether or not the callback runs in the bots process pool."""
+        return self._cpu_bound
+
+    @property
+    def is_sync(self) -> bool:
+        """Whether or not the callback is a plain function, which runs
+        on the bots thread pool.
+        """
+        return self._is_sync
+
+    def _get_plan(self) -> args_.InvocationPlan:
+        """Gets the compiled argument plan, building it if needed."""
+        if self._cpu_bound:
+            # Process pool callbacks take only their arguments.
+            offset = 0
+        else:
+            offset = 2 if self._module or self._was_globally_added else 1
+
+        if self._plan is None or self._plan.offset != offset:
+            self._plan = args_.InvocationPlan(self._callback, offset)
+
+        return self._plan
+
     def add_check(self, check: typing.Type[checks_.Check] | checks_.Check) -> checks_.Check:
         """Adds a check to be run before this command.
 
@@ -239,6 +364,11 @@ class MessageCommand:
         description: str = "",
         aliases: list[str] | tuple[str, ...] = [],
         raise_conversion: bool = False,
+        limits: args_.ParseLimits | None = None,
+        rest_budget: rest_.RESTBudget | None = None,
+        serialize_by: str | None = None,
+        timeout: float | None = None,
+        cpu_bound: bool = False,
     ) -> MessageCommand:
         """Adds a subcommand to the command.
 
@@ -257,6 +387,18 @@ class MessageCommand:
             raise_conversion (:obj:`bool`): Whether or not to raise an
                 error when argument conversion fails.
                 (Defaults to :obj:`False`)
+            limits (:obj:`~yami.ParseLimits` | :obj:`None`): Parsing
+                limits for the subcommand. (Defaults to :obj:`None`)
+            rest_budget (:obj:`~yami.RESTBudget` | :obj:`None`): The
+                REST call budget for the subcommand.
+                (Defaults to :obj:`None`)
+            serialize_by (:obj:`str` | :obj:`None`): Run invocations
+                with the same ``"channel"``, ``"guild"`` or ``"user"``
+                one at a time, in the order they arrived.
+            timeout (:obj:`float` | :obj:`None`): The number of seconds
+                the callback can run before it is cancelled.
+            cpu_bound (:obj:`bool`): Whether or not to run the callback
+                in the bots process pool.
 
         Returns:
             :obj:`MessageCommand`: The subcommand that was added.
@@ -295,6 +437,11 @@ class MessageCommand:
             aliases=aliases,
             raise_conversion=raise_conversion,
             parent=self,
+            limits=limits,
+            rest_budget=rest_budget,
+            serialize_by=serialize_by,
+            timeout=timeout,
+            cpu_bound=cpu_bound,
         )
         return self.add_subcommand(cmd)
 
@@ -328,6 +475,11 @@ class MessageCommand:
         aliases: typing.Iterable[str] = [],
         raise_conversion: bool = False,
         invoke_with: bool = False,
+        limits: args_.ParseLimits | None = None,
+        rest_budget: rest_.RESTBudget | None = None,
+        serialize_by: str | None = None,
+        timeout: float | None = None,
+        cpu_bound: bool = False,
     ) -> typing.Callable[..., MessageCommand]:
         """Decorator to add a subcommand to an existing command. It
         should decorate the callback that should fire when this
@@ -347,6 +499,17 @@ class MessageCommand:
                 argument fails.
             invoke_with (:obj:`bool`): Whether or not to invoke this
                 commands callback, when its subcommand is invoked.
+            limits (:obj:`~yami.ParseLimits` | :obj:`None`): Parsing
+                limits for the subcommand.
+            rest_budget (:obj:`~yami.RESTBudget` | :obj:`None`): The
+                REST call budget for the subcommand.
+            serialize_by (:obj:`str` | :obj:`None`): Run invocations
+                with the same ``"channel"``, ``"guild"`` or ``"user"``
+                one at a time, in the order they arrived.
+            timeout (:obj:`float` | :obj:`None`): The number of seconds
+                the callback can run before it is cancelled.
+            cpu_bound (:obj:`bool`): Whether or not to run the callback
+                in the bots process pool.
 
         Returns:
             :obj:`~typing.Callable` [..., :obj:`MessageCommand`]:
@@ -362,6 +525,11 @@ class MessageCommand:
                 raise_conversion=raise_conversion,
                 invoke_with=invoke_with,
                 parent=self,
+                limits=limits,
+                rest_budget=rest_budget,
+                serialize_by=serialize_by,
+                timeout=timeout,
+                cpu_bound=cpu_bound,
             )
         )
 
@@ -373,6 +541,11 @@ def command(
     aliases: typing.Iterable[str] = [],
     raise_conversion: bool = False,
     invoke_with: bool = False,
+    limits: args_.ParseLimits | None = None,
+    rest_budget: rest_.RESTBudget | None = None,
+    serialize_by: str | None = None,
+    timeout: float | None = None,
+    cpu_bound: bool = False,
 ) -> typing.Callable[..., MessageCommand]:
     """Decorator to add commands to the bot inside of modules. It should
     decorate the callback that should fire when this command is run.
@@ -391,6 +564,21 @@ def command(
             argument fails.
         invoke_with (:obj:`bool`): Whether or not to invoke this
             commands callback, when its subcommand is invoked.
+        limits (:obj:`~yami.ParseLimits` | :obj:`None`): Parsing limits
+            for the command.
+        rest_budget (:obj:`~yami.RESTBudget` | :obj:`None`): The REST
+            call budget for the command.
+        serialize_by (:obj:`str` | :obj:`None`): Run invocations with
+            the same ``"channel"``, ``"guild"`` or ``"user"`` one at a
+            time, in the order they arrived. Defaults to :obj:`None`.
+        timeout (:obj:`float` | :obj:`None`): The number of seconds
+            the callback can run before it is cancelled, overriding the
+            bots default. Defaults to :obj:`None`.
+        cpu_bound (:obj:`bool`): Whether or not to run the callback in
+            the bots process pool. The callback must be a plain function
+            defined at module level, not a method, that takes only the
+            converted arguments, and returns the content to respond
+            with. Defaults to :obj:`False`.
 
     Returns:
         :obj:`~typing.Callable` [..., :obj:`yami.MessageCommand`]:
@@ -404,4 +592,9 @@ def command(
         aliases=aliases,
         raise_conversion=raise_conversion,
         invoke_with=invoke_with,
+        limits=limits,
+        rest_budget=rest_budget,
+        serialize_by=serialize_by,
+        timeout=timeout,
+        cpu_bound=cpu_bound,
     )
@@ -19,6 +19,8 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import functools
+import inspect
 import typing
 
 import hikari
@@ -30,7 +32,7 @@ from yami import commands, utils
 if typing.TYPE_CHECKING:
     from hikari.api import special_endpoints
 
-__all__ = ["Context", "MessageContext"]
+__all__ = ["Context", "MessageContext", "SyncContext"]
 
 
 class Context(abc.ABC):
@@ -44,7 +46,7 @@ class Context(abc.ABC):
         message: hikari.Message,
         command: commands.MessageCommand,
         prefix: str,
-        invoked_subcommands: list[commands.MessageCommand] = [],
+        invoked_subcommands: list[commands.MessageCommand] | None = None,
     ) -> None:
         ...
 
@@ -177,7 +179,7 @@ class MessageContext(Context):
         message: hikari.Message,
         command: commands.MessageCommand,
         prefix: str,
-        invoked_subcommands: list[commands.MessageCommand] = [],
+        invoked_subcommands: list[commands.MessageCommand] | None = None,
     ) -> None:
         self._message = message
         self._command = command
@@ -186,7 +188,7 @@ class MessageContext(Context):
         self._exceptions: list[Exception] = []
         self._shared = utils.Shared()
         self._args: list[args_.MessageArg] = []
-        self._invoked_subcommands = invoked_subcommands
+        self._invoked_subcommands = [] if invoked_subcommands is None else invoked_subcommands
 
     @property
     def bot(self) -> bot_.Bot:
@@ -426,3 +428,85 @@ class MessageContext(Context):
         return self._bot.cache.get_guild_channel(
             self._message.channel_id
         ) or await self._bot.rest.fetch_channel(self._message.channel_id)
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class _LoopProxy:
+    """Proxies an object for use from another thread. Its coroutine
+    methods become blocking calls that run on the event loop.
+    """
+
+    __slots__ = ("_target", "_loop")
+
+    def __init__(self, target: typing.Any, loop: asyncio.AbstractEventLoop) -> None:
+        self._target = target
+        self._loop = loop
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._target!r})"
+
+    def __getattr__(self, name: str) -> typing.Any:
+        attr = getattr(self._target, name)
+
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def blocking(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            coro = attr(*args, **kwargs)
+
+            if _running_loop() is self._loop:
+                # Called on the loop, it would block forever, so this
+                # returns the coroutine to be awaited instead.
+                return coro
+
+            return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+        return blocking
+
+
+class SyncContext(_LoopProxy):
+    """The context passed to synchronous command callbacks, which run
+    on the bots thread pool.
+
+    Every attribute of the :obj:`MessageContext` is available. Its
+    coroutine methods, like :obj:`~MessageContext.respond`, block the
+    thread until they complete on the event loop instead of returning a
+    coroutine. :obj:`rest` is proxied the same way.
+
+    .. code-block:: python
+
+        @bot.command()
+        def render(ctx: yami.SyncContext) -> None:
+            image = expensive_blocking_work()
+            ctx.respond(attachment=image)
+
+    Args:
+        ctx (:obj:`MessageContext`): The context to proxy.
+        loop (:obj:`asyncio.AbstractEventLoop`): The loop the context
+            belongs to.
+
+    .. warning::
+        This class should not be instantiated manually, the bot creates
+        it for synchronous callbacks.
+    """
+
+    __slots__ = ()
+
+    @property
+    def context(self) -> MessageContext:
+        """The proxied context, which must only be used on the event
+        loop.
+        """
+        return typing.cast(MessageContext, self._target)
+
+    @property
+    def rest(self) -> hikari.api.RESTClient:
+        """The bots REST client, with blocking methods."""
+        return typing.cast(hikari.api.RESTClient, _LoopProxy(self._target.rest, self._loop))
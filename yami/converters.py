@@ -18,8 +18,11 @@
 from __future__ import annotations
 
 import abc
+import array
+import importlib
 import logging
-from typing import Any, Callable, TypeVar
+import typing
+from typing import Any, Callable, ClassVar, Sequence, TypeVar
 
 import hikari
 
@@ -31,6 +34,9 @@ __all__ = [
     "HikariConverter",
     "HIKARI_CAN_CONVERT",
     "BUILTIN_CAN_CONVERT",
+    "BULK_CAN_CONVERT",
+    "BULK_SEQUENCES",
+    "convert_bulk",
 ]
 
 _log = logging.getLogger(__name__)
@@ -39,6 +45,15 @@ BuiltinTypeT = TypeVar("BuiltinTypeT", bound=type)
 HikariTypeT = TypeVar("HikariTypeT")
 
 BUILTIN_CAN_CONVERT = (bool, int, complex, float, bytes)
+BULK_CAN_CONVERT: dict[type, str] = {int: "q", float: "d"}
+"""The types variadic args can be bulk converted to, and their
+:obj:`array.array` typecodes.
+"""
+BULK_SEQUENCES: dict[Any, type] = {typing.Sequence[int]: int, typing.Sequence[float]: float}
+"""The annotations of a trailing positional arg that receives the rest
+of the message as one bulk converted :obj:`array.array`, and the type of
+their elements.
+"""
 HIKARI_CAN_CONVERT = (
     hikari.User,
     hikari.Member,
@@ -97,18 +112,12 @@ class BuiltinConverter(Converter):
             The value to perform the conversion on.
     """
 
-    __slots__ = ("_value", "_mapping")
+    __slots__ = ("_value",)
+
+    _mapping: ClassVar[dict[type, Callable[..., Any]]]
 
     def __init__(self, value: Any) -> None:
         self._value = value
-        self._mapping: dict[type, Callable[..., Any]] = {
-            bool: self.as_bool,
-            bytes: self.as_bytes,
-            complex: self.as_complex,
-            float: self.as_float,
-            int: self.as_int,
-            str: self.as_str,
-        }
 
     @classmethod
     def can_convert(cls, type_: Any) -> bool:
@@ -145,9 +154,9 @@ class BuiltinConverter(Converter):
             converted: BuiltinTypeT
 
             if type_ is bytes:
-                converted = self._mapping[type_](encoding)
+                converted = self._mapping[type_](self, encoding)
             else:
-                converted = self._mapping[type_]()
+                converted = self._mapping[type_](self)
             return converted
 
         raise exceptions.ConversionFailed(f"{self} can't be converted to {type_}")
@@ -251,3 +260,66 @@ class BuiltinConverter(Converter):
             return float(self._value)
         except:
             raise self._raise(float) from None
+
+
+BuiltinConverter._mapping = {
+    bool: BuiltinConverter.as_bool,
+    bytes: BuiltinConverter.as_bytes,
+    complex: BuiltinConverter.as_complex,
+    float: BuiltinConverter.as_float,
+    int: BuiltinConverter.as_int,
+    str: BuiltinConverter.as_str,
+}
+
+
+def convert_bulk(values: Sequence[str], type_: type, *, numpy: bool = False) -> Any:
+    """Converts many values to the same type at once, without creating
+    a converter for each value.
+
+    Args:
+        values (:obj:`~typing.Sequence` [:obj:`str`]): The values to
+            convert.
+        type_ (:obj:`type`): The type to convert to, one of
+            :obj:`BULK_CAN_CONVERT`.
+
+    Keyword Args:
+        numpy (:obj:`bool`): Whether to return a NumPy array rather than
+            an :obj:`array.array`. NumPy must be installed. Defaults to
+            :obj:`False`.
+
+    Returns:
+        :obj:`array.array` | :obj:`list`: The converted values. A
+        :obj:`list` is returned if an :obj:`int` value does not fit in
+        64 bits. With ``numpy``, a ``numpy.ndarray`` sharing the
+        memory of the :obj:`array.array`.
+
+    Raises:
+        `~yami.ConversionFailed`: If any of the values can't be
+            converted.
+    """
+    if type_ not in BULK_CAN_CONVERT:
+        raise exceptions.ConversionFailed(f"Can't bulk convert to {type_}")
+
+    try:
+        converted: Any = array.array(BULK_CAN_CONVERT[type_], map(type_, values))
+
+    except OverflowError:
+        converted = [*map(type_, values)]
+
+    except (ValueError, TypeError):
+        raise exceptions.ConversionFailed(
+            f"Bulk converting to {type_.__name__} failed for values: {values!r}"
+        ) from None
+
+    if not numpy:
+        return converted
+
+    try:
+        np = importlib.import_module("numpy")
+    except ImportError:
+        raise exceptions.ConversionFailed("Bulk converting with numpy requires numpy") from None
+
+    if isinstance(converted, list):
+        return np.array(converted, dtype=object)
+
+    return np.frombuffer(converted, dtype=converted.typecode)
@@ -22,6 +22,7 @@ __all__ = [
     "CommandException",
     "CommandNotFound",
     "BadArgument",
+    "BadFlag",
     "DuplicateCommand",
     "ModuleException",
     "ModuleRemoveException",
@@ -37,6 +38,9 @@ __all__ = [
     "TooManyArgs",
     "MissingArgs",
     "ConversionFailed",
+    "RESTBudgetExceeded",
+    "CommandTimeout",
+    "PayloadTooLarge",
 ]
 
 
@@ -66,6 +70,12 @@ class BadArgument(CommandException):
     """Raised when a bad argument is passed to a message command."""
 
 
+class BadFlag(BadArgument):
+    """Raised when an unknown flag, or a flag missing its value is
+    passed to a message command.
+    """
+
+
 class ConversionFailed(YamiException):
     """Raised when the conversion performed by a converter fails."""
 
@@ -120,3 +130,21 @@ class CheckFailed(CheckException):
 
 class ListenerException(YamiException):
     """Raised when an exception occurs relating to a module listener."""
+
+
+class RESTBudgetExceeded(CommandException):
+    """Raised when an invocation makes more REST calls than its strict
+    :obj:`~yami.RESTBudget` allows.
+    """
+
+
+class CommandTimeout(CommandException):
+    """Raised when a command callback runs past its timeout, and is
+    cancelled.
+    """
+
+
+class PayloadTooLarge(CommandException):
+    """Raised when the pickled arguments of a ``cpu_bound`` command are
+    larger than the bot allows.
+    """
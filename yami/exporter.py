@@ -0,0 +1,318 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module containing the Prometheus metrics exporter and health
+endpoints.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing
+
+import hikari
+
+from yami import metrics as metrics_
+
+if typing.TYPE_CHECKING:
+    from yami import bot as bot_
+
+__all__ = ["PrometheusRenderer", "MetricsServer"]
+
+_log = logging.getLogger(__name__)
+
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_OUTCOMES = {
+    "successes": "success",
+    "failures": "failure",
+    "check_failures": "check_failure",
+    "timeouts": "timeout",
+}
+_GAUGES = {
+    "queue_depth": "Invocations waiting for a scheduler worker.",
+    "in_flight": "Invocations running on scheduler workers.",
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_float(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+def _render_histogram(name: str, labels: str, hist: metrics_.Histogram) -> str:
+    lines: list[str] = []
+    running = 0
+    sep = "," if labels else ""
+
+    for bound, count in zip((*hist.bounds, float("inf")), hist.counts):
+        running += count
+        lines.append(f'{name}_bucket{{{labels}{sep}le="{_format_float(bound)}"}} {running}')
+
+    suffix = f"{{{labels}}}" if labels else ""
+    lines.append(f"{name}_sum{suffix} {_format_float(hist.sum)}")
+    lines.append(f"{name}_count{suffix} {hist.count}")
+    return "\n".join(lines)
+
+
+class PrometheusRenderer:
+    """Renders :obj:`~yami.Metrics` in the Prometheus text format.
+
+    The rendered series for each command and module are cached between
+    scrapes, and only rendered again once they have recorded a new
+    invocation. Rendering yields to the event loop between batches.
+
+    Args:
+        metrics (:obj:`~yami.Metrics`): The metrics to render.
+
+    Keyword Args:
+        batch_size (:obj:`int`): The number of series to render before
+            yielding to the event loop. Defaults to ``100``.
+    """
+
+    __slots__ = ("_metrics", "_batch_size", "_cache")
+
+    def __init__(self, metrics: metrics_.Metrics, *, batch_size: int = 100) -> None:
+        self._metrics = metrics
+        self._batch_size = batch_size
+        self._cache: dict[tuple[str, str], tuple[int, str]] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(cached={len(self._cache)})"
+
+    def _render_stats(
+        self, family: str, kind: str, name: str, stats: metrics_.InvocationStats
+    ) -> str:
+        key = (family, name)
+
+        if (cached := self._cache.get(key)) and cached[0] == stats.invocations:
+            return cached[1]
+
+        label = f'{kind}="{_escape(name)}"'
+
+        if family.endswith("_rest_calls_total"):
+            text = (
+                f'{family}{{{label},rate_limited="false"}} '
+                f"{stats.rest_calls - stats.rest_rate_limited}\n"
+                f'{family}{{{label},rate_limited="true"}} {stats.rest_rate_limited}'
+            )
+        elif family.endswith("_total"):
+            text = "\n".join(
+                f'{family}{{{label},outcome="{outcome}"}} {getattr(stats, attr)}'
+                for attr, outcome in _OUTCOMES.items()
+            )
+        else:
+            text = "\n".join(
+                _render_histogram(family, f'{label},stage="{stage}"', hist)
+                for stage, hist in stats.stages.items()
+            )
+
+        self._cache[key] = (stats.invocations, text)
+        return text
+
+    async def render(self) -> str:
+        """Renders the metrics.
+
+        Returns:
+            :obj:`str`: The metrics in the Prometheus text format.
+        """
+        m = self._metrics
+        parts = [
+            "# HELP yami_prefix_match_seconds Time spent matching messages to prefixes.",
+            "# TYPE yami_prefix_match_seconds histogram",
+            _render_histogram("yami_prefix_match_seconds", "", m.prefix),
+            "# HELP yami_rejected_messages_total Messages rejected by parse limits.",
+            "# TYPE yami_rejected_messages_total counter",
+            *(
+                f'yami_rejected_messages_total{{limit="{_escape(k)}"}} {v}'
+                for k, v in m.rejected.items()
+            ),
+            "# HELP yami_event_loop_lag_seconds How late the event loop was to wake up.",
+            "# TYPE yami_event_loop_lag_seconds histogram",
+            _render_histogram("yami_event_loop_lag_seconds", "", m.loop_lag),
+            "# HELP yami_event_loop_stalls_total Times the event loop stalled.",
+            "# TYPE yami_event_loop_stalls_total counter",
+            f"yami_event_loop_stalls_total {m.stalls}",
+            "# HELP yami_slow_invocations_total Callbacks that ran past the threshold.",
+            "# TYPE yami_slow_invocations_total counter",
+            *(
+                f'yami_slow_invocations_total{{command="{_escape(k)}"}} {v}'
+                for k, v in m.slow.items()
+            ),
+            "# HELP yami_queue_wait_seconds Time invocations waited for a worker.",
+            "# TYPE yami_queue_wait_seconds histogram",
+            _render_histogram("yami_queue_wait_seconds", "", m.queue_wait),
+            "# HELP yami_process_wait_seconds Time cpu bound invocations waited for a process.",
+            "# TYPE yami_process_wait_seconds histogram",
+            _render_histogram("yami_process_wait_seconds", "", m.process_wait),
+            "# HELP yami_shed_invocations_total Invocations shed by the scheduler.",
+            "# TYPE yami_shed_invocations_total counter",
+            *(
+                f'yami_shed_invocations_total{{reason="{_escape(k)}"}} {v}'
+                for k, v in m.shed.items()
+            ),
+        ]
+
+        for name, gauge in [*m.gauges.items()]:
+            help_ = _GAUGES.get(name, "A gauge from Metrics.gauges.")
+            parts.append(f"# HELP yami_{name} {help_}")
+            parts.append(f"# TYPE yami_{name} gauge")
+            parts.append(f"yami_{name} {_format_float(gauge())}")
+
+        rendered = 0
+        stale = set(self._cache)
+
+        for kind, stats in (("command", m.commands), ("module", m.modules)):
+            for family, type_, help_ in (
+                (f"yami_{kind}_invocations_total", "counter", "Invocations by outcome."),
+                (f"yami_{kind}_stage_seconds", "histogram", "Time spent in each stage."),
+                (
+                    f"yami_{kind}_rest_calls_total",
+                    "counter",
+                    "REST calls made by invocations. Only the 429s hikari gave up retrying "
+                    "are counted as rate limited.",
+                ),
+            ):
+                parts.append(f"# HELP {family} {help_}")
+                parts.append(f"# TYPE {family} {type_}")
+
+                for name, s in [*stats.items()]:
+                    if (rendered := rendered + 1) % self._batch_size == 0:
+                        await asyncio.sleep(0)
+
+                    parts.append(self._render_stats(family, kind, name, s))
+                    stale.discard((family, name))
+
+        # Forget the series of commands and modules that were removed.
+        for key in stale:
+            del self._cache[key]
+
+        return "\n".join(parts) + "\n"
+
+
+class MetricsServer:
+    """A small HTTP server exposing a bots metrics, and its health.
+
+    The server starts when the bot fires :obj:`~hikari.StartedEvent`
+    and stops on :obj:`~hikari.StoppingEvent`.
+
+    - ``GET /metrics`` - The metrics in the Prometheus text format.
+    - ``GET /livez`` - ``200`` while the event loop is serving.
+    - ``GET /readyz`` - ``200`` once the bot is ready to receive
+      commands, otherwise ``503``.
+
+    .. code-block:: python
+
+        bot = yami.Bot(token, "$")
+        yami.MetricsServer(bot, port=9090)
+        bot.run()
+
+    Args:
+        bot (:obj:`~yami.Bot`): The bot to serve metrics for.
+
+    Keyword Args:
+        host (:obj:`str`): The host to bind to. Defaults to
+            ``"127.0.0.1"``.
+        port (:obj:`int`): The port to bind to. Defaults to ``9090``.
+    """
+
+    __slots__ = ("_bot", "_host", "_port", "_renderer", "_server")
+
+    def __init__(self, bot: bot_.Bot, *, host: str = "127.0.0.1", port: int = 9090) -> None:
+        self._bot = bot
+        self._host = host
+        self._port = port
+        self._renderer = PrometheusRenderer(bot.metrics)
+        self._server: asyncio.base_events.Server | None = None
+
+        bot.subscribe(hikari.StartedEvent, self._on_started)
+        bot.subscribe(hikari.StoppingEvent, self._on_stopping)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._host}:{self._port})"
+
+    @property
+    def is_serving(self) -> bool:
+        """Whether or not the server is currently serving."""
+        return self._server is not None and self._server.is_serving()
+
+    @property
+    def sockets(self) -> tuple[typing.Any, ...]:
+        """The sockets the server is listening on."""
+        return tuple(self._server.sockets) if self._server else ()
+
+    async def _on_started(self, _: hikari.StartedEvent) -> None:
+        await self.start()
+
+    async def _on_stopping(self, _: hikari.StoppingEvent) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        """Starts the server, if it is not already serving."""
+        if self._server is None:
+            self._server = await asyncio.start_server(self._handle, self._host, self._port)
+            _log.info("%s is now serving metrics", self)
+
+    async def stop(self) -> None:
+        """Stops the server, if it is serving."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _route(self, path: str) -> tuple[str, str, str]:
+        if path == "/metrics":
+            return "200 OK", _CONTENT_TYPE, await self._renderer.render()
+
+        if path == "/livez":
+            return "200 OK", "text/plain", "ok\n"
+
+        if path == "/readyz":
+            if self._bot.is_ready:
+                return "200 OK", "text/plain", "ready\n"
+
+            return "503 Service Unavailable", "text/plain", "not ready\n"
+
+        return "404 Not Found", "text/plain", "not found\n"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await reader.readline()
+
+            while await reader.readline() not in (b"\r\n", b"\n", b""):
+                continue
+
+            method, path, *_ = request.decode("latin-1").split() + ["", ""]
+
+            if method != "GET":
+                status, content_type, body = "405 Method Not Allowed", "text/plain", ""
+            else:
+                status, content_type, body = await self._route(path.split("?")[0])
+
+            payload = body.encode()
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode() + payload
+            )
+            await writer.drain()
+
+        except Exception as e:
+            _log.warning("%s failed to handle a request: %r", self, e)
+
+        finally:
+            writer.close()
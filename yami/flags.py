@@ -0,0 +1,244 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module containing the POSIX style flag argument interface."""
+
+from __future__ import annotations
+
+import typing
+from typing import Any, ClassVar, Dict, Sequence, Tuple
+
+from yami import converters, exceptions
+
+__all__ = ["FlagSpec", "flag"]
+
+_MISSING: Any = object()
+
+
+class _Flag:
+    """A single compiled flag."""
+
+    __slots__ = ("name", "type", "default", "is_switch", "names")
+
+    def __init__(self, name: str, type_: Any, default: Any, names: Sequence[str]) -> None:
+        self.name = name
+        self.type = type_
+        self.default = default
+        self.is_switch = type_ is bool
+        self.names = tuple(names)
+
+
+class _FlagDefault:
+    """The default and extra names for a flag, created by
+    :obj:`flag`.
+    """
+
+    __slots__ = ("default", "short", "aliases")
+
+    def __init__(self, default: Any, short: str | None, aliases: Sequence[str]) -> None:
+        self.default = default
+        self.short = short
+        self.aliases = aliases
+
+
+def flag(default: Any = _MISSING, *, short: str | None = None, aliases: Sequence[str] = ()) -> Any:
+    """Customizes a field on a :obj:`FlagSpec`.
+
+    Args:
+        default (:obj:`~typing.Any`): The default value for the flag.
+            If omitted the flag is required.
+
+    Keyword Args:
+        short (:obj:`str` | :obj:`None`): A single character short
+            alias for the flag, i.e. ``"l"`` for ``-l``.
+        aliases (:obj:`~typing.Sequence` [:obj:`str`]): Any additional
+            names the flag can be passed with, including their dashes.
+
+    Returns:
+        :obj:`~typing.Any`: The flags field definition.
+    """
+    return _FlagDefault(default, short, aliases)
+
+
+def _unwrap_optional(type_: Any) -> Any:
+    """Unwraps ``T | None`` to ``T``."""
+    if typing.get_origin(type_) is typing.Union:
+        args = [a for a in typing.get_args(type_) if a is not type(None)]
+
+        if len(args) == 1:
+            return args[0]
+
+    return type_
+
+
+class FlagSpec:
+    """Base class for flag argument specs.
+
+    Each annotated field on the subclass is a flag. Fields are passed
+    as ``--name value`` or ``--name=value``, and :obj:`bool` fields are
+    switches that are :obj:`True` when present. Values are converted
+    with the builtin converters.
+
+    When a command callback has a parameter annotated with a
+    :obj:`FlagSpec` subclass, that parameter consumes the rest of the
+    message. The spec is compiled into a lookup table once, when the
+    command is registered.
+
+    .. code-block:: python
+
+        class PurgeFlags(yami.FlagSpec):
+            limit: int = yami.flag(100, short="l")
+            user: typing.Optional[str] = None
+            before: typing.Optional[int] = None
+            silent: bool = False
+
+        @bot.command("purge")
+        async def purge_cmd(
+            ctx: yami.MessageContext, flags: PurgeFlags
+        ) -> None:
+            # $purge --limit 500 --user @x --before 123 -s
+            ...
+    """
+
+    # Evaluated by typing.get_type_hints, so these can't use the builtin
+    # generics until Python 3.9.
+    __yami_flags__: ClassVar[Dict[str, _Flag]]
+    __yami_fields__: ClassVar[Tuple[_Flag, ...]]
+
+    def __init__(self, **values: Any) -> None:
+        for f in self.compile():
+            if f.name in values:
+                setattr(self, f.name, values[f.name])
+            elif f.default is _MISSING:
+                raise exceptions.MissingArgs(f"{self.__class__.__name__} requires --{f.name}")
+            else:
+                setattr(self, f.name, f.default)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{f.name}={getattr(self, f.name)!r}" for f in self.compile())
+        return f"{self.__class__.__name__}({values})"
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return all(getattr(self, f.name) == getattr(other, f.name) for f in self.compile())
+
+    @classmethod
+    def compile(cls) -> tuple[_Flag, ...]:
+        """Compiles the specs fields into its flag lookup table. This
+        only does work the first time it is called for each subclass.
+
+        Returns:
+            :obj:`tuple`: The compiled flags.
+        """
+        if "__yami_fields__" in cls.__dict__:
+            return cls.__yami_fields__
+
+        fields: list[_Flag] = []
+        table: dict[str, _Flag] = {}
+
+        for name, type_ in typing.get_type_hints(cls).items():
+            if name.startswith("_"):
+                continue
+
+            default = getattr(cls, name, _MISSING)
+            names = [f"--{name}", f"--{name.replace('_', '-')}"]
+
+            if isinstance(default, _FlagDefault):
+                if default.short:
+                    names.append(f"-{default.short}")
+
+                names.extend(default.aliases)
+                default = default.default
+
+            fields.append(f := _Flag(name, _unwrap_optional(type_), default, names))
+
+            for n in f.names:
+                if n in table and table[n] is not f:
+                    raise exceptions.BadFlag(f"{cls.__name__} uses flag {n!r} more than once")
+
+                table[n] = f
+
+        cls.__yami_flags__ = table
+        cls.__yami_fields__ = tuple(fields)
+        return cls.__yami_fields__
+
+    @classmethod
+    def _convert(cls, f: _Flag, value: str) -> Any:
+        if f.type in converters.BUILTIN_CAN_CONVERT:
+            try:
+                return converters.BuiltinConverter(value).as_type(f.type)
+            except exceptions.ConversionFailed:
+                raise exceptions.ConversionFailed(
+                    f"Failed to convert flag --{f.name} to {f.type.__name__}: {value!r}"
+                ) from None
+
+        return value
+
+    @classmethod
+    def parse(cls, tokens: Sequence[str]) -> FlagSpec:
+        """Parses the given tokens into an instance of this spec.
+
+        Args:
+            tokens (:obj:`~typing.Sequence` [:obj:`str`]): The tokens
+                to parse.
+
+        Returns:
+            :obj:`FlagSpec`: The parsed flags.
+
+        Raises:
+            :obj:`~yami.BadFlag`: When an unknown flag is passed, or a
+                flag is missing its value.
+            :obj:`~yami.MissingArgs`: When a required flag is missing.
+            :obj:`~yami.ConversionFailed`: When a value can't be
+                converted to its fields type.
+        """
+        cls.compile()
+        table = cls.__yami_flags__
+        values: dict[str, Any] = {}
+        tokens_l = len(tokens)
+        i = 0
+
+        while i < tokens_l:
+            name, sep, value = tokens[i].partition("=")
+
+            if not (f := table.get(name)):
+                # Clustered short switches, i.e. -abc
+                if name[:1] == "-" and name[1:2] != "-" and not sep:
+                    cluster = [table.get(f"-{c}") for c in name[1:]]
+
+                    if cluster and all(c and c.is_switch for c in cluster):
+                        values.update((c.name, True) for c in cluster)  # type: ignore
+                        i += 1
+                        continue
+
+                raise exceptions.BadFlag(f"Unknown flag {tokens[i]!r} for {cls.__name__}")
+
+            if f.is_switch:
+                values[f.name] = cls._convert(f, value) if sep else True
+
+            elif sep:
+                values[f.name] = cls._convert(f, value)
+
+            elif (i := i + 1) < tokens_l:
+                values[f.name] = cls._convert(f, tokens[i])
+
+            else:
+                raise exceptions.BadFlag(f"Flag {name!r} is missing its value")
+
+            i += 1
+
+        return cls(**values)
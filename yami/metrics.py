@@ -0,0 +1,413 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module containing the metrics Yami collects for each invocation."""
+
+from __future__ import annotations
+
+import bisect
+import typing
+
+__all__ = ["Histogram", "InvocationStats", "Metrics"]
+
+STAGES = ("resolution", "checks", "conversion", "callback")
+"""The stages of an invocation that are timed, in order."""
+
+DEFAULT_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""The default histogram bucket upper bounds, in seconds."""
+
+
+class Histogram:
+    """A fixed bucket latency histogram. Recording a value is
+    constant time, and the memory used never grows.
+
+    Args:
+        buckets (:obj:`~typing.Sequence` [:obj:`float`]): The sorted
+            upper bounds of each bucket, in seconds. A final bucket for
+            values above the last bound is always added. Defaults to
+            :obj:`DEFAULT_BUCKETS`.
+    """
+
+    __slots__ = ("_bounds", "_counts", "_sum", "_count")
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._bounds = tuple(buckets)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0.0
+        self._count = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(count={self._count}, sum={self._sum:.6f})"
+
+    @property
+    def bounds(self) -> tuple[float, ...]:
+        """The upper bounds of each bucket, in seconds."""
+        return self._bounds
+
+    @property
+    def counts(self) -> list[int]:
+        """The number of values recorded in each bucket. The last item
+        is the count of values above the highest bound.
+        """
+        return self._counts
+
+    @property
+    def count(self) -> int:
+        """The total number of values recorded."""
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        """The sum of all values recorded, in seconds."""
+        return self._sum
+
+    def record(self, value: float) -> None:
+        """Records a value.
+
+        Args:
+            value (:obj:`float`): The value to record, in seconds.
+        """
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self._sum += value
+        self._count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile as the upper bound of the bucket it
+        falls in.
+
+        Args:
+            q (:obj:`float`): The quantile, between ``0`` and ``1``.
+
+        Returns:
+            :obj:`float`: The estimated value in seconds, ``0.0`` if
+            nothing was recorded, or ``inf`` if it is above the highest
+            bound.
+        """
+        if not self._count:
+            return 0.0
+
+        target = q * self._count
+        running = 0
+
+        for bound, count in zip(self._bounds, self._counts):
+            running += count
+
+            if running >= target:
+                return bound
+
+        return float("inf")
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        """Takes a snapshot of the histogram.
+
+        Returns:
+            :obj:`dict` [:obj:`str`, :obj:`~typing.Any`]: The count,
+            sum, estimated p50 and p99, and the bucket counts.
+        """
+        return {
+            "count": self._count,
+            "sum": self._sum,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip((*self._bounds, float("inf")), self._counts)),
+        }
+
+
+class InvocationStats:
+    """The invocation counts and stage latencies for a command or
+    module.
+    """
+
+    __slots__ = (
+        "invocations",
+        "successes",
+        "failures",
+        "check_failures",
+        "timeouts",
+        "rest_calls",
+        "rest_rate_limited",
+        "stages",
+    )
+
+    def __init__(self) -> None:
+        self.invocations = 0
+        self.successes = 0
+        self.failures = 0
+        self.check_failures = 0
+        self.timeouts = 0
+        self.rest_calls = 0
+        self.rest_rate_limited = 0
+        self.stages: dict[str, Histogram] = {s: Histogram() for s in (*STAGES, "total")}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(invocations={self.invocations}, "
+            f"successes={self.successes}, failures={self.failures})"
+        )
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        """Takes a snapshot of these stats.
+
+        Returns:
+            :obj:`dict` [:obj:`str`, :obj:`~typing.Any`]: The counts
+            and a snapshot of each stages histogram.
+        """
+        return {
+            "invocations": self.invocations,
+            "successes": self.successes,
+            "failures": self.failures,
+            "check_failures": self.check_failures,
+            "timeouts": self.timeouts,
+            "rest_calls": self.rest_calls,
+            "rest_rate_limited": self.rest_rate_limited,
+            "stages": {k: v.snapshot() for k, v in self.stages.items()},
+        }
+
+
+class Metrics:
+    """The metrics collected by a :obj:`~yami.Bot`, accessed through
+    :obj:`~yami.Bot.metrics`.
+
+    .. warning::
+        This class should not be instantiated manually, the bot creates
+        it.
+    """
+
+    __slots__ = (
+        "_prefix",
+        "_commands",
+        "_modules",
+        "_rejected",
+        "_loop_lag",
+        "_slow",
+        "_queue_wait",
+        "_process_wait",
+        "_shed",
+        "_gauges",
+        "stalls",
+    )
+
+    def __init__(self) -> None:
+        self._prefix = Histogram()
+        self._commands: dict[str, InvocationStats] = {}
+        self._modules: dict[str, InvocationStats] = {}
+        self._rejected: dict[str, int] = {}
+        self._loop_lag = Histogram()
+        self._slow: dict[str, int] = {}
+        self._queue_wait = Histogram()
+        self._process_wait = Histogram()
+        self._shed: dict[str, int] = {}
+        self._gauges: dict[str, typing.Callable[[], float]] = {}
+        self.stalls = 0
+        """The number of times the event loop stalled for longer than
+        the :obj:`~yami.Watchdog` threshold.
+        """
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(commands={len(self._commands)})"
+
+    @property
+    def prefix(self) -> Histogram:
+        """The latency of matching each message against the prefixes."""
+        return self._prefix
+
+    @property
+    def commands(self) -> dict[str, InvocationStats]:
+        """A dictionary of qualified command name, stats pairs."""
+        return self._commands
+
+    @property
+    def modules(self) -> dict[str, InvocationStats]:
+        """A dictionary of module name, stats pairs."""
+        return self._modules
+
+    @property
+    def rejected(self) -> dict[str, int]:
+        """A dictionary of limit name, count pairs for messages that
+        were rejected for exceeding a :obj:`~yami.ParseLimits`.
+        """
+        return self._rejected
+
+    @property
+    def loop_lag(self) -> Histogram:
+        """How late the event loop was to wake up, measured by the
+        :obj:`~yami.Watchdog`.
+        """
+        return self._loop_lag
+
+    @property
+    def slow(self) -> dict[str, int]:
+        """A dictionary of qualified command name, count pairs for
+        callbacks that ran past the :obj:`~yami.Watchdog` threshold.
+        """
+        return self._slow
+
+    @property
+    def queue_wait(self) -> Histogram:
+        """How long invocations waited in the :obj:`~yami.Scheduler`
+        queue for a worker.
+        """
+        return self._queue_wait
+
+    @property
+    def process_wait(self) -> Histogram:
+        """How long ``cpu_bound`` invocations waited for a process in
+        the bots process pool.
+        """
+        return self._process_wait
+
+    @property
+    def shed(self) -> dict[str, int]:
+        """A dictionary of reason, count pairs for invocations the
+        :obj:`~yami.Scheduler` shed, either ``"rejected"`` or
+        ``"dropped"``.
+        """
+        return self._shed
+
+    @property
+    def gauges(self) -> dict[str, typing.Callable[[], float]]:
+        """A dictionary of name, callback pairs for values that are read
+        when the metrics are exported, i.e. ``"queue_depth"`` and
+        ``"in_flight"``.
+        """
+        return self._gauges
+
+    def reject(self, limit: str) -> None:
+        """Counts a message rejected for exceeding a limit.
+
+        Args:
+            limit (:obj:`str`): The name of the limit.
+        """
+        self._rejected[limit] = self._rejected.get(limit, 0) + 1
+
+    def record(
+        self,
+        command: str,
+        module: str | None,
+        outcome: str,
+        stages: typing.Sequence[float | None],
+        *,
+        rest_calls: int = 0,
+        rate_limited: int = 0,
+    ) -> None:
+        """Records a completed invocation.
+
+        Args:
+            command (:obj:`str`): The qualified name of the command.
+            module (:obj:`str` | :obj:`None`): The name of the commands
+                module, if any.
+            outcome (:obj:`str`): One of ``"success"``, ``"failure"``,
+                ``"check_failure"`` or ``"timeout"``.
+            stages (:obj:`~typing.Sequence`): The :obj:`float` seconds
+                spent in each of :obj:`STAGES`, or :obj:`None` for
+                stages that were not reached.
+
+        Keyword Args:
+            rest_calls (:obj:`int`): The number of REST calls made.
+                Defaults to ``0``.
+            rate_limited (:obj:`int`): The number of REST calls that
+                failed with a rate limit, after hikari stopped retrying
+                them. Defaults to ``0``.
+        """
+        if not (stats := self._commands.get(command)):
+            stats = self._commands[command] = InvocationStats()
+
+        targets: tuple[InvocationStats, ...] = (stats,)
+
+        if module is not None:
+            if not (mod_stats := self._modules.get(module)):
+                mod_stats = self._modules[module] = InvocationStats()
+
+            targets = (stats, mod_stats)
+
+        total = 0.0
+        for target in targets:
+            target.invocations += 1
+            target.rest_calls += rest_calls
+            target.rest_rate_limited += rate_limited
+
+            if outcome == "success":
+                target.successes += 1
+            elif outcome == "check_failure":
+                target.check_failures += 1
+            elif outcome == "timeout":
+                target.timeouts += 1
+            else:
+                target.failures += 1
+
+        for name, value in zip(STAGES, stages):
+            if value is not None:
+                total += value
+
+                for target in targets:
+                    target.stages[name].record(value)
+
+        for target in targets:
+            target.stages["total"].record(total)
+
+    def forget(self, command: str) -> None:
+        """Forgets the stats of a removed command and its subcommands,
+        so they are no longer exported. The bot calls this from
+        :obj:`~yami.Bot.remove_command`.
+
+        Args:
+            command (:obj:`str`): The name of the command.
+        """
+        prefix = f"{command} "
+
+        for name in [n for n in self._commands if n == command or n.startswith(prefix)]:
+            del self._commands[name]
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        """Takes a snapshot of all the metrics.
+
+        Returns:
+            :obj:`dict` [:obj:`str`, :obj:`~typing.Any`]: The prefix
+            histogram, rejection counts, loop lag, and the stats for
+            each command and module.
+        """
+        return {
+            "prefix": self._prefix.snapshot(),
+            "rejected": {**self._rejected},
+            "loop_lag": self._loop_lag.snapshot(),
+            "slow": {**self._slow},
+            "stalls": self.stalls,
+            "queue_wait": self._queue_wait.snapshot(),
+            "process_wait": self._process_wait.snapshot(),
+            "shed": {**self._shed},
+            "gauges": {k: v() for k, v in self._gauges.items()},
+            "commands": {k: v.snapshot() for k, v in self._commands.items()},
+            "modules": {k: v.snapshot() for k, v in self._modules.items()},
+        }
@@ -66,6 +66,11 @@ class Module:
         self._listeners: dict[hikari.Event, Callable[..., Coroutine[Any, Any, None]]] = {}
 
         for cmd in inspect.getmembers(self, lambda m: isinstance(m, commands_.MessageCommand)):
+            if cmd[1].cpu_bound:
+                raise ValueError(
+                    f"cpu_bound command {cmd[1].name!r} can not be a method of {self._name}"
+                )
+
             cmd[1]._module = self
             if not cmd[1].is_subcommand:
                 self.add_command(cmd[1])
@@ -129,7 +134,7 @@ class Module:
             :obj:`~yami.DuplicateCommand`: When a command with this name
                 already exists.
         """
-        _log.debug(f"Adding {command} to {self}")
+        _log.debug("Adding %s to %s", command, self)
 
         if command.name in self._commands:
             raise exceptions.DuplicateCommand(
@@ -164,5 +169,5 @@ class Module:
             self._bot.remove_command(name)
 
         cmd = self._commands.pop(name)
-        _log.debug(f"Removed {cmd} from {self}")
+        _log.debug("Removed %s from %s", cmd, self)
         return cmd
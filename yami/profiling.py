@@ -0,0 +1,258 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module containing the opt-in per command profiler."""
+
+from __future__ import annotations
+
+import logging
+import marshal
+import sys
+import time
+import types
+import typing
+from pathlib import Path
+
+__all__ = ["CommandProfiler"]
+
+_log = logging.getLogger(__name__)
+
+_FuncKey = typing.Tuple[str, int, str]
+
+
+def _c_key(func: typing.Any) -> _FuncKey:
+    owner = getattr(func, "__self__", None)
+
+    if owner is None or isinstance(owner, types.ModuleType):
+        name = f"<built-in method {func.__name__}>"
+    else:
+        name = f"<method '{func.__name__}' of '{type(owner).__name__}' objects>"
+
+    return ("~", 0, name)
+
+
+class _Profile:
+    """A deterministic profiler, recording full call stacks so it can
+    write collapsed stacks as well as :obj:`pstats` data.
+    """
+
+    __slots__ = ("stats", "collapsed", "_stack", "_active")
+
+    def __init__(self) -> None:
+        # func -> [primitive calls, calls, own time, cumulative time,
+        # callers]
+        self.stats: dict[_FuncKey, list[typing.Any]] = {}
+        self.collapsed: dict[str, float] = {}
+        # [func, label, start, time spent in children]
+        self._stack: list[list[typing.Any]] = []
+        self._active: dict[_FuncKey, int] = {}
+
+    def hook(self, frame: types.FrameType, event: str, arg: typing.Any) -> None:
+        now = time.perf_counter()
+        stack = self._stack
+
+        if event == "call":
+            code = frame.f_code
+            key = (code.co_filename, code.co_firstlineno, code.co_name)
+            label = f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+        elif event == "c_call":
+            if not stack:
+                # The profilers own bookkeeping, outside the invocation.
+                return None
+
+            key = _c_key(arg)
+            label = key[2]
+        else:
+            # Ignore returns that do not match the top of the stack,
+            # from calls made before the profiler was set.
+            if stack and (event == "return") is (stack[-1][0][0] != "~"):
+                self._pop(now)
+
+            return None
+
+        stack.append([key, label, now, 0.0])
+        self._active[key] = self._active.get(key, 0) + 1
+
+    def _pop(self, now: float) -> None:
+        stack = self._stack
+        key, _, start, children = stack[-1]
+        elapsed = now - start
+        own = elapsed - children
+        self._active[key] -= 1
+        recursive = self._active[key] > 0
+
+        entry = self.stats.setdefault(key, [0, 0, 0.0, 0.0, {}])
+        entry[1] += 1
+        entry[2] += own
+
+        if not recursive:
+            entry[0] += 1
+            entry[3] += elapsed
+
+        path = ";".join(s[1] for s in stack)
+        self.collapsed[path] = self.collapsed.get(path, 0.0) + own
+        stack.pop()
+
+        if stack:
+            stack[-1][3] += elapsed
+            caller = entry[4].setdefault(stack[-1][0], [0, 0, 0.0, 0.0])
+            caller[1] += 1
+            caller[2] += own
+
+            if not recursive:
+                caller[0] += 1
+                caller[3] += elapsed
+
+    def reset_stack(self) -> None:
+        self._stack.clear()
+        self._active.clear()
+
+    @property
+    def pstats_data(self) -> dict[_FuncKey, tuple[typing.Any, ...]]:
+        return {
+            key: (pc, nc, tt, ct, {c: tuple(v) for c, v in callers.items()})
+            for key, (pc, nc, tt, ct, callers) in self.stats.items()
+        }
+
+
+class _Profiled:
+    """Drives a coroutine, profiling only while it is running, so other
+    tasks that run while it is suspended are not included.
+    """
+
+    __slots__ = ("_coro", "_profile")
+
+    def __init__(self, coro: typing.Coroutine[typing.Any, typing.Any, None], profile: _Profile):
+        self._coro = coro
+        self._profile = profile
+
+    def __await__(self) -> typing.Generator[typing.Any, None, None]:
+        it = self._coro.__await__()
+        hook = self._profile.hook
+        value: typing.Any = None
+        error: BaseException | None = None
+
+        while True:
+            sys.setprofile(hook)
+
+            try:
+                yielded = it.throw(error) if error else it.send(value)
+            except StopIteration:
+                return None
+            finally:
+                sys.setprofile(None)
+                self._profile.reset_stack()
+
+            try:
+                value, error = (yield yielded), None
+            except GeneratorExit:
+                self._coro.close()
+                raise
+            except BaseException as e:
+                value, error = None, e
+
+
+class CommandProfiler:
+    """Profiles the next invocations of a command, then writes the
+    results to disk. Created with :obj:`~yami.Bot.profile_command`.
+
+    Two files are written, named after the command:
+
+    - ``<name>.pstats``, which can be loaded with :obj:`pstats.Stats`
+      or tools like snakeviz.
+    - ``<name>.collapsed``, collapsed stacks in microseconds, which can
+      be rendered by flamegraph.pl, inferno or speedscope.
+
+    Only the time the invocation spends running is profiled, other
+    tasks that run while it awaits are not included.
+
+    Args:
+        name (:obj:`str`): The qualified name of the command.
+        samples (:obj:`int`): The number of invocations to profile.
+        directory (:obj:`~pathlib.Path`): Where to write the files.
+
+    .. warning::
+        This class should not be instantiated manually, use
+        :obj:`~yami.Bot.profile_command` instead.
+    """
+
+    __slots__ = ("_name", "_samples", "_remaining", "_pending", "_directory", "_profile", "_paths")
+
+    def __init__(self, name: str, samples: int, directory: Path) -> None:
+        self._name = name
+        self._samples = samples
+        self._remaining = samples
+        self._pending = 0
+        self._directory = directory
+        self._profile = _Profile()
+        self._paths: tuple[Path, Path] | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._name!r}, remaining={self._remaining})"
+
+    @property
+    def name(self) -> str:
+        """The qualified name of the command being profiled."""
+        return self._name
+
+    @property
+    def samples(self) -> int:
+        """The number of invocations to profile."""
+        return self._samples
+
+    @property
+    def remaining(self) -> int:
+        """The number of invocations left to start profiling."""
+        return self._remaining
+
+    @property
+    def is_done(self) -> bool:
+        """Whether every sample was profiled, and the files written."""
+        return self._paths is not None
+
+    @property
+    def paths(self) -> tuple[Path, Path] | None:
+        """The pstats and collapsed stacks files, once written."""
+        return self._paths
+
+    async def _run(self, coro: typing.Coroutine[typing.Any, typing.Any, None]) -> None:
+        """Profiles one invocation."""
+        self._remaining -= 1
+        self._pending += 1
+
+        try:
+            await _Profiled(coro, self._profile)
+        finally:
+            self._pending -= 1
+
+            if not self._remaining and not self._pending:
+                self._write()
+
+    def _write(self) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        stem = self._name.replace(" ", "_")
+        stats_path = self._directory / f"{stem}.pstats"
+        collapsed_path = self._directory / f"{stem}.collapsed"
+
+        with open(stats_path, "wb") as f:
+            marshal.dump(self._profile.pstats_data, f)
+
+        with open(collapsed_path, "w") as f:
+            for path, seconds in sorted(self._profile.collapsed.items()):
+                if (us := round(seconds * 1_000_000)) > 0:
+                    f.write(f"{path} {us}\n")
+
+        self._paths = (stats_path, collapsed_path)
+        _log.info("Profiled %s invocations of %r to %s", self._samples, self._name, stats_path)
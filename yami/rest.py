@@ -0,0 +1,220 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module containing the instrumented REST client wrapper."""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+import logging
+import typing
+
+import hikari
+
+from yami import exceptions, tracing
+
+__all__ = ["InstrumentedREST", "RESTBudget", "RESTUsage", "current_usage"]
+
+_log = logging.getLogger(__name__)
+_RATE_LIMITED = (hikari.RateLimitedError, hikari.RateLimitTooLongError)
+_usage: contextvars.ContextVar[RESTUsage | None] = contextvars.ContextVar(
+    "yami_rest_usage", default=None
+)
+
+
+class RESTBudget:
+    """The number of REST calls one invocation of a command may make.
+
+    Args:
+        max_calls (:obj:`int`): The maximum number of calls.
+
+    Keyword Args:
+        strict (:obj:`bool`): Whether or not to raise
+            :obj:`~yami.RESTBudgetExceeded` instead of making the call
+            that would exceed the budget. When :obj:`False` a warning is
+            logged instead. Defaults to :obj:`False`.
+    """
+
+    __slots__ = ("_max_calls", "_strict")
+
+    def __init__(self, max_calls: int, *, strict: bool = False) -> None:
+        self._max_calls = max_calls
+        self._strict = strict
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._max_calls}, strict={self._strict})"
+
+    @property
+    def max_calls(self) -> int:
+        """The maximum number of calls."""
+        return self._max_calls
+
+    @property
+    def strict(self) -> bool:
+        """Whether or not exceeding the budget raises."""
+        return self._strict
+
+
+class RESTUsage:
+    """The REST calls made during one invocation of a command, including
+    the calls made implicitly by checks and the ``getch_*`` helpers.
+
+    .. warning::
+        This class should not be instantiated manually, the bot creates
+        one for each invocation. Use :obj:`current_usage` to access it.
+    """
+
+    __slots__ = ("_command", "_budget", "_calls", "_total", "_rate_limited", "_warned")
+
+    def __init__(self, command: str, budget: RESTBudget | None = None) -> None:
+        self._command = command
+        self._budget = budget
+        self._calls: dict[str, int] = {}
+        self._total = 0
+        self._rate_limited = 0
+        self._warned = False
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._command!r}, total={self._total})"
+
+    @property
+    def command(self) -> str:
+        """The qualified name of the command being invoked."""
+        return self._command
+
+    @property
+    def budget(self) -> RESTBudget | None:
+        """The commands budget, if any."""
+        return self._budget
+
+    @property
+    def calls(self) -> dict[str, int]:
+        """A dictionary of method name, count pairs."""
+        return self._calls
+
+    @property
+    def total(self) -> int:
+        """The total number of calls made."""
+        return self._total
+
+    @property
+    def rate_limited(self) -> int:
+        """The number of calls that failed with a rate limit (429).
+        Hikari retries most 429s internally, so this only counts the
+        calls it gave up on, not every 429 the API returned.
+        """
+        return self._rate_limited
+
+    def record(self, name: str) -> None:
+        """Records a call, enforcing the budget.
+
+        Args:
+            name (:obj:`str`): The name of the method being called.
+
+        Raises:
+            :obj:`~yami.RESTBudgetExceeded`: When the call would exceed
+                a strict budget.
+        """
+        if (budget := self._budget) and self._total >= budget.max_calls:
+            message = (
+                f"Command {self._command!r} exceeded its budget of "
+                f"{budget.max_calls} REST calls, calling {name!r}"
+            )
+
+            if budget.strict:
+                raise exceptions.RESTBudgetExceeded(message)
+
+            if not self._warned:
+                self._warned = True
+                _log.warning(message)
+
+        self._total += 1
+        self._calls[name] = self._calls.get(name, 0) + 1
+
+
+def current_usage() -> RESTUsage | None:
+    """Gets the REST usage of the running invocation.
+
+    Returns:
+        :obj:`RESTUsage` | :obj:`None`: The usage, or :obj:`None` if no
+            invocation is running, or REST accounting is disabled.
+    """
+    return _usage.get()
+
+
+class InstrumentedREST:
+    """Wraps the bots REST client, so calls made while a trace is in
+    progress are recorded as spans, and calls made during an invocation
+    are counted towards its :obj:`RESTUsage`.
+
+    Every attribute of the wrapped client is available, only coroutine
+    methods are instrumented.
+
+    Args:
+        rest (:obj:`~hikari.api.rest.RESTClient`): The client to wrap.
+
+    .. warning::
+        This class should not be instantiated manually, it is used by
+        :obj:`~yami.Bot.rest` when instrumentation is enabled.
+    """
+
+    __slots__ = ("_rest", "_wrapped")
+
+    def __init__(self, rest: hikari.api.RESTClient) -> None:
+        self._rest = rest
+        self._wrapped: dict[str, typing.Callable[..., typing.Any]] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._rest!r})"
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if wrapped := self._wrapped.get(name):
+            return wrapped
+
+        attr = getattr(self._rest, name)
+
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        wrapped = self._wrapped[name] = self._wrap(name, attr)
+        return wrapped
+
+    @property
+    def wrapped(self) -> hikari.api.RESTClient:
+        """The REST client being wrapped."""
+        return self._rest
+
+    def _wrap(
+        self, name: str, method: typing.Callable[..., typing.Awaitable[typing.Any]]
+    ) -> typing.Callable[..., typing.Awaitable[typing.Any]]:
+        span_name = f"rest.{name}"
+
+        @functools.wraps(method)
+        async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            if usage := _usage.get():
+                usage.record(name)
+
+            with tracing.span(span_name):
+                try:
+                    return await method(*args, **kwargs)
+                except _RATE_LIMITED:
+                    if usage:
+                        usage._rate_limited += 1
+
+                    raise
+
+        return wrapper
@@ -0,0 +1,440 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module containing the bounded invocation scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import logging
+import time
+import typing
+
+import hikari
+
+if typing.TYPE_CHECKING:
+    from yami import bot as bot_
+
+__all__ = ["Scheduler", "KeyedExecutor", "owners_first"]
+
+_log = logging.getLogger(__name__)
+
+PriorityT = typing.Callable[["bot_.Bot", hikari.MessageCreateEvent], int]
+"""Gets the priority of a message, lower priorities run first."""
+
+POLICIES = ("reject", "drop_lowest")
+"""The shedding policies used when the queue is full."""
+
+
+def owners_first(bot: bot_.Bot, event: hikari.MessageCreateEvent) -> int:
+    """The default priority, the bots owners run first.
+
+    Args:
+        bot (:obj:`~yami.Bot`): The bot.
+        event (:obj:`~hikari.MessageCreateEvent`): The message event.
+
+    Returns:
+        :obj:`int`: ``0`` for the bots owners, otherwise ``1``.
+    """
+    return 0 if event.author_id in bot.owner_ids else 1
+
+
+class Scheduler:
+    """Queues invocations between receiving a message and invoking the
+    command, running them on a fixed number of workers. When the queue
+    is full, new work is shed instead of accepted.
+
+    The scheduler starts when the bot fires :obj:`~hikari.StartedEvent`,
+    messages received before then are invoked immediately.
+
+    .. code-block:: python
+
+        bot = yami.Bot(token, "$", scheduler=yami.Scheduler(workers=32))
+
+    Keyword Args:
+        workers (:obj:`int`): The number of invocations that can run at
+            once. Defaults to ``64``.
+        max_queue (:obj:`int`): The number of invocations that can wait
+            for a worker. Defaults to ``1024``.
+        priority (:obj:`~typing.Callable` [[:obj:`~yami.Bot`, \
+            :obj:`~hikari.MessageCreateEvent`], :obj:`int`]): Gets
+            the priority of a message, lower priorities run first.
+            Defaults to :obj:`owners_first`.
+        policy (:obj:`str`): What to do when the queue is full, either
+            ``"reject"`` to reject the new invocation, or
+            ``"drop_lowest"`` to drop the lowest priority invocation in
+            the queue if the new one has a higher priority. Defaults to
+            ``"drop_lowest"``.
+    """
+
+    __slots__ = (
+        "_workers",
+        "_max_queue",
+        "_priority",
+        "_policy",
+        "_bot",
+        "_queue",
+        "_available",
+        "_tasks",
+        "_seq",
+        "_in_flight",
+        "_idle",
+    )
+
+    def __init__(
+        self,
+        *,
+        workers: int = 64,
+        max_queue: int = 1024,
+        priority: PriorityT = owners_first,
+        policy: str = "drop_lowest",
+    ) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}, not {policy!r}")
+
+        if workers < 1 or max_queue < 0:
+            raise ValueError("workers must be at least 1, and max_queue at least 0")
+
+        self._workers = workers
+        self._max_queue = max_queue
+        self._priority = priority
+        self._policy = policy
+        self._bot: bot_.Bot | None = None
+        self._queue: list[tuple[int, int, float, typing.Any, tuple[typing.Any, ...]]] = []
+        self._available: asyncio.Semaphore | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._seq = 0
+        self._in_flight = 0
+        self._idle: asyncio.Event | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(workers={self._workers}, "
+            f"queued={len(self._queue)}, in_flight={self._in_flight})"
+        )
+
+    @property
+    def workers(self) -> int:
+        """The number of invocations that can run at once."""
+        return self._workers
+
+    @property
+    def max_queue(self) -> int:
+        """The number of invocations that can wait for a worker."""
+        return self._max_queue
+
+    @property
+    def policy(self) -> str:
+        """The shedding policy used when the queue is full."""
+        return self._policy
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of invocations waiting for a worker."""
+        return len(self._queue)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of invocations running."""
+        return self._in_flight
+
+    @property
+    def is_running(self) -> bool:
+        """Whether or not the workers are running."""
+        return bool(self._tasks)
+
+    def in_worker(self) -> bool:
+        """Whether or not the current task is one of the workers.
+
+        Returns:
+            :obj:`bool`: :obj:`True` if called from a worker.
+        """
+        return asyncio.current_task() in self._tasks
+
+    def start(self, bot: bot_.Bot) -> None:
+        """Starts the workers. The bot calls this on
+        :obj:`~hikari.StartedEvent`.
+
+        Args:
+            bot (:obj:`~yami.Bot`): The bot to schedule invocations for.
+        """
+        if self._tasks:
+            return None
+
+        self._bot = bot
+        self._available = asyncio.Semaphore(0)
+        self._idle = asyncio.Event()
+        self._idle.set()
+        bot.metrics.gauges["queue_depth"] = lambda: len(self._queue)
+        bot.metrics.gauges["in_flight"] = lambda: self._in_flight
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self._workers)]
+
+    async def stop(self) -> None:
+        """Stops the workers, cancelling running invocations and
+        discarding queued ones. Callers waiting in :obj:`run` for a
+        discarded invocation are cancelled. The bot calls this on
+        :obj:`~hikari.StoppingEvent`.
+        """
+        tasks, self._tasks = self._tasks, []
+
+        for task in tasks:
+            task.cancel()
+
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        for entry in self._queue:
+            if entry[3] is _run_then_resolve:
+                entry[4][0].cancel()
+
+        self._queue.clear()
+
+    async def drain(self) -> None:
+        """Waits until no invocations are queued or running. The bot
+        awaits this on :obj:`~hikari.StoppingEvent`, before stopping the
+        scheduler.
+        """
+        if self._idle:
+            await self._idle.wait()
+
+    def submit(
+        self,
+        event: hikari.MessageCreateEvent,
+        callback: typing.Callable[..., typing.Awaitable[typing.Any]],
+        *args: typing.Any,
+    ) -> bool:
+        """Queues an invocation, or sheds it when the queue is full.
+
+        Args:
+            event (:obj:`~hikari.MessageCreateEvent`): The message event
+                the priority is taken from.
+            callback (:obj:`~typing.Callable` [..., \
+                :obj:`~typing.Awaitable` [:obj:`~typing.Any`]]):
+                The callback a worker will await.
+            *args (:obj:`~typing.Any`): The arguments to the callback.
+
+        Returns:
+            :obj:`bool`: Whether or not the invocation was queued.
+        """
+        assert self._bot and self._available and self._idle, "the scheduler is not running"
+        priority = self._priority(self._bot, event)
+        entry = (priority, self._seq, time.perf_counter(), callback, args)
+        self._seq += 1
+
+        if len(self._queue) < self._max_queue:
+            heapq.heappush(self._queue, entry)
+            self._available.release()
+            self._idle.clear()
+            return True
+
+        # Invocations queued by run were already accepted, and their
+        # callers are waiting on them, so they are never dropped.
+        droppable = [i for i, e in enumerate(self._queue) if e[3] is not _run_then_resolve]
+
+        if self._policy == "drop_lowest" and droppable:
+            lowest = max(droppable, key=self._queue.__getitem__)
+
+            if self._queue[lowest][0] > priority:
+                self._queue[lowest] = entry
+                heapq.heapify(self._queue)
+                self._shed("dropped")
+                return True
+
+        self._shed("rejected")
+        return False
+
+    async def run(
+        self,
+        event: hikari.MessageCreateEvent,
+        callback: typing.Callable[..., typing.Awaitable[typing.Any]],
+        *args: typing.Any,
+    ) -> None:
+        """Queues an invocation that was already accepted, and waits for
+        a worker to finish it. Unlike :obj:`submit` it is never shed,
+        neither when the queue is full nor by the ``"drop_lowest"``
+        policy, so it can take the queue past ``max_queue``. The bot
+        uses this for serialized invocations that waited for their key
+        outside of the workers.
+
+        Args:
+            event (:obj:`~hikari.MessageCreateEvent`): The message event
+                the priority is taken from.
+            callback (:obj:`~typing.Callable` [..., \
+                :obj:`~typing.Awaitable` [:obj:`~typing.Any`]]):
+                The callback a worker will await.
+            *args (:obj:`~typing.Any`): The arguments to the callback.
+        """
+        assert self._bot and self._available and self._idle, "the scheduler is not running"
+        done = asyncio.get_running_loop().create_future()
+        entry = (
+            self._priority(self._bot, event),
+            self._seq,
+            time.perf_counter(),
+            _run_then_resolve,
+            (done, callback, args),
+        )
+        self._seq += 1
+        heapq.heappush(self._queue, entry)
+        self._available.release()
+        self._idle.clear()
+        await done
+
+    def _shed(self, reason: str) -> None:
+        assert self._bot
+        shed = self._bot.metrics.shed
+        shed[reason] = shed.get(reason, 0) + 1
+        _log.debug("Shed an invocation (%s), the queue is full", reason)
+
+    async def _work(self) -> None:
+        assert self._bot and self._available and self._idle
+        queue_wait = self._bot.metrics.queue_wait
+
+        while True:
+            await self._available.acquire()
+            _, _, queued_at, callback, args = heapq.heappop(self._queue)
+            queue_wait.record(time.perf_counter() - queued_at)
+            self._in_flight += 1
+
+            try:
+                await callback(*args)
+            except Exception:
+                _log.exception("Scheduled invocation raised an exception")
+            finally:
+                self._in_flight -= 1
+
+                if not self._in_flight and not self._queue:
+                    self._idle.set()
+
+
+async def _run_then_resolve(
+    done: asyncio.Future[None],
+    callback: typing.Callable[..., typing.Awaitable[typing.Any]],
+    args: tuple[typing.Any, ...],
+) -> None:
+    try:
+        await callback(*args)
+    finally:
+        if not done.done():
+            done.set_result(None)
+
+
+class _Key:
+    __slots__ = ("tail", "users")
+
+    def __init__(self) -> None:
+        self.tail: asyncio.Future[None] | None = None
+        self.users = 0
+
+
+class _Hold:
+    __slots__ = ("_keys", "_key", "_entry", "_prev", "_turn", "_closed")
+
+    def __init__(self, keys: dict[typing.Hashable, _Key], key: typing.Hashable) -> None:
+        if not (entry := keys.get(key)):
+            entry = keys[key] = _Key()
+
+        # Queue up behind the last hold now, so the order does not
+        # depend on which task enters its context first.
+        self._prev = entry.tail
+        self._turn: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry.tail = self._turn
+        entry.users += 1
+        self._keys = keys
+        self._key = key
+        self._entry = entry
+        self._closed = False
+
+    async def __aenter__(self) -> None:
+        if self._prev and not self._prev.done():
+            try:
+                await asyncio.shield(self._prev)
+            except BaseException:
+                self._close()
+                raise
+
+    async def __aexit__(self, *_: typing.Any) -> None:
+        self._close()
+
+    def _close(self) -> None:
+        if self._closed:
+            return None
+
+        self._closed = True
+
+        if self._prev and not self._prev.done():
+            # Left before its turn, the next hold waits for the one
+            # before this instead.
+            self._prev.add_done_callback(self._pass)
+        else:
+            self._pass()
+
+        self._entry.users -= 1
+
+        if not self._entry.users:
+            del self._keys[self._key]
+
+    def _pass(self, _: typing.Any = None) -> None:
+        if not self._turn.done():
+            self._turn.set_result(None)
+
+
+class KeyedExecutor:
+    """Runs work with the same key one at a time, in the order it
+    arrived, while work with different keys runs concurrently. A key is
+    forgotten as soon as it has no work, so memory does not grow with
+    the number of keys seen.
+
+    The bot uses one for commands with ``serialize_by`` set.
+    """
+
+    __slots__ = ("_keys",)
+
+    def __init__(self) -> None:
+        self._keys: dict[typing.Hashable, _Key] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(keys={len(self._keys)})"
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def waiting(self, key: typing.Hashable) -> int:
+        """Gets the amount of work running or waiting for a key.
+
+        Args:
+            key (:obj:`~typing.Hashable`): The key.
+
+        Returns:
+            :obj:`int`: The amount of work.
+        """
+        return entry.users if (entry := self._keys.get(key)) else 0
+
+    def hold(self, key: typing.Hashable) -> typing.AsyncContextManager[None]:
+        """Waits for the work queued before it with the same key, then
+        holds the key until the context exits. The work takes its place
+        in the queue when this is called, not when the context is
+        entered, so it can be handed to another task in order.
+
+        Args:
+            key (:obj:`~typing.Hashable`): The key to hold.
+
+        Returns:
+            :obj:`~typing.AsyncContextManager` [:obj:`None`]: The
+                context holding the key.
+        """
+        return _Hold(self._keys, key)
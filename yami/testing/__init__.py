@@ -0,0 +1,48 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Offline stand-ins for testing and benchmarking Yami bots without a
+gateway connection.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "MessageFactory",
+    "message_payload",
+    "FakeState",
+    "FakeREST",
+    "FakeCache",
+    "install",
+    "make_offline",
+]
+
+import typing
+
+from yami.testing.cache import *
+from yami.testing.messages import *
+from yami.testing.offline import *
+from yami.testing.rest import *
+from yami.testing.state import *
+
+
+def __getattr__(name: str) -> typing.Any:
+    # The plugin imports pytest, so it is only imported when used.
+    if name == "Invoker":
+        from yami.testing import plugin
+
+        return plugin.Invoker
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,154 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module containing the in-memory fake cache."""
+
+from __future__ import annotations
+
+import typing
+
+import hikari
+
+from yami import bot as bot_
+from yami.testing import state as state_
+
+__all__ = ["FakeCache"]
+
+FoundT = typing.TypeVar("FoundT")
+
+
+class FakeCache:
+    """An in-memory stand-in for hikari's cache, serving a
+    :obj:`~yami.testing.FakeState`.
+
+    Hits and misses are counted by method. Any other ``get_`` method
+    of :obj:`~hikari.api.cache.Cache` can be called too, and misses.
+
+    Args:
+        bot (:obj:`~yami.Bot`): The bot the cache is for.
+
+    Keyword Args:
+        state (:obj:`~yami.testing.FakeState` | :obj:`None`): The
+            state to serve. Defaults to a new, empty one.
+        enabled (:obj:`bool`): Whether the cache serves anything, a
+            disabled cache always misses. Defaults to :obj:`True`.
+    """
+
+    __slots__ = ("_state", "_enabled", "_hits", "_misses")
+
+    def __init__(
+        self, bot: bot_.Bot, *, state: state_.FakeState | None = None, enabled: bool = True
+    ) -> None:
+        self._state = state or state_.FakeState(bot)
+        self._enabled = enabled
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(enabled={self._enabled})"
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if not name.startswith("get_"):
+            raise AttributeError(f"{self.__class__.__name__!r} has no attribute {name!r}")
+
+        empty: typing.Any = {} if name.endswith("_view") or "_view_" in name else None
+
+        def miss(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            return self._count(name, empty)
+
+        return miss
+
+    @property
+    def state(self) -> state_.FakeState:
+        """The state being served."""
+        return self._state
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache serves anything."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        self._enabled = enabled
+
+    @property
+    def hits(self) -> dict[str, int]:
+        """The number of hits, by method."""
+        return self._hits
+
+    @property
+    def misses(self) -> dict[str, int]:
+        """The number of misses, by method."""
+        return self._misses
+
+    def reset(self) -> None:
+        """Resets the hit and miss counts."""
+        self._hits.clear()
+        self._misses.clear()
+
+    def _count(self, method: str, found: FoundT) -> FoundT:
+        if found:
+            self._hits[method] = self._hits.get(method, 0) + 1
+        else:
+            self._misses[method] = self._misses.get(method, 0) + 1
+
+        return found
+
+    def get_guild(self, guild: hikari.SnowflakeishOr[hikari.PartialGuild]) -> hikari.Guild | None:
+        found = self._state.guilds.get(int(guild)) if self._enabled else None
+        return self._count("get_guild", found)
+
+    def get_role(self, role: hikari.SnowflakeishOr[hikari.PartialRole]) -> hikari.Role | None:
+        found = None
+
+        if self._enabled:
+            role_id = int(role)
+            found = next((rs[role_id] for rs in self._state.roles.values() if role_id in rs), None)
+
+        return self._count("get_role", found)
+
+    def get_roles_view_for_guild(
+        self, guild: hikari.SnowflakeishOr[hikari.PartialGuild]
+    ) -> typing.Mapping[hikari.Snowflake, hikari.Role]:
+        found = self._state.roles.get(int(guild), {}) if self._enabled else {}
+        # The ids are stored as plain ints, which hash like snowflakes.
+        view = typing.cast("typing.Mapping[hikari.Snowflake, hikari.Role]", found)
+        return self._count("get_roles_view_for_guild", view)
+
+    def get_member(
+        self,
+        guild: hikari.SnowflakeishOr[hikari.PartialGuild],
+        user: hikari.SnowflakeishOr[hikari.User],
+    ) -> hikari.Member | None:
+        found = self._state.members.get((int(guild), int(user))) if self._enabled else None
+        return self._count("get_member", found)
+
+    def get_guild_channel(
+        self, channel: hikari.SnowflakeishOr[hikari.PartialChannel]
+    ) -> hikari.GuildChannel | None:
+        found = self._state.channels.get(int(channel)) if self._enabled else None
+        guild_channel = found if isinstance(found, hikari.GuildChannel) else None
+        return self._count("get_guild_channel", guild_channel)
+
+    def get_user(self, user: hikari.SnowflakeishOr[hikari.User]) -> hikari.User | None:
+        found = self._state.users.get(int(user)) if self._enabled else None
+        return self._count("get_user", found)
+
+    def get_message(
+        self, message: hikari.SnowflakeishOr[hikari.PartialMessage]
+    ) -> hikari.Message | None:
+        found = self._state.messages.get(int(message)) if self._enabled else None
+        return self._count("get_message", found)
@@ -0,0 +1,173 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module containing synthetic message event factories."""
+
+from __future__ import annotations
+
+import itertools
+import typing
+
+import hikari
+
+from yami import bot as bot_
+
+__all__ = ["MessageFactory", "message_payload"]
+
+_TIMESTAMP = "2021-01-01T00:00:00+00:00"
+
+
+def message_payload(
+    content: str,
+    *,
+    message_id: int,
+    channel_id: int,
+    author_id: int,
+    guild_id: int | None = None,
+    role_ids: typing.Iterable[int] = (),
+) -> dict[str, typing.Any]:
+    """Builds a gateway MESSAGE_CREATE payload.
+
+    Args:
+        content (:obj:`str`): The content of the message.
+
+    Keyword Args:
+        message_id (:obj:`int`): The id of the message.
+        channel_id (:obj:`int`): The id of the channel.
+        author_id (:obj:`int`): The id of the author.
+        guild_id (:obj:`int` | :obj:`None`): The id of the guild, or
+            :obj:`None` for a DM. Defaults to :obj:`None`.
+        role_ids (:obj:`~typing.Iterable` [:obj:`int`]): The ids of the
+            authors roles, if in a guild. Defaults to ``()``.
+
+    Returns:
+        :obj:`dict` [:obj:`str`, :obj:`~typing.Any`]: The payload.
+    """
+    payload: dict[str, typing.Any] = {
+        "id": str(message_id),
+        "channel_id": str(channel_id),
+        "author": {
+            "id": str(author_id),
+            "username": f"user{author_id}",
+            "discriminator": "0001",
+            "avatar": None,
+        },
+        "content": content,
+        "timestamp": _TIMESTAMP,
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [],
+        "mention_roles": [],
+        "attachments": [],
+        "embeds": [],
+        "pinned": False,
+        "type": 0,
+        "flags": 0,
+    }
+
+    if guild_id is not None:
+        payload["guild_id"] = str(guild_id)
+        payload["member"] = {
+            "roles": [str(r) for r in role_ids],
+            "joined_at": _TIMESTAMP,
+            "deaf": False,
+            "mute": False,
+        }
+
+    return payload
+
+
+class MessageFactory:
+    """Builds real
+    :obj:`~hikari.events.message_events.MessageCreateEvent` objects
+    from synthetic gateway payloads, using the bots entity factory. No
+    gateway connection is needed.
+
+    Args:
+        bot (:obj:`~yami.Bot`): The bot the events are for.
+
+    Keyword Args:
+        guild_id (:obj:`int` | :obj:`None`): The default guild id, or
+            :obj:`None` for DMs. Defaults to ``1``.
+        channel_id (:obj:`int`): The default channel id. Defaults to
+            ``2``.
+        author_id (:obj:`int`): The default author id. Defaults to
+            ``3``.
+    """
+
+    __slots__ = ("_bot", "_guild_id", "_channel_id", "_author_id", "_ids")
+
+    def __init__(
+        self,
+        bot: bot_.Bot,
+        *,
+        guild_id: int | None = 1,
+        channel_id: int = 2,
+        author_id: int = 3,
+    ) -> None:
+        self._bot = bot
+        self._guild_id = guild_id
+        self._channel_id = channel_id
+        self._author_id = author_id
+        self._ids = itertools.count(1_000_000)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._bot!r})"
+
+    @property
+    def bot(self) -> bot_.Bot:
+        """The bot the events are for."""
+        return self._bot
+
+    def event(
+        self,
+        content: str,
+        *,
+        guild_id: int | None | hikari.UndefinedType = hikari.UNDEFINED,
+        channel_id: int | None = None,
+        author_id: int | None = None,
+        role_ids: typing.Iterable[int] = (),
+    ) -> hikari.MessageCreateEvent:
+        """Builds a message create event. Each event gets a new message
+        id, any ids not passed use the factories defaults.
+
+        Args:
+            content (:obj:`str`): The content of the message.
+
+        Keyword Args:
+            guild_id (:obj:`int` | :obj:`None`): The id of the guild,
+                or :obj:`None` for a DM.
+            channel_id (:obj:`int`): The id of the channel.
+            author_id (:obj:`int`): The id of the author.
+            role_ids (:obj:`~typing.Iterable` [:obj:`int`]): The ids of
+                the authors roles. Defaults to ``()``.
+
+        Returns:
+            :obj:`~hikari.events.message_events.MessageCreateEvent`: A
+            guild or DM message create event.
+        """
+        payload = message_payload(
+            content,
+            message_id=next(self._ids),
+            channel_id=channel_id or self._channel_id,
+            author_id=author_id or self._author_id,
+            guild_id=self._guild_id if guild_id is hikari.UNDEFINED else guild_id,
+            role_ids=role_ids,
+        )
+
+        return self._bot.event_factory.deserialize_message_create_event(
+            None, payload  # type: ignore[arg-type]
+        )
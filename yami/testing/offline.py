@@ -0,0 +1,84 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module for running a bot offline against the fakes."""
+
+from __future__ import annotations
+
+from yami import bot as bot_
+from yami import rest as rest_
+from yami.testing import cache as cache_
+from yami.testing import rest as fake_rest
+from yami.testing import state as state_
+
+__all__ = ["install", "make_offline"]
+
+
+def install(
+    bot: bot_.Bot,
+    *,
+    rest: fake_rest.FakeREST | None = None,
+    cache: cache_.FakeCache | None = None,
+) -> None:
+    """Makes the bot use a fake REST client and/or cache.
+
+    Args:
+        bot (:obj:`~yami.Bot`): The bot.
+
+    Keyword Args:
+        rest (:obj:`~yami.testing.FakeREST` | :obj:`None`): The fake
+            REST client, if any.
+        cache (:obj:`~yami.testing.FakeCache` | :obj:`None`): The fake
+            cache, if any.
+    """
+    if rest is not None:
+        bot._rest = rest  # type: ignore[assignment]
+
+        if bot._instrumented_rest:
+            bot._instrumented_rest = rest_.InstrumentedREST(rest)  # type: ignore[arg-type]
+
+    if cache is not None:
+        bot._cache = cache  # type: ignore[assignment]
+
+
+def make_offline(
+    bot: bot_.Bot,
+    *,
+    latency: float = 0.0,
+    rate_limit: tuple[int, float] | None = None,
+    autocreate: bool = False,
+) -> state_.FakeState:
+    """Installs a fake REST client and cache on the bot, sharing one
+    :obj:`~yami.testing.FakeState`.
+
+    Args:
+        bot (:obj:`~yami.Bot`): The bot.
+
+    Keyword Args:
+        latency (:obj:`float`): Seconds each REST call takes. Defaults
+            to ``0.0``.
+        rate_limit (:obj:`tuple` [:obj:`int`, :obj:`float`] | \
+            :obj:`None`): The simulated REST rate limit. Defaults to
+            :obj:`None`.
+        autocreate (:obj:`bool`): Whether unknown entities are created
+            when fetched. Defaults to :obj:`False`.
+
+    Returns:
+        :obj:`~yami.testing.FakeState`: The shared state.
+    """
+    state = state_.FakeState(bot, autocreate=autocreate)
+    rest = fake_rest.FakeREST(bot, state=state, latency=latency, rate_limit=rate_limit)
+    install(bot, rest=rest, cache=cache_.FakeCache(bot, state=state))
+    return state
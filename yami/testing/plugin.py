@@ -0,0 +1,198 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""A pytest plugin for testing Yami bots offline.
+
+Enable it in your ``conftest.py``, it requires pytest, which Yami
+does not depend on.
+
+.. code-block:: python
+
+    pytest_plugins = ["yami.testing.plugin"]
+
+    @pytest.fixture()
+    def yami_bot_options() -> dict[str, typing.Any]:
+        return {"prefix": "?"}
+
+    @pytest.mark.yami_budget(max_rest_calls=1, max_ms=5)
+    async def test_ping(yami_bot, yami_invoke) -> None:
+        yami_bot.load_all_modules("./modules")
+        ctx = await yami_invoke("?ping")
+        assert not ctx.exceptions
+
+Fixtures:
+    - ``yami_bot_options``: Kwargs for the bot, override it to change
+      them. The prefix defaults to ``"!"``.
+    - ``yami_bot``: A :obj:`~yami.Bot` running against
+      :obj:`~yami.testing.FakeREST` and :obj:`~yami.testing.FakeCache`.
+    - ``yami_state``: The :obj:`~yami.testing.FakeState` they serve.
+    - ``yami_messages``: A :obj:`~yami.testing.MessageFactory` for
+      the bot.
+    - ``yami_invoke``: An :obj:`Invoker` for the bot.
+
+Markers:
+    - ``yami_budget(max_rest_calls=None, max_ms=None)``: Fails the
+      test when any invocation through ``yami_invoke`` goes over
+      budget.
+"""
+
+from __future__ import annotations
+
+import time
+import typing
+
+import pytest
+
+from yami import bot as bot_
+from yami import context, events
+from yami.testing import messages, offline
+from yami.testing import rest as fake_rest
+from yami.testing import state as state_
+
+__all__ = ["Invoker"]
+
+
+class Invoker:
+    """Invokes commands on an offline bot, and checks each invocation
+    against a budget.
+
+    Args:
+        bot (:obj:`~yami.Bot`): The bot.
+        factory (:obj:`~yami.testing.MessageFactory`): Builds the
+            message events.
+
+    Keyword Args:
+        max_rest_calls (:obj:`int` | :obj:`None`): The most REST calls
+            an invocation can make. Defaults to :obj:`None`.
+        max_ms (:obj:`float` | :obj:`None`): The most milliseconds an
+            invocation can take. Defaults to :obj:`None`.
+    """
+
+    __slots__ = ("_bot", "_factory", "_max_rest_calls", "_max_ms")
+
+    def __init__(
+        self,
+        bot: bot_.Bot,
+        factory: messages.MessageFactory,
+        *,
+        max_rest_calls: int | None = None,
+        max_ms: float | None = None,
+    ) -> None:
+        self._bot = bot
+        self._factory = factory
+        self._max_rest_calls = max_rest_calls
+        self._max_ms = max_ms
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._bot!r})"
+
+    async def __call__(self, content: str, **kwargs: typing.Any) -> context.MessageContext | None:
+        """Sends a message to the bot and waits for the invocation to
+        finish.
+
+        Args:
+            content (:obj:`str`): The content of the message, including
+                the prefix.
+
+        Keyword Args:
+            **kwargs (:obj:`~typing.Any`): The remaining kwargs for
+                :obj:`~yami.testing.MessageFactory.event`.
+
+        Returns:
+            :obj:`~yami.MessageContext` | :obj:`None`: The context of
+            the invocation, or :obj:`None` if no command was invoked.
+        """
+        found: list[context.MessageContext] = []
+
+        async def capture(e: events.CommandInvokeEvent) -> None:
+            found.append(typing.cast(context.MessageContext, e.ctx))
+
+        # The fake REST client is not a RESTClientImpl to mypy.
+        rest: object = self._bot._rest
+        calls = rest.total_calls if isinstance(rest, fake_rest.FakeREST) else 0
+        event = self._factory.event(content, **kwargs)
+        self._bot.subscribe(events.CommandInvokeEvent, capture)
+
+        try:
+            start = time.perf_counter()
+            await self._bot._listen(event)
+            elapsed = (time.perf_counter() - start) * 1000
+        finally:
+            self._bot.unsubscribe(events.CommandInvokeEvent, capture)
+
+        if self._max_ms is not None and elapsed > self._max_ms:
+            pytest.fail(f"{content!r} took {elapsed:.2f}ms, over the budget of {self._max_ms}ms")
+
+        if self._max_rest_calls is not None and isinstance(rest, fake_rest.FakeREST):
+            if (made := rest.total_calls - calls) > self._max_rest_calls:
+                pytest.fail(
+                    f"{content!r} made {made} REST calls, "
+                    f"over the budget of {self._max_rest_calls}"
+                )
+
+        return found[-1] if found else None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "yami_budget(max_rest_calls=None, max_ms=None): fail when an invocation made with "
+        "yami_invoke makes more REST calls, or takes longer than allowed.",
+    )
+
+
+@pytest.fixture()
+def yami_bot_options() -> dict[str, typing.Any]:
+    """Kwargs for the offline bot, override this to change them."""
+    return {}
+
+
+@pytest.fixture()
+def yami_bot(yami_bot_options: dict[str, typing.Any]) -> bot_.Bot:
+    """A bot running offline, against a fake REST client and cache."""
+    options: dict[str, typing.Any] = {
+        "token": "12345",
+        "prefix": "!",
+        "banner": None,
+        **yami_bot_options,
+    }
+    bot = bot_.Bot(**options)
+    offline.make_offline(bot)
+    return bot
+
+
+@pytest.fixture()
+def yami_state(yami_bot: bot_.Bot) -> state_.FakeState:
+    """The state served by the offline bots fake REST client and
+    cache.
+    """
+    return typing.cast(fake_rest.FakeREST, yami_bot._rest).state
+
+
+@pytest.fixture()
+def yami_messages(yami_bot: bot_.Bot) -> messages.MessageFactory:
+    """A message factory for the offline bot."""
+    return messages.MessageFactory(yami_bot)
+
+
+@pytest.fixture()
+def yami_invoke(
+    request: pytest.FixtureRequest, yami_bot: bot_.Bot, yami_messages: messages.MessageFactory
+) -> Invoker:
+    """Invokes commands on the offline bot, within the tests
+    yami_budget.
+    """
+    budget = request.node.get_closest_marker("yami_budget")
+    return Invoker(yami_bot, yami_messages, **(budget.kwargs if budget else {}))
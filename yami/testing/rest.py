@@ -0,0 +1,323 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module containing the in-memory fake REST client."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import inspect
+import itertools
+import typing
+
+import hikari
+
+from yami import bot as bot_
+from yami.testing import messages
+from yami.testing import state as state_
+
+__all__ = ["FakeREST"]
+
+
+def _coroutine_methods() -> frozenset[str]:
+    return frozenset(
+        name
+        for name, member in inspect.getmembers(hikari.impl.RESTClientImpl)
+        if not name.startswith("_") and inspect.iscoroutinefunction(member)
+    )
+
+
+def _not_found(route: str, what: str) -> hikari.NotFoundError:
+    return hikari.NotFoundError(f"fake://{route}", {}, b"", message=f"Unknown {what}")
+
+
+class FakeREST:
+    """An in-memory stand-in for hikari's REST client, that never
+    touches the network.
+
+    Guilds, roles, members, channels, users and messages are served from
+    a :obj:`~yami.testing.FakeState`. Missing entities raise
+    :obj:`~hikari.errors.NotFoundError` like the API would. Every other
+    coroutine method of :obj:`~hikari.api.rest.RESTClient` can be
+    called too, and returns :obj:`None`.
+
+    Each call is counted by route (the method name), delayed by the
+    configured latency, and subject to injected errors and the
+    simulated rate limit.
+
+    Args:
+        bot (:obj:`~yami.Bot`): The bot the client is for.
+
+    Keyword Args:
+        state (:obj:`~yami.testing.FakeState` | :obj:`None`): The
+            state to serve. Defaults to a new, empty one.
+        latency (:obj:`float`): Seconds each call takes. Defaults to
+            ``0.0``.
+        rate_limit (:obj:`tuple` [:obj:`int`, :obj:`float`] | \
+            :obj:`None`): The number of calls allowed per route, and the
+            period in seconds. Calls over the limit wait for the bucket
+            to reset, like hikari does after a 429, and are counted in
+            :obj:`FakeREST.rate_limited`. Defaults to :obj:`None`.
+    """
+
+    __slots__ = (
+        "_bot",
+        "_state",
+        "_latency",
+        "_rate_limit",
+        "_calls",
+        "_rate_limited",
+        "_buckets",
+        "_failures",
+        "_ids",
+        "_stubs",
+    )
+
+    _routes = _coroutine_methods()
+
+    def __init__(
+        self,
+        bot: bot_.Bot,
+        *,
+        state: state_.FakeState | None = None,
+        latency: float = 0.0,
+        rate_limit: tuple[int, float] | None = None,
+    ) -> None:
+        self._bot = bot
+        self._state = state or state_.FakeState(bot)
+        self._latency = latency
+        self._rate_limit = rate_limit
+        self._calls: dict[str, int] = {}
+        self._rate_limited: dict[str, int] = {}
+        self._buckets: dict[str, collections.deque[float]] = {}
+        self._failures: dict[str, list[typing.Any]] = {}
+        self._ids = itertools.count(2_000_000)
+        self._stubs: dict[str, typing.Callable[..., typing.Awaitable[None]]] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(latency={self._latency}, calls={self.total_calls})"
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name not in self._routes:
+            raise AttributeError(f"{self.__class__.__name__!r} has no attribute {name!r}")
+
+        if stub := self._stubs.get(name):
+            return stub
+
+        async def call(*args: typing.Any, **kwargs: typing.Any) -> None:
+            await self._call(name)
+
+        self._stubs[name] = call
+        return call
+
+    @property
+    def state(self) -> state_.FakeState:
+        """The state being served."""
+        return self._state
+
+    @property
+    def latency(self) -> float:
+        """Seconds each call takes."""
+        return self._latency
+
+    @latency.setter
+    def latency(self, latency: float) -> None:
+        self._latency = latency
+
+    @property
+    def calls(self) -> dict[str, int]:
+        """The number of calls made, by route."""
+        return self._calls
+
+    @property
+    def total_calls(self) -> int:
+        """The total number of calls made."""
+        return sum(self._calls.values())
+
+    @property
+    def rate_limited(self) -> dict[str, int]:
+        """The number of calls that hit the simulated rate limit, by
+        route.
+        """
+        return self._rate_limited
+
+    def fail(self, route: str, error: Exception, *, times: int | None = 1) -> None:
+        """Makes calls to a route raise an error.
+
+        Args:
+            route (:obj:`str`): The route, for example
+                ``"fetch_member"``.
+            error (:obj:`Exception`): The error to raise.
+
+        Keyword Args:
+            times (:obj:`int` | :obj:`None`): The number of calls that
+                should fail, or :obj:`None` for all of them. Defaults to
+                ``1``.
+        """
+        self._failures[route] = [error, times]
+
+    def reset(self) -> None:
+        """Resets the call counts, rate limit buckets and injected
+        errors.
+        """
+        self._calls.clear()
+        self._rate_limited.clear()
+        self._buckets.clear()
+        self._failures.clear()
+
+    async def _call(self, route: str) -> None:
+        self._calls[route] = self._calls.get(route, 0) + 1
+
+        if self._rate_limit:
+            await self._wait_for_bucket(route, *self._rate_limit)
+
+        if self._latency:
+            await asyncio.sleep(self._latency)
+
+        if failure := self._failures.get(route):
+            error, times = failure
+
+            if times is not None:
+                if times <= 1:
+                    del self._failures[route]
+                else:
+                    failure[1] -= 1
+
+            raise error
+
+    async def _wait_for_bucket(self, route: str, limit: int, period: float) -> None:
+        loop = asyncio.get_running_loop()
+        bucket = self._buckets.setdefault(route, collections.deque())
+        now = loop.time()
+
+        while bucket and bucket[0] <= now - period:
+            bucket.popleft()
+
+        if len(bucket) >= limit:
+            self._rate_limited[route] = self._rate_limited.get(route, 0) + 1
+            # Take the slot after the last queued call's, like a reset.
+            reset_at = bucket[-limit] + period
+            bucket.append(reset_at)
+            await asyncio.sleep(reset_at - now)
+        else:
+            bucket.append(now)
+
+    async def fetch_guild(
+        self, guild: hikari.SnowflakeishOr[hikari.PartialGuild]
+    ) -> hikari.RESTGuild:
+        await self._call("fetch_guild")
+
+        if found := self._state.get_guild(int(guild)):
+            return found
+
+        raise _not_found("fetch_guild", "Guild")
+
+    async def fetch_roles(
+        self, guild: hikari.SnowflakeishOr[hikari.PartialGuild]
+    ) -> typing.Sequence[hikari.Role]:
+        await self._call("fetch_roles")
+
+        if (roles := self._state.get_roles(int(guild))) is not None:
+            return [*roles.values()]
+
+        raise _not_found("fetch_roles", "Guild")
+
+    async def fetch_member(
+        self,
+        guild: hikari.SnowflakeishOr[hikari.PartialGuild],
+        user: hikari.SnowflakeishOr[hikari.User],
+    ) -> hikari.Member:
+        await self._call("fetch_member")
+
+        if found := self._state.get_member(int(guild), int(user)):
+            return found
+
+        raise _not_found("fetch_member", "Member")
+
+    async def fetch_channel(
+        self, channel: hikari.SnowflakeishOr[hikari.PartialChannel]
+    ) -> hikari.PartialChannel:
+        await self._call("fetch_channel")
+
+        if found := self._state.get_channel(int(channel)):
+            return found
+
+        raise _not_found("fetch_channel", "Channel")
+
+    async def fetch_user(self, user: hikari.SnowflakeishOr[hikari.PartialUser]) -> hikari.User:
+        await self._call("fetch_user")
+
+        if found := self._state.get_user(int(user)):
+            return found
+
+        raise _not_found("fetch_user", "User")
+
+    async def fetch_message(
+        self,
+        channel: hikari.SnowflakeishOr[hikari.TextableChannel],
+        message: hikari.SnowflakeishOr[hikari.PartialMessage],
+    ) -> hikari.Message:
+        await self._call("fetch_message")
+
+        if found := self._state.messages.get(int(message)):
+            return found
+
+        raise _not_found("fetch_message", "Message")
+
+    async def create_message(
+        self,
+        channel: hikari.SnowflakeishOr[hikari.TextableChannel],
+        content: hikari.UndefinedOr[typing.Any] = hikari.UNDEFINED,
+        **kwargs: typing.Any,
+    ) -> hikari.Message:
+        await self._call("create_message")
+        me = self._bot.get_me()
+
+        payload = messages.message_payload(
+            "" if content is hikari.UNDEFINED else str(content),
+            message_id=next(self._ids),
+            channel_id=int(channel),
+            author_id=int(me.id) if me else 1,
+        )
+
+        return self._state.add_message(self._bot.entity_factory.deserialize_message(payload))
+
+    async def edit_message(
+        self,
+        channel: hikari.SnowflakeishOr[hikari.TextableChannel],
+        message: hikari.SnowflakeishOr[hikari.PartialMessage],
+        content: hikari.UndefinedOr[typing.Any] = hikari.UNDEFINED,
+        **kwargs: typing.Any,
+    ) -> hikari.Message:
+        await self._call("edit_message")
+
+        if not (found := self._state.messages.get(int(message))):
+            raise _not_found("edit_message", "Message")
+
+        if content is not hikari.UNDEFINED:
+            found.content = None if content is None else str(content)
+
+        return found
+
+    async def delete_message(
+        self,
+        channel: hikari.SnowflakeishOr[hikari.TextableChannel],
+        message: hikari.SnowflakeishOr[hikari.PartialMessage],
+    ) -> None:
+        await self._call("delete_message")
+
+        if self._state.messages.pop(int(message), None) is None:
+            raise _not_found("delete_message", "Message")
@@ -0,0 +1,420 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module containing the in-memory state shared by the fakes."""
+
+from __future__ import annotations
+
+import typing
+
+import hikari
+
+from yami import bot as bot_
+
+__all__ = ["FakeState"]
+
+_TIMESTAMP = "2021-01-01T00:00:00+00:00"
+
+
+def _user_payload(user_id: int, username: str | None = None) -> dict[str, typing.Any]:
+    return {
+        "id": str(user_id),
+        "username": username or f"user{user_id}",
+        "discriminator": "0001",
+        "avatar": None,
+    }
+
+
+class FakeState:
+    """In-memory guilds, roles, members, channels, users and messages,
+    shared by :obj:`~yami.testing.FakeREST` and
+    :obj:`~yami.testing.FakeCache`.
+
+    Entities are real hikari objects, built from gateway style payloads
+    with the bots entity factory.
+
+    Args:
+        bot (:obj:`~yami.Bot`): The bot the state is for.
+
+    Keyword Args:
+        autocreate (:obj:`bool`): Whether to create default entities
+            when unknown ids are looked up, instead of treating them as
+            missing. Defaults to :obj:`False`.
+    """
+
+    __slots__ = (
+        "_bot",
+        "_autocreate",
+        "_guilds",
+        "_roles",
+        "_members",
+        "_channels",
+        "_users",
+        "_messages",
+    )
+
+    def __init__(self, bot: bot_.Bot, *, autocreate: bool = False) -> None:
+        self._bot = bot
+        self._autocreate = autocreate
+        self._guilds: dict[int, hikari.RESTGuild] = {}
+        self._roles: dict[int, dict[int, hikari.Role]] = {}
+        self._members: dict[tuple[int, int], hikari.Member] = {}
+        self._channels: dict[int, hikari.PartialChannel] = {}
+        self._users: dict[int, hikari.User] = {}
+        self._messages: dict[int, hikari.Message] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(guilds={len(self._guilds)}, "
+            f"members={len(self._members)}, channels={len(self._channels)})"
+        )
+
+    @property
+    def bot(self) -> bot_.Bot:
+        """The bot the state is for."""
+        return self._bot
+
+    @property
+    def autocreate(self) -> bool:
+        """Whether default entities are created for unknown ids."""
+        return self._autocreate
+
+    @property
+    def guilds(self) -> dict[int, hikari.RESTGuild]:
+        """The guilds, by id."""
+        return self._guilds
+
+    @property
+    def roles(self) -> dict[int, dict[int, hikari.Role]]:
+        """The roles by id, by guild id."""
+        return self._roles
+
+    @property
+    def members(self) -> dict[tuple[int, int], hikari.Member]:
+        """The members, by guild id and user id."""
+        return self._members
+
+    @property
+    def channels(self) -> dict[int, hikari.PartialChannel]:
+        """The channels, by id."""
+        return self._channels
+
+    @property
+    def users(self) -> dict[int, hikari.User]:
+        """The users, by id."""
+        return self._users
+
+    @property
+    def messages(self) -> dict[int, hikari.Message]:
+        """The messages, by id."""
+        return self._messages
+
+    def add_guild(
+        self, guild_id: int, *, name: str = "guild", owner_id: int = 1
+    ) -> hikari.RESTGuild:
+        """Adds a guild, along with its @everyone role.
+
+        Args:
+            guild_id (:obj:`int`): The id of the guild.
+
+        Keyword Args:
+            name (:obj:`str`): The name of the guild. Defaults to
+                ``"guild"``.
+            owner_id (:obj:`int`): The id of the owner. Defaults to
+                ``1``.
+
+        Returns:
+            :obj:`~hikari.guilds.RESTGuild`: The guild.
+        """
+        payload = {
+            "id": str(guild_id),
+            "name": name,
+            "owner_id": str(owner_id),
+            "afk_timeout": 300,
+            "verification_level": 0,
+            "default_message_notifications": 0,
+            "explicit_content_filter": 0,
+            "mfa_level": 0,
+            "nsfw_level": 0,
+            "system_channel_flags": 0,
+            "premium_tier": 0,
+            "preferred_locale": "en-US",
+            "premium_progress_bar_enabled": False,
+            "widget_enabled": False,
+            "max_members": 500_000,
+            "max_presences": 500_000,
+            "roles": [],
+            "emojis": [],
+            "stickers": [],
+            "features": [],
+            **dict.fromkeys(
+                (
+                    "icon",
+                    "splash",
+                    "discovery_splash",
+                    "afk_channel_id",
+                    "application_id",
+                    "system_channel_id",
+                    "rules_channel_id",
+                    "vanity_url_code",
+                    "description",
+                    "banner",
+                    "public_updates_channel_id",
+                    "widget_channel_id",
+                )
+            ),
+        }
+
+        guild = self._bot.entity_factory.deserialize_rest_guild(payload)
+        self._guilds[guild_id] = guild
+        self.add_role(guild_id, guild_id, name="@everyone")
+        return guild
+
+    def add_role(
+        self,
+        guild_id: int,
+        role_id: int,
+        *,
+        name: str = "role",
+        permissions: hikari.Permissions = hikari.Permissions.NONE,
+        position: int = 0,
+    ) -> hikari.Role:
+        """Adds a role to a guild.
+
+        Args:
+            guild_id (:obj:`int`): The id of the guild.
+            role_id (:obj:`int`): The id of the role.
+
+        Keyword Args:
+            name (:obj:`str`): The name of the role. Defaults to
+                ``"role"``.
+            permissions (:obj:`~hikari.permissions.Permissions`): The
+                permissions of the role. Defaults to none.
+            position (:obj:`int`): The position of the role. Defaults
+                to ``0``.
+
+        Returns:
+            :obj:`~hikari.guilds.Role`: The role.
+        """
+        payload = {
+            "id": str(role_id),
+            "name": name,
+            "color": 0,
+            "hoist": False,
+            "position": position,
+            "permissions": str(int(permissions)),
+            "managed": False,
+            "mentionable": False,
+        }
+
+        role = self._bot.entity_factory.deserialize_role(
+            payload, guild_id=hikari.Snowflake(guild_id)
+        )
+        self._roles.setdefault(guild_id, {})[role_id] = role
+        return role
+
+    def add_user(self, user_id: int, *, username: str | None = None) -> hikari.User:
+        """Adds a user.
+
+        Args:
+            user_id (:obj:`int`): The id of the user.
+
+        Keyword Args:
+            username (:obj:`str` | :obj:`None`): The username. Defaults
+                to ``"user<id>"``.
+
+        Returns:
+            :obj:`~hikari.users.User`: The user.
+        """
+        user = self._bot.entity_factory.deserialize_user(_user_payload(user_id, username))
+        self._users[user_id] = user
+        return user
+
+    def add_member(
+        self,
+        guild_id: int,
+        user_id: int,
+        *,
+        role_ids: typing.Iterable[int] = (),
+        username: str | None = None,
+    ) -> hikari.Member:
+        """Adds a member to a guild.
+
+        Args:
+            guild_id (:obj:`int`): The id of the guild.
+            user_id (:obj:`int`): The id of the user.
+
+        Keyword Args:
+            role_ids (:obj:`~typing.Iterable` [:obj:`int`]): The ids of
+                the members roles. Defaults to ``()``.
+            username (:obj:`str` | :obj:`None`): The username. Defaults
+                to ``"user<id>"``.
+
+        Returns:
+            :obj:`~hikari.guilds.Member`: The member.
+        """
+        payload = {
+            "user": _user_payload(user_id, username),
+            "roles": [str(r) for r in role_ids],
+            "joined_at": _TIMESTAMP,
+            "deaf": False,
+            "mute": False,
+        }
+
+        member = self._bot.entity_factory.deserialize_member(
+            payload, guild_id=hikari.Snowflake(guild_id)
+        )
+        self._members[(guild_id, user_id)] = member
+        self._users.setdefault(user_id, member.user)
+        return member
+
+    def add_channel(
+        self,
+        channel_id: int,
+        *,
+        guild_id: int,
+        name: str = "channel",
+        overwrites: typing.Iterable[hikari.PermissionOverwrite] = (),
+    ) -> hikari.GuildTextChannel:
+        """Adds a guild text channel.
+
+        Args:
+            channel_id (:obj:`int`): The id of the channel.
+
+        Keyword Args:
+            guild_id (:obj:`int`): The id of the guild.
+            name (:obj:`str`): The name of the channel. Defaults to
+                ``"channel"``.
+            overwrites (:obj:`~typing.Iterable` \
+                [:obj:`~hikari.channels.PermissionOverwrite`]): The
+                channels permission overwrites. Defaults to ``()``.
+
+        Returns:
+            :obj:`~hikari.channels.GuildTextChannel`: The channel.
+        """
+        payload = {
+            "id": str(channel_id),
+            "type": 0,
+            "guild_id": str(guild_id),
+            "name": name,
+            "position": 0,
+            "permission_overwrites": [
+                {
+                    "id": str(o.id),
+                    "type": int(o.type),
+                    "allow": str(int(o.allow)),
+                    "deny": str(int(o.deny)),
+                }
+                for o in overwrites
+            ],
+            "nsfw": False,
+            "topic": None,
+            "last_message_id": None,
+            "rate_limit_per_user": 0,
+            "parent_id": None,
+        }
+
+        channel = self._bot.entity_factory.deserialize_channel(payload)
+        self._channels[channel_id] = channel
+        return typing.cast(hikari.GuildTextChannel, channel)
+
+    def add_message(self, message: hikari.Message) -> hikari.Message:
+        """Adds a message, for example one built by a
+        :obj:`~yami.testing.MessageFactory`.
+
+        Args:
+            message (:obj:`~hikari.messages.Message`): The message.
+
+        Returns:
+            :obj:`~hikari.messages.Message`: The message.
+        """
+        self._messages[int(message.id)] = message
+        return message
+
+    def get_guild(self, guild_id: int) -> hikari.RESTGuild | None:
+        """Gets a guild, creating it if autocreate is enabled.
+
+        Args:
+            guild_id (:obj:`int`): The id of the guild.
+
+        Returns:
+            :obj:`~hikari.guilds.RESTGuild` | :obj:`None`: The guild.
+        """
+        if (guild := self._guilds.get(guild_id)) or not self._autocreate:
+            return guild
+
+        return self.add_guild(guild_id)
+
+    def get_roles(self, guild_id: int) -> dict[int, hikari.Role] | None:
+        """Gets the roles in a guild, creating the guild if autocreate
+        is enabled.
+
+        Args:
+            guild_id (:obj:`int`): The id of the guild.
+
+        Returns:
+            :obj:`dict` [:obj:`int`, :obj:`~hikari.guilds.Role`] | \
+            :obj:`None`: The roles by id.
+        """
+        if self.get_guild(guild_id) is None:
+            return None
+
+        return self._roles.get(guild_id, {})
+
+    def get_member(self, guild_id: int, user_id: int) -> hikari.Member | None:
+        """Gets a member, creating it if autocreate is enabled.
+
+        Args:
+            guild_id (:obj:`int`): The id of the guild.
+            user_id (:obj:`int`): The id of the user.
+
+        Returns:
+            :obj:`~hikari.guilds.Member` | :obj:`None`: The member.
+        """
+        if (member := self._members.get((guild_id, user_id))) or not self._autocreate:
+            return member
+
+        self.get_guild(guild_id)
+        return self.add_member(guild_id, user_id)
+
+    def get_channel(self, channel_id: int) -> hikari.PartialChannel | None:
+        """Gets a channel. Autocreated channels belong to the guild with
+        the same id.
+
+        Args:
+            channel_id (:obj:`int`): The id of the channel.
+
+        Returns:
+            :obj:`~hikari.channels.PartialChannel` | :obj:`None`: The
+            channel.
+        """
+        if (channel := self._channels.get(channel_id)) or not self._autocreate:
+            return channel
+
+        return self.add_channel(channel_id, guild_id=channel_id)
+
+    def get_user(self, user_id: int) -> hikari.User | None:
+        """Gets a user, creating it if autocreate is enabled.
+
+        Args:
+            user_id (:obj:`int`): The id of the user.
+
+        Returns:
+            :obj:`~hikari.users.User` | :obj:`None`: The user.
+        """
+        if (user := self._users.get(user_id)) or not self._autocreate:
+            return user
+
+        return self.add_user(user_id)
@@ -0,0 +1,430 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module containing the invocation tracing interface."""
+
+from __future__ import annotations
+
+import abc
+import contextlib
+import contextvars
+import json
+import os
+import random
+import threading
+import time
+import typing
+from pathlib import Path
+
+__all__ = [
+    "Span",
+    "Tracer",
+    "TraceExporter",
+    "InMemoryTraceExporter",
+    "ChromeTraceExporter",
+    "span",
+    "current_span",
+]
+
+_current: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "yami_current_span", default=None
+)
+_NOOP: typing.ContextManager[None] = contextlib.nullcontext()
+
+
+def current_span() -> Span | None:
+    """Gets the span that is currently active, if any.
+
+    Returns:
+        :obj:`Span` | :obj:`None`: The active span, or :obj:`None` if
+        there is no trace in progress.
+    """
+    return _current.get()
+
+
+def span(name: str, **attributes: typing.Any) -> typing.ContextManager[typing.Any]:
+    """Opens a child of the current span, if there is one. This is how
+    the bot times each stage of an invocation, and it can be used
+    inside command callbacks too.
+
+    .. code-block:: python
+
+        with yami.span("database", table="users"):
+            ...
+
+    Args:
+        name (:obj:`str`): The name of the span.
+
+    Keyword Args:
+        **attributes (:obj:`~typing.Any`): Attributes for the span.
+
+    Returns:
+        :obj:`~typing.ContextManager`: The child span, or a shared no-op
+        context manager when no trace is in progress.
+    """
+    if (parent := _current.get()) is None:
+        return _NOOP
+
+    return parent.child(name, **attributes)
+
+
+class Span:
+    """A timed operation within a trace.
+
+    Args:
+        name (:obj:`str`): The name of the span.
+
+    Keyword Args:
+        tracer (:obj:`Tracer`): The tracer that created the trace.
+        parent (:obj:`Span` | :obj:`None`): The parent of this span, or
+            :obj:`None` if it is the root of the trace.
+        start (:obj:`float` | :obj:`None`): The start time from
+            :obj:`time.perf_counter`. Defaults to now.
+        attributes (:obj:`dict` [:obj:`str`, :obj:`~typing.Any`]):
+            Attributes for the span.
+
+    .. warning::
+        This class should not be instantiated manually, use
+        :obj:`Tracer.start` or :obj:`span` instead.
+    """
+
+    __slots__ = (
+        "_name",
+        "_tracer",
+        "_parent",
+        "_start",
+        "_end",
+        "_children",
+        "_attributes",
+        "_tid",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        tracer: Tracer,
+        parent: Span | None = None,
+        start: float | None = None,
+        attributes: dict[str, typing.Any] | None = None,
+    ) -> None:
+        self._name = name
+        self._tracer = tracer
+        self._parent = parent
+        self._start = time.perf_counter() if start is None else start
+        self._end: float | None = None
+        self._children: list[Span] = []
+        self._attributes = attributes or {}
+        self._tid = threading.get_ident()
+        self._token: contextvars.Token[Span | None] | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._name!r}, duration={self.duration:.6f})"
+
+    def __enter__(self) -> Span:
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type: typing.Any, exc: BaseException | None, tb: typing.Any) -> None:
+        if exc is not None:
+            self._attributes["error"] = repr(exc)
+
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+
+        self.finish()
+
+    @property
+    def name(self) -> str:
+        """The name of the span."""
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        self._name = name
+
+    @property
+    def parent(self) -> Span | None:
+        """The parent of this span, if any."""
+        return self._parent
+
+    @property
+    def children(self) -> list[Span]:
+        """The spans opened inside this span."""
+        return self._children
+
+    @property
+    def attributes(self) -> dict[str, typing.Any]:
+        """The attributes of this span."""
+        return self._attributes
+
+    @property
+    def start(self) -> float:
+        """The :obj:`time.perf_counter` start time of this span."""
+        return self._start
+
+    @property
+    def end(self) -> float | None:
+        """The end time of this span, or :obj:`None` if it is still in
+        progress.
+        """
+        return self._end
+
+    @property
+    def duration(self) -> float:
+        """The duration of this span in seconds, so far."""
+        return (self._end or time.perf_counter()) - self._start
+
+    def child(self, name: str, **attributes: typing.Any) -> Span:
+        """Opens a child span.
+
+        Args:
+            name (:obj:`str`): The name of the child.
+
+        Keyword Args:
+            **attributes (:obj:`~typing.Any`): Attributes for the child.
+
+        Returns:
+            :obj:`Span`: The child span.
+        """
+        child = Span(name, tracer=self._tracer, parent=self, attributes=attributes)
+        self._children.append(child)
+        return child
+
+    def record(self, name: str, start: float, end: float, **attributes: typing.Any) -> Span:
+        """Records a child span that has already completed.
+
+        Args:
+            name (:obj:`str`): The name of the child.
+            start (:obj:`float`): The start time of the child.
+            end (:obj:`float`): The end time of the child.
+
+        Keyword Args:
+            **attributes (:obj:`~typing.Any`): Attributes for the child.
+
+        Returns:
+            :obj:`Span`: The child span.
+        """
+        child = self.child(name, **attributes)
+        child._start = start
+        child._end = end
+        return child
+
+    def finish(self) -> None:
+        """Finishes the span, exporting the trace at the root."""
+        if self._end is not None:
+            return None
+
+        self._end = time.perf_counter()
+
+        if self._parent is None:
+            self._tracer._export(self)
+
+    def walk(self) -> typing.Generator[Span, None, None]:
+        """Iterates this span and all of its descendants.
+
+        Yields:
+            :obj:`Span`: Each span, parents before their children.
+        """
+        yield self
+
+        for child in self._children:
+            yield from child.walk()
+
+
+class TraceExporter(abc.ABC):
+    """Base class all trace exporters inherit from."""
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def export(self, root: Span) -> None:
+        """Exports a completed trace.
+
+        Args:
+            root (:obj:`Span`): The root span of the trace.
+        """
+
+    def close(self) -> None:
+        """Flushes and closes the exporter."""
+
+
+class InMemoryTraceExporter(TraceExporter):
+    """Keeps completed traces in memory, mostly useful in tests.
+
+    Keyword Args:
+        max_traces (:obj:`int`): The number of traces to keep, the
+            oldest are dropped first. Defaults to ``1000``.
+    """
+
+    __slots__ = ("_traces", "_max_traces")
+
+    def __init__(self, *, max_traces: int = 1000) -> None:
+        self._traces: list[Span] = []
+        self._max_traces = max_traces
+
+    @property
+    def traces(self) -> list[Span]:
+        """The root spans of the completed traces."""
+        return self._traces
+
+    def export(self, root: Span) -> None:
+        self._traces.append(root)
+
+        if len(self._traces) > self._max_traces:
+            del self._traces[0]
+
+
+class ChromeTraceExporter(TraceExporter):
+    """Writes completed traces to a file in the Chrome trace event
+    format, which can be opened offline in ``chrome://tracing`` or
+    `Perfetto <https://ui.perfetto.dev>`_.
+
+    Events are buffered and appended to the file, so it is valid JSON
+    once the exporter is closed. The bot closes its tracers exporter
+    when it stops. The viewers also accept files that were not closed.
+
+    Args:
+        path (:obj:`str` | :obj:`~pathlib.Path`): The file to write to.
+            It is overwritten.
+
+    Keyword Args:
+        flush_every (:obj:`int`): The number of traces to buffer before
+            writing them. Defaults to ``100``.
+    """
+
+    __slots__ = ("_path", "_flush_every", "_buffer", "_pending", "_file", "_written")
+
+    def __init__(self, path: str | Path, *, flush_every: int = 100) -> None:
+        self._path = Path(path)
+        self._flush_every = flush_every
+        self._buffer: list[str] = []
+        self._pending = 0
+        self._written = False
+        self._file: typing.TextIO | None = open(self._path, "w")
+        self._file.write("[\n")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self._path)!r})"
+
+    @property
+    def path(self) -> Path:
+        """The file the traces are written to."""
+        return self._path
+
+    def export(self, root: Span) -> None:
+        pid = os.getpid()
+
+        for s in root.walk():
+            event = {
+                "name": s.name,
+                "cat": "yami",
+                "ph": "X",
+                "ts": s.start * 1_000_000,
+                "dur": s.duration * 1_000_000,
+                "pid": pid,
+                "tid": s._tid,
+                "args": {k: str(v) for k, v in s.attributes.items()},
+            }
+            self._buffer.append(json.dumps(event))
+
+        self._pending += 1
+
+        if self._pending >= self._flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes any buffered events to the file."""
+        if self._file is None or not self._buffer:
+            return None
+
+        sep = ",\n" if self._written else ""
+        self._file.write(sep + ",\n".join(self._buffer))
+        self._file.flush()
+        self._buffer.clear()
+        self._pending = 0
+        self._written = True
+
+    def close(self) -> None:
+        if self._file is None:
+            return None
+
+        self.flush()
+        self._file.write("\n]\n")
+        self._file.close()
+        self._file = None
+
+
+class Tracer:
+    """Traces command invocations, passed to :obj:`~yami.Bot` with the
+    ``tracer`` kwarg.
+
+    Each invocation is a trace, with a span for resolution, checks
+    (and each check), conversion and the callback. REST calls made
+    while a span is active are recorded as its children.
+
+    Args:
+        exporter (:obj:`TraceExporter`): Where completed traces go.
+
+    Keyword Args:
+        sample_rate (:obj:`float`): The fraction of invocations to
+            trace, between ``0`` and ``1``. Defaults to ``1.0``.
+    """
+
+    __slots__ = ("_exporter", "_sample_rate")
+
+    def __init__(self, exporter: TraceExporter, *, sample_rate: float = 1.0) -> None:
+        self._exporter = exporter
+        self._sample_rate = sample_rate
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._exporter!r}, sample_rate={self._sample_rate})"
+
+    @property
+    def exporter(self) -> TraceExporter:
+        """The exporter completed traces are sent to."""
+        return self._exporter
+
+    @property
+    def sample_rate(self) -> float:
+        """The fraction of invocations that are traced."""
+        return self._sample_rate
+
+    def start(
+        self, name: str, *, start: float | None = None, **attributes: typing.Any
+    ) -> Span | None:
+        """Starts a new trace, subject to sampling.
+
+        Args:
+            name (:obj:`str`): The name of the root span.
+
+        Keyword Args:
+            start (:obj:`float` | :obj:`None`): The start time from
+                :obj:`time.perf_counter`. Defaults to now.
+            **attributes (:obj:`~typing.Any`): Attributes for the root.
+
+        Returns:
+            :obj:`Span` | :obj:`None`: The root span, or :obj:`None` if
+            this trace was not sampled.
+        """
+        if self._sample_rate < 1.0 and random.random() >= self._sample_rate:
+            return None
+
+        return Span(name, tracer=self, start=start, attributes=attributes)
+
+    def _export(self, root: Span) -> None:
+        self._exporter.export(root)
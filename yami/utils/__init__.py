@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
-__all__ = ["Shared", "SharedNone", "YamiNoneType"]
+__all__ = ["Shared", "SharedNone", "YamiNoneType", "SampledLogger"]
 
+from .logs import *
 from .types import *
@@ -0,0 +1,115 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import logging
+import typing
+
+__all__ = ["SampledLogger"]
+
+
+class SampledLogger:
+    """Logs only 1 in every N records, so per invocation logs can be
+    left enabled in production at a bounded cost.
+
+    Messages use lazy ``%`` formatting, and nothing is formatted or
+    counted when the level is disabled.
+
+    .. code-block:: python
+
+        log = yami.SampledLogger("my_bot.invocations", every=100)
+        log.debug("Invoked %s in %.2fms", name, elapsed * 1000)
+
+    Args:
+        logger (:obj:`logging.Logger` | :obj:`str`): The logger, or the
+            name of the logger to log to.
+
+    Keyword Args:
+        every (:obj:`int`): Log 1 in every this many records. Defaults
+            to ``1``, which logs every record.
+    """
+
+    __slots__ = ("_logger", "_every", "_seen")
+
+    def __init__(self, logger: logging.Logger | str, *, every: int = 1) -> None:
+        if every < 1:
+            raise ValueError("every must be at least 1")
+
+        self._logger = logging.getLogger(logger) if isinstance(logger, str) else logger
+        self._every = every
+        self._seen = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._logger.name!r}, every={self._every})"
+
+    @property
+    def logger(self) -> logging.Logger:
+        """The logger records are sent to."""
+        return self._logger
+
+    @property
+    def every(self) -> int:
+        """The sampling interval, 1 in every this many records are
+        logged.
+        """
+        return self._every
+
+    @property
+    def seen(self) -> int:
+        """The number of records seen while the level was enabled,
+        including the ones that were not logged.
+        """
+        return self._seen
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Whether or not the next record at this level would be logged.
+
+        Args:
+            level (:obj:`int`): The logging level.
+
+        Returns:
+            :obj:`bool`: :obj:`True` if it would be logged.
+        """
+        return self._seen % self._every == 0 and self._logger.isEnabledFor(level)
+
+    def log(self, level: int, msg: str, *args: typing.Any) -> None:
+        """Logs a record, if it is sampled.
+
+        Args:
+            level (:obj:`int`): The logging level.
+            msg (:obj:`str`): The ``%`` format string.
+            *args (:obj:`~typing.Any`): The format arguments.
+        """
+        self._emit(level, msg, args)
+
+    def debug(self, msg: str, *args: typing.Any) -> None:
+        """Logs a sampled record at the debug level."""
+        self._emit(logging.DEBUG, msg, args)
+
+    def info(self, msg: str, *args: typing.Any) -> None:
+        """Logs a sampled record at the info level."""
+        self._emit(logging.INFO, msg, args)
+
+    def _emit(self, level: int, msg: str, args: tuple[typing.Any, ...]) -> None:
+        if not self._logger.isEnabledFor(level):
+            return None
+
+        self._seen += 1
+
+        if (self._seen - 1) % self._every == 0:
+            # Attribute the record to the caller of log, debug or info.
+            self._logger.log(level, msg, *args, stacklevel=3)
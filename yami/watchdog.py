@@ -0,0 +1,294 @@
+# Yami - A command handler that complements Hikari.
+# Copyright (C) 2021-present Jonxslays
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module containing the event loop lag monitor and slow invocation
+watchdog.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import reprlib
+import sys
+import threading
+import time
+import traceback
+import typing
+
+from yami import metrics as metrics_
+
+if typing.TYPE_CHECKING:
+    from yami import commands, context
+
+__all__ = ["Watchdog"]
+
+_log = logging.getLogger(__name__)
+_repr = reprlib.Repr()
+_repr.maxstring = 80
+_repr.maxother = 80
+
+
+def _await_stack(coro: typing.Any) -> str:
+    """Formats the stack of a suspended coroutine, following the chain
+    of coroutines it is awaiting.
+    """
+    frames = []
+
+    while frame := getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None):
+        frames.append((frame, frame.f_lineno))
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+
+    return "".join(traceback.StackSummary.extract(frames).format())
+
+
+class Watchdog:
+    """Measures event loop lag continuously, and logs the stack of
+    invocations that run for too long, or that stall the loop.
+
+    The lag is recorded to :obj:`~yami.Metrics.loop_lag`. A thread
+    checks the loop is still ticking, so a callback that blocks the
+    loop (i.e. a synchronous HTTP request) is caught while it blocks.
+
+    Logs are rate limited per command, so a command that is always slow
+    cannot flood them.
+
+    .. code-block:: python
+
+        watchdog = yami.Watchdog(threshold=2.0)
+        bot = yami.Bot(token, "$", watchdog=watchdog)
+
+    Args:
+        threshold (:obj:`float`): The number of seconds a callback can
+            run, or the loop can stall, before it is reported. Defaults
+            to ``1.0``.
+
+    Keyword Args:
+        interval (:obj:`float`): How often to measure the loop lag, in
+            seconds. Defaults to ``0.1``.
+        log_interval (:obj:`float`): The minimum number of seconds
+            between reports for the same command. Defaults to ``60.0``.
+    """
+
+    __slots__ = (
+        "_threshold",
+        "_interval",
+        "_log_interval",
+        "_metrics",
+        "_task",
+        "_thread",
+        "_stopping",
+        "_last_tick",
+        "_reported_tick",
+        "_running",
+        "_logged",
+        "_suppressed",
+        "_lock",
+    )
+
+    def __init__(
+        self, threshold: float = 1.0, *, interval: float = 0.1, log_interval: float = 60.0
+    ) -> None:
+        self._threshold = threshold
+        self._interval = interval
+        self._log_interval = log_interval
+        self._metrics = metrics_.Metrics()
+        self._task: asyncio.Task[None] | None = None
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+        self._last_tick = 0.0
+        self._reported_tick = 0.0
+        self._running: dict[
+            asyncio.Task[typing.Any], tuple[context.MessageContext, commands.MessageCommand]
+        ] = {}
+        self._logged: dict[str, float] = {}
+        self._suppressed: dict[str, int] = {}
+        # Guards the above, which the stall thread also reads.
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(threshold={self._threshold})"
+
+    @property
+    def threshold(self) -> float:
+        """The number of seconds before an invocation or stall is
+        reported.
+        """
+        return self._threshold
+
+    @property
+    def interval(self) -> float:
+        """How often the loop lag is measured, in seconds."""
+        return self._interval
+
+    @property
+    def log_interval(self) -> float:
+        """The minimum number of seconds between reports for the same
+        command.
+        """
+        return self._log_interval
+
+    @property
+    def is_running(self) -> bool:
+        """Whether or not the watchdog is measuring the loop."""
+        return self._task is not None
+
+    def start(self, metrics: metrics_.Metrics | None = None) -> None:
+        """Starts measuring the running event loop. The bot calls this
+        on :obj:`~hikari.StartedEvent`.
+
+        Args:
+            metrics (:obj:`~yami.Metrics` | :obj:`None`): The metrics
+                to record to. Defaults to :obj:`None`, which records to
+                a private instance.
+        """
+        if self._task is not None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        self._metrics = metrics or self._metrics
+        self._last_tick = self._reported_tick = time.monotonic()
+        self._stopping.clear()
+        self._task = loop.create_task(self._measure())
+        self._thread = threading.Thread(
+            target=self._watch,
+            args=(loop, threading.get_ident()),
+            name="yami-watchdog",
+            daemon=True,
+        )
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Stops measuring the event loop. The bot calls this on
+        :obj:`~hikari.StoppingEvent`.
+        """
+        if self._task is None:
+            return None
+
+        self._task.cancel()
+        self._stopping.set()
+
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+        if self._thread:
+            await asyncio.get_running_loop().run_in_executor(None, self._thread.join)
+
+        self._task = self._thread = None
+
+    @contextlib.contextmanager
+    def watch(
+        self, ctx: context.MessageContext, command: commands.MessageCommand
+    ) -> typing.Generator[None, None, None]:
+        """Watches a command callback, reporting it if it runs for
+        longer than the threshold.
+
+        Args:
+            ctx (:obj:`~yami.MessageContext`): The invocation context.
+            command (:obj:`~yami.MessageCommand`): The command being
+                invoked.
+        """
+        task = asyncio.current_task()
+        loop = asyncio.get_running_loop()
+        handle = loop.call_later(self._threshold, self._on_slow, task, ctx, command)
+
+        if task:
+            with self._lock:
+                self._running[task] = (ctx, command)
+
+        try:
+            yield None
+        finally:
+            handle.cancel()
+
+            if task:
+                with self._lock:
+                    self._running.pop(task, None)
+
+    async def _measure(self) -> None:
+        loop = asyncio.get_running_loop()
+        lag = self._metrics.loop_lag
+
+        while True:
+            before = loop.time()
+            self._last_tick = time.monotonic()
+            await asyncio.sleep(self._interval)
+            lag.record(max(0.0, loop.time() - before - self._interval))
+
+    def _watch(self, loop: asyncio.AbstractEventLoop, thread_id: int) -> None:
+        """Runs in a thread, catching stalls while the loop blocks."""
+        while not self._stopping.wait(self._interval):
+            tick = self._last_tick
+            stalled = time.monotonic() - tick - self._interval
+
+            if stalled < self._threshold or tick == self._reported_tick:
+                continue
+
+            self._reported_tick = tick
+            self._metrics.stalls += 1
+
+            if not (frame := sys._current_frames().get(thread_id)):
+                continue
+
+            task = asyncio.current_task(loop)
+
+            with self._lock:
+                ctx, command = self._running.get(task, (None, None)) if task else (None, None)
+
+            self._report(
+                f"Event loop stalled for {stalled:.3f}s",
+                ctx,
+                command,
+                "".join(traceback.format_stack(frame)),
+            )
+
+    def _on_slow(
+        self,
+        task: asyncio.Task[typing.Any] | None,
+        ctx: context.MessageContext,
+        command: commands.MessageCommand,
+    ) -> None:
+        name = command.qualified_name
+        self._metrics.slow[name] = self._metrics.slow.get(name, 0) + 1
+        stack = _await_stack(task.get_coro()) if task else ""
+        self._report(f"Invocation exceeded {self._threshold:.3f}s", ctx, command, stack)
+
+    def _report(
+        self,
+        reason: str,
+        ctx: context.MessageContext | None,
+        command: commands.MessageCommand | None,
+        stack: str,
+    ) -> None:
+        key = command.qualified_name if command else ""
+        now = time.monotonic()
+
+        with self._lock:
+            if now - self._logged.get(key, -self._log_interval) < self._log_interval:
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return None
+
+            self._logged[key] = now
+            suppressed = self._suppressed.pop(key, 0)
+
+        if ctx and command:
+            args = ", ".join(f"{a.name}={_repr.repr(a.value)}" for a in ctx.args)
+            where = f"in command {key!r} (guild={ctx.guild_id}, args=[{args}])"
+        else:
+            where = "outside of a command"
+
+        extra = f", {suppressed} similar reports suppressed" if suppressed else ""
+        _log.warning("%s %s%s\n%s", reason, where, extra, stack)